@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List
 
 from langchain_core.documents import Document
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from content_marketing_agent.graph.content_state import ContentState
@@ -27,7 +27,10 @@ def _format_context(documents: Iterable[Document]) -> str:
     for idx, doc in enumerate(docs, 1):
         meta = doc.metadata or {}
         chat_id = meta.get("chat_id")
-        header = f"Document {idx}" + (f" (chat {chat_id})" if chat_id else "")
+        details = [f"chat {chat_id}"] if chat_id else []
+        if isinstance(meta.get("score"), (int, float)):
+            details.append(f"relevance {meta['score']:.2f}")
+        header = f"Document {idx}" + (f" ({', '.join(details)})" if details else "")
         snippets.append(f"{header}:\n{doc.page_content}")
     return "\n\n".join(snippets)
 
@@ -54,8 +57,7 @@ def _build_brand_voice(brand_voice: Dict[str, Any], fallback_brand: str) -> str:
     return " ".join(parts)
 
 
-def generate_blog(
-    llm: BaseChatModel,
+def _build_messages(
     topic: str,
     sections: list[str],
     documents: Iterable[Document],
@@ -63,9 +65,7 @@ def generate_blog(
     user_prompt: str,
     history: str = "",
     brand_voice: str = "",
-) -> Dict[str, Any]:
-    """Generate a blog post using vector-grounded context."""
-
+) -> List[BaseMessage]:
     brand_voice = brand_voice or f"Maintain a consistent professional yet friendly tone for {brand_name}. Prioritize clarity and value."
     context = _format_context(documents)
     sections = [sec for sec in sections if sec]
@@ -82,9 +82,10 @@ def generate_blog(
         ),
         HumanMessage(content="Draft the blog now."),
     ]
-    messages = [m for m in messages if m]
-    response = llm.invoke(messages)
-    content = response.content
+    return [m for m in messages if m]
+
+
+def _parse_blog(content: Any, topic: str, user_prompt: str) -> Dict[str, Any]:
     try:
         if isinstance(content, list):
             content = "".join(item if isinstance(item, str) else json.dumps(item) for item in content)
@@ -100,23 +101,68 @@ def generate_blog(
     return data
 
 
+def generate_blog(
+    llm: BaseChatModel,
+    topic: str,
+    sections: list[str],
+    documents: Iterable[Document],
+    brand_name: str,
+    user_prompt: str,
+    history: str = "",
+    brand_voice: str = "",
+) -> Dict[str, Any]:
+    """Generate a blog post using vector-grounded context."""
+    messages = _build_messages(topic, sections, documents, brand_name, user_prompt, history, brand_voice)
+    response = llm.invoke(messages)
+    return _parse_blog(response.content, topic, user_prompt)
+
+
+async def agenerate_blog(
+    llm: BaseChatModel,
+    topic: str,
+    sections: list[str],
+    documents: Iterable[Document],
+    brand_name: str,
+    user_prompt: str,
+    history: str = "",
+    brand_voice: str = "",
+) -> Dict[str, Any]:
+    """Async variant of :func:`generate_blog`."""
+    messages = _build_messages(topic, sections, documents, brand_name, user_prompt, history, brand_voice)
+    response = await llm.ainvoke(messages)
+    return _parse_blog(response.content, topic, user_prompt)
+
+
+def _node_inputs(state: ContentState) -> Dict[str, Any]:
+    """Collect generate_blog keyword arguments from graph state."""
+    brand_profile = state.get("brand_voice") or {}
+    brand_name = brand_profile.get("brand") or state.get("project_title") or "Brand"
+    return {
+        "topic": state.get("topic", ""),
+        "sections": state.get("sections") or [],
+        "documents": state.get("vector_documents") or [],
+        "brand_name": brand_name,
+        "user_prompt": state.get("prompt", ""),
+        "history": state.get("history", ""),
+        "brand_voice": _build_brand_voice(brand_profile, brand_name),
+    }
+
+
 def blog_agent_node(state: ContentState) -> ContentState:
     """Node wrapper around the blog generation agent."""
     try:
-        llm = get_chat_model()
-        brand_profile = state.get("brand_voice") or {}
-        brand_name = brand_profile.get("brand") or state.get("project_title") or "Brand"
-        brand_voice = _build_brand_voice(brand_profile, brand_name)
-        blog = generate_blog(
-            llm=llm,
-            topic=state.get("topic", ""),
-            sections=state.get("sections") or [],
-            documents=state.get("vector_documents") or [],
-            brand_name=brand_name,
-            user_prompt=state.get("prompt", ""),
-            history=state.get("history", ""),
-            brand_voice=brand_voice,
-        )
+        blog = generate_blog(llm=get_chat_model(), **_node_inputs(state))
+        logger.info("Blog agent completed for topic '%s'.", state.get("topic", ""))
+        return {"blog": blog}
+    except Exception as exc:
+        logger.exception("Blog agent failed: %s", exc)
+        return {"blog": {}}
+
+
+async def ablog_agent_node(state: ContentState) -> ContentState:
+    """Async node wrapper around the blog generation agent."""
+    try:
+        blog = await agenerate_blog(llm=get_chat_model(), **_node_inputs(state))
         logger.info("Blog agent completed for topic '%s'.", state.get("topic", ""))
         return {"blog": blog}
     except Exception as exc:
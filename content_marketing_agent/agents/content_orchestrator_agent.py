@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from content_marketing_agent.graph.content_state import ContentState
@@ -10,8 +11,8 @@ from content_marketing_agent.services import vector_service
 logger = logging.getLogger(__name__)
 
 
-def content_orchestrator_agent(state: ContentState) -> ContentState:
-    """Fetch vector context and propagate sanitized fields."""
+def _retrieval_query(state: ContentState) -> tuple[ContentState, str | None]:
+    """Return sanitized field updates and the vector query to run, if any."""
     topic = (state.get("topic") or "").strip() or (state.get("prompt", "").strip()[:80])
     sections = [sec for sec in (state.get("sections") or []) if sec]
     prompt = state.get("prompt", "")
@@ -20,11 +21,27 @@ def content_orchestrator_agent(state: ContentState) -> ContentState:
     updates: ContentState = {"sections": sections, "topic": topic}
 
     if topic and project_id and not state.get("vector_documents"):
-        query = " ".join([topic, " ".join(sections), prompt]).strip()
-        docs = vector_service.query_project_documents(project_id, query=query, k=8)
-        logger.info("Orchestrator: retrieved %s vector docs for topic '%s'", len(docs), topic)
-        updates["vector_documents"] = docs
-    elif not topic:
+        return updates, " ".join([topic, " ".join(sections), prompt]).strip()
+    if not topic:
         logger.info("Orchestrator: topic missing, deferring vector retrieval.")
+    return updates, None
 
+
+def content_orchestrator_agent(state: ContentState) -> ContentState:
+    """Fetch vector context and propagate sanitized fields."""
+    updates, query = _retrieval_query(state)
+    if query is not None:
+        docs = vector_service.retrieve_project_context(state["project_id"], query=query, k=8)
+        logger.info("Orchestrator: retrieved %s vector docs for topic '%s'", len(docs), updates["topic"])
+        updates["vector_documents"] = docs
+    return updates
+
+
+async def acontent_orchestrator_agent(state: ContentState) -> ContentState:
+    """Async variant of :func:`content_orchestrator_agent`; retrieval runs off the event loop."""
+    updates, query = _retrieval_query(state)
+    if query is not None:
+        docs = await asyncio.to_thread(vector_service.retrieve_project_context, state["project_id"], query=query, k=8)
+        logger.info("Orchestrator: retrieved %s vector docs for topic '%s'", len(docs), updates["topic"])
+        updates["vector_documents"] = docs
     return updates
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TypedDict
+from typing import Any, Optional, TypedDict
 
 from langchain_core.messages import HumanMessage
 
@@ -19,21 +19,44 @@ class GuardState(TypedDict, total=False):
     reason: str
 
 
-def guard_relevance(state: GuardState) -> GuardState:
-    """Check if the prompt is relevant to the research output."""
+def _guard_prompt(state: GuardState) -> Optional[str]:
+    """Build the guard prompt, or return None when there is nothing to check."""
     prompt = (state.get("prompt") or "").strip()
     research_output = (state.get("research_output") or "").strip()
     if not prompt or not research_output:
-        return {"allowed": True, "reason": ""}
+        return None
 
     guard_prompt = GUARD_PROMPT.format(research_output=research_output, prompt=prompt)
     print("\n\n Guard prompt below \n")
     print(guard_prompt);
-    llm = get_chat_model(model="gpt-4o-mini")
-    response = llm.invoke([HumanMessage(content=guard_prompt)])
-    content = getattr(response, "content", "")
+    return guard_prompt
+
+
+def _guard_decision(content: Any) -> GuardState:
     if isinstance(content, list):
         content = "".join(str(item) for item in content)
     decision = (content or "").strip().lower()
     allowed = "allow" in decision and "reject" not in decision
     return {"allowed": allowed, "reason": decision}
+
+
+def guard_relevance(state: GuardState) -> GuardState:
+    """Check if the prompt is relevant to the research output."""
+    guard_prompt = _guard_prompt(state)
+    if guard_prompt is None:
+        return {"allowed": True, "reason": ""}
+
+    llm = get_chat_model(model="gpt-4o-mini", cache=True)
+    response = llm.invoke([HumanMessage(content=guard_prompt)])
+    return _guard_decision(getattr(response, "content", ""))
+
+
+async def aguard_relevance(state: GuardState) -> GuardState:
+    """Async variant of :func:`guard_relevance`."""
+    guard_prompt = _guard_prompt(state)
+    if guard_prompt is None:
+        return {"allowed": True, "reason": ""}
+
+    llm = get_chat_model(model="gpt-4o-mini", cache=True)
+    response = await llm.ainvoke([HumanMessage(content=guard_prompt)])
+    return _guard_decision(getattr(response, "content", ""))
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import logging
 import os
-from typing import Any, Dict, List
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional
 
+import httpx
 import requests
-from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from content_marketing_agent.graph.content_state import ContentState
 from content_marketing_agent.prompts.image_prompt import BLOG_IMAGE_PROMPT
+from content_marketing_agent.utils.async_runner import get_async_http_client
 
 logger = logging.getLogger(__name__)
 PLACEHOLDER_IMAGE = (
@@ -23,6 +28,8 @@ PLACEHOLDER_IMAGE = (
 OPENAI_IMAGE_MODEL = os.getenv("OPENAI_IMAGE_MODEL", "gpt-image-1")
 OPENAI_IMAGE_SIZE = os.getenv("OPENAI_IMAGE_SIZE", "1024x1024")
 OPENAI_IMAGE_URL = "https://api.openai.com/v1/images/generations"
+IMAGE_MAX_CONCURRENCY = int(os.getenv("IMAGE_MAX_CONCURRENCY", "4"))
+IMAGE_TIMEOUT_SECONDS = float(os.getenv("IMAGE_TIMEOUT_SECONDS", "60"))
 
 
 def _parse_images_response(content: Any) -> List[Dict[str, Any]]:
@@ -37,16 +44,12 @@ def _parse_images_response(content: Any) -> List[Dict[str, Any]]:
         return []
 
 
-def _generate_image_data_uri(prompt: str) -> str:
-    """
-    Generate an image via the OpenAI Images API and return a data URI.
-
-    Falls back to a placeholder if generation fails.
-    """
+def _image_request(prompt: str) -> Optional[tuple[Dict[str, str], Dict[str, Any]]]:
+    """Return headers and payload for an image request, or None without an API key."""
     api_key = os.getenv("OPENAI_API_KEY", "").strip()
     if not api_key:
         logger.info("Image agent: OPENAI_API_KEY not set; using placeholder image.")
-        return PLACEHOLDER_IMAGE
+        return None
 
     headers = {
         "Authorization": f"Bearer {api_key}",
@@ -57,22 +60,40 @@ def _generate_image_data_uri(prompt: str) -> str:
         "prompt": prompt,
         "size": OPENAI_IMAGE_SIZE,
     }
+    return headers, payload
+
+
+def _extract_image_uri(payload: Any, prompt: str) -> str:
+    """Pull a data URI (or hosted URL) out of an Images API response body."""
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if isinstance(data, list) and data:
+        first = data[0]
+        if isinstance(first, dict):
+            b64 = first.get("b64_json")
+            if b64:
+                return f"data:image/png;base64,{b64}"
+            url = first.get("url")
+            if url:
+                return url
+    logger.warning("OpenAI image response missing b64 data for prompt '%s'.", prompt)
+    return PLACEHOLDER_IMAGE
+
+
+def _generate_image_data_uri(prompt: str, timeout: float = IMAGE_TIMEOUT_SECONDS) -> str:
+    """
+    Generate an image via the OpenAI Images API and return a data URI.
+
+    Falls back to a placeholder if generation fails.
+    """
+    request = _image_request(prompt)
+    if request is None:
+        return PLACEHOLDER_IMAGE
+    headers, payload = request
 
     try:
-        response = requests.post(OPENAI_IMAGE_URL, headers=headers, json=payload, timeout=60)
+        response = requests.post(OPENAI_IMAGE_URL, headers=headers, json=payload, timeout=timeout)
         response.raise_for_status()
-        payload = response.json()
-        data = payload.get("data") if isinstance(payload, dict) else None
-        if isinstance(data, list) and data:
-            first = data[0]
-            if isinstance(first, dict):
-                b64 = first.get("b64_json")
-                if b64:
-                    return f"data:image/png;base64,{b64}"
-                url = first.get("url")
-                if url:
-                    return url
-        logger.warning("OpenAI image response missing b64 data for prompt '%s'.", prompt)
+        return _extract_image_uri(response.json(), prompt)
     except (ValueError, TypeError) as exc:
         logger.warning("Failed to parse OpenAI image response for prompt '%s': %s", prompt, exc)
     except requests.HTTPError as exc:
@@ -90,22 +111,113 @@ def _generate_image_data_uri(prompt: str) -> str:
     return PLACEHOLDER_IMAGE
 
 
-def generate_images_for_blog(
-    llm: BaseChatModel,
-    blog_markdown: str,
-    sections: List[str],
-    brand_name: str,
-    history: str = "",
-) -> List[Dict[str, Any]]:
+async def _agenerate_image_data_uri(client: httpx.AsyncClient, prompt: str, timeout: float = IMAGE_TIMEOUT_SECONDS) -> str:
+    """Async variant of :func:`_generate_image_data_uri` on a shared httpx client."""
+    request = _image_request(prompt)
+    if request is None:
+        return PLACEHOLDER_IMAGE
+    headers, payload = request
+
+    try:
+        response = await client.post(OPENAI_IMAGE_URL, headers=headers, json=payload, timeout=timeout)
+        response.raise_for_status()
+        return _extract_image_uri(response.json(), prompt)
+    except (ValueError, TypeError) as exc:
+        logger.warning("Failed to parse OpenAI image response for prompt '%s': %s", prompt, exc)
+    except httpx.HTTPStatusError as exc:
+        logger.warning(
+            "OpenAI image generation failed for prompt '%s' (status=%s): %s",
+            prompt,
+            exc.response.status_code,
+            exc.response.text,
+        )
+    except httpx.HTTPError as exc:
+        logger.warning("OpenAI image generation request error for prompt '%s': %s", prompt, exc)
+    except Exception as exc:
+        logger.warning("Unexpected error during OpenAI image generation for prompt '%s': %s", prompt, exc)
+
+    return PLACEHOLDER_IMAGE
+
+
+def generate_image_data_uris(
+    prompts: List[str],
+    max_concurrency: int = IMAGE_MAX_CONCURRENCY,
+    timeout: float = IMAGE_TIMEOUT_SECONDS,
+) -> List[str]:
     """
-    Generate multiple image concepts per blog section using a Gemini-backed chat model.
+    Generate images for several prompts concurrently, preserving prompt order.
 
-    Returns:
-        List of image dictionaries with prompt, caption, alt_text, and image_url.
+    At most ``max_concurrency`` requests run at once. Each image gets its own
+    ``timeout`` deadline measured from when its request starts; images that fail
+    or miss the deadline come back as the placeholder while finished ones are kept.
     """
-    if not blog_markdown:
+    if not prompts:
         return []
 
+    results = [PLACEHOLDER_IMAGE] * len(prompts)
+    started: Dict[int, float] = {}
+
+    def _run(idx: int, prompt: str) -> str:
+        started[idx] = time.monotonic()
+        return _generate_image_data_uri(prompt, timeout=timeout)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="image-gen")
+    try:
+        futures: Dict[Future, int] = {
+            executor.submit(_run, idx, prompt): idx for idx, prompt in enumerate(prompts)
+        }
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            deadlines = [started[futures[fut]] + timeout for fut in pending if futures[fut] in started]
+            wait_for = min(deadlines) - now if deadlines else timeout
+            done, pending = wait(pending, timeout=max(0.05, wait_for), return_when=FIRST_COMPLETED)
+            for fut in done:
+                idx = futures[fut]
+                try:
+                    results[idx] = fut.result()
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.warning("Image generation failed for prompt '%s': %s", prompts[idx], exc)
+
+            now = time.monotonic()
+            expired = {fut for fut in pending if futures[fut] in started and now - started[futures[fut]] >= timeout}
+            for fut in expired:
+                logger.warning("Image generation exceeded %ss for prompt '%s'; using placeholder.", timeout, prompts[futures[fut]])
+            pending -= expired
+    finally:
+        # Do not block on stragglers; their placeholders are already in place.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
+async def agenerate_image_data_uris(
+    prompts: List[str],
+    max_concurrency: int = IMAGE_MAX_CONCURRENCY,
+    timeout: float = IMAGE_TIMEOUT_SECONDS,
+) -> List[str]:
+    """
+    Async variant of :func:`generate_image_data_uris` bounded by a semaphore, on the event
+    loop's shared httpx client.
+    """
+    if not prompts:
+        return []
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    client = get_async_http_client()
+
+    async def _bounded(prompt: str) -> str:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(_agenerate_image_data_uri(client, prompt, timeout), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Image generation exceeded %ss for prompt '%s'; using placeholder.", timeout, prompt)
+                return PLACEHOLDER_IMAGE
+
+    return list(await asyncio.gather(*(_bounded(prompt) for prompt in prompts)))
+
+
+def _build_messages(blog_markdown: str, sections: List[str], brand_name: str, history: str = "") -> List[BaseMessage]:
     brand_voice = f"Professional, clear, and visually engaging tone for {brand_name}."
     section_text = "\n".join(f"- {sec}" for sec in sections if sec) or "General"
 
@@ -117,9 +229,10 @@ def generate_images_for_blog(
         ),
         HumanMessage(content="Return the JSON now."),
     ]
-    messages = [m for m in messages if m]
-    response = llm.invoke(messages)
-    content = response.content
+    return [m for m in messages if m]
+
+
+def _image_concepts(content: Any, sections: List[str]) -> List[Dict[str, Any]]:
     images = _parse_images_response(content)
 
     if not images:
@@ -133,17 +246,70 @@ def generate_images_for_blog(
             }
             for sec in (sections or ["Overview"])
         ]
+    return images
+
+
+def _pending_prompts(images: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], List[str]]:
+    missing = [img for img in images if not img.get("image_url")]
+    prompts = [img.get("prompt") or "Illustration inspired by the blog content." for img in missing]
+    return missing, prompts
+
 
+def _finalize_images(images: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     for img in images:
-        prompt_text = img.get("prompt") or "Illustration inspired by the blog content."
-        img["image_url"] = img.get("image_url") or _generate_image_data_uri(prompt_text)
         img["caption"] = img.get("caption") or img.get("prompt") or "Generated image"
         img["alt_text"] = img.get("alt_text") or "Generated illustration"
         img["section"] = img.get("section") or "General"
-
     return images
 
 
+def generate_images_for_blog(
+    llm: BaseChatModel,
+    blog_markdown: str,
+    sections: List[str],
+    brand_name: str,
+    history: str = "",
+) -> List[Dict[str, Any]]:
+    """
+    Generate multiple image concepts per blog section using a Gemini-backed chat model.
+
+    Returns:
+        List of image dictionaries with prompt, caption, alt_text, and image_url.
+    """
+    if not blog_markdown:
+        return []
+
+    response = llm.invoke(_build_messages(blog_markdown, sections, brand_name, history))
+    images = _image_concepts(response.content, sections)
+
+    missing, prompts = _pending_prompts(images)
+    for img, image_url in zip(missing, generate_image_data_uris(prompts)):
+        img["image_url"] = image_url
+
+    return _finalize_images(images)
+
+
+async def agenerate_images_for_blog(
+    llm: BaseChatModel,
+    blog_markdown: str,
+    sections: List[str],
+    brand_name: str,
+    history: str = "",
+) -> List[Dict[str, Any]]:
+    """Async variant of :func:`generate_images_for_blog`."""
+    if not blog_markdown:
+        return []
+
+    response = await llm.ainvoke(_build_messages(blog_markdown, sections, brand_name, history))
+    images = _image_concepts(response.content, sections)
+
+    missing, prompts = _pending_prompts(images)
+    for img, image_url in zip(missing, await agenerate_image_data_uris(prompts)):
+        img["image_url"] = image_url
+
+    return _finalize_images(images)
+
+
 def image_agent_node(state: ContentState) -> ContentState:
     """Generate image assets based on the produced blog content."""
     blog = state.get("blog") or {}
@@ -168,3 +334,29 @@ def image_agent_node(state: ContentState) -> ContentState:
     except Exception as exc:
         logger.exception("Image agent failed: %s", exc)
         return {"images": []}
+
+
+async def aimage_agent_node(state: ContentState) -> ContentState:
+    """Async variant of :func:`image_agent_node`."""
+    blog = state.get("blog") or {}
+    if not blog:
+        logger.info("Image agent skipped: no blog content present in state.")
+        return {}
+
+    try:
+        from content_marketing_agent.utils.llm_loader import get_chat_model
+
+        llm = get_chat_model(provider="gemini")
+        brand_name = state.get("project_title") or "Brand"
+        images = await agenerate_images_for_blog(
+            llm=llm,
+            blog_markdown=blog.get("blog_markdown", ""),
+            sections=state.get("sections") or [],
+            brand_name=brand_name,
+            history=state.get("history", ""),
+        )
+        logger.info("Image agent generated %s image assets.", len(images))
+        return {"images": images}
+    except Exception as exc:
+        logger.exception("Image agent failed: %s", exc)
+        return {"images": []}
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import List
+from typing import Any, List
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
@@ -15,13 +15,8 @@ from content_marketing_agent.utils.llm_loader import get_chat_model
 logger = logging.getLogger(__name__)
 
 
-def intent_agent(state: ContentState) -> ContentState:
-    """Detect whether the user wants LinkedIn, blog, or both."""
-    user_prompt = state.get("prompt", "")
-    llm = get_chat_model(model="gpt-4o-mini")
-    response = llm.invoke([SystemMessage(content=INTENT_PROMPT), HumanMessage(content=user_prompt)])
-
-    content = response.content
+def _parse_intents(content: Any) -> List[str]:
+    """Normalize the LLM response into the supported intent labels."""
     intents: List[str] = []
     try:
         if isinstance(content, list):
@@ -42,4 +37,20 @@ def intent_agent(state: ContentState) -> ContentState:
     if not normalized:
         normalized = ["LinkedIn", "blog"]
     logger.info("Intent agent decision: %s", normalized)
-    return {"intent": normalized}
+    return normalized
+
+
+def intent_agent(state: ContentState) -> ContentState:
+    """Detect whether the user wants LinkedIn, blog, or both."""
+    user_prompt = state.get("prompt", "")
+    llm = get_chat_model(model="gpt-4o-mini", cache=True)
+    response = llm.invoke([SystemMessage(content=INTENT_PROMPT), HumanMessage(content=user_prompt)])
+    return {"intent": _parse_intents(response.content)}
+
+
+async def aintent_agent(state: ContentState) -> ContentState:
+    """Async variant of :func:`intent_agent`."""
+    user_prompt = state.get("prompt", "")
+    llm = get_chat_model(model="gpt-4o-mini", cache=True)
+    response = await llm.ainvoke([SystemMessage(content=INTENT_PROMPT), HumanMessage(content=user_prompt)])
+    return {"intent": _parse_intents(response.content)}
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List
 
 from langchain_core.documents import Document
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from content_marketing_agent.graph.content_state import ContentState
@@ -27,7 +27,10 @@ def _format_context(documents: Iterable[Document]) -> str:
     for idx, doc in enumerate(docs, 1):
         meta = doc.metadata or {}
         chat_id = meta.get("chat_id")
-        header = f"Document {idx}" + (f" (chat {chat_id})" if chat_id else "")
+        details = [f"chat {chat_id}"] if chat_id else []
+        if isinstance(meta.get("score"), (int, float)):
+            details.append(f"relevance {meta['score']:.2f}")
+        header = f"Document {idx}" + (f" ({', '.join(details)})" if details else "")
         snippets.append(f"{header}:\n{doc.page_content}")
     return "\n\n".join(snippets)
 
@@ -54,16 +57,14 @@ def _build_brand_voice(brand_voice: Dict[str, Any], fallback_brand: str) -> str:
     return " ".join(parts)
 
 
-def generate_linkedin(
-    llm: BaseChatModel,
+def _build_messages(
     topic: str,
     sections: list[str],
     documents: Iterable[Document],
     user_prompt: str,
     history: str = "",
     brand_voice: str = "",
-) -> Dict[str, Any]:
-    """Create LinkedIn content from research documents."""
+) -> List[BaseMessage]:
     context = _format_context(documents)
     sections = [sec for sec in sections if sec]
     messages = [
@@ -79,9 +80,10 @@ def generate_linkedin(
         ),
         HumanMessage(content="Draft the LinkedIn post and optional carousel."),
     ]
-    messages = [m for m in messages if m]
-    response = llm.invoke(messages)
-    content = response.content
+    return [m for m in messages if m]
+
+
+def _parse_linkedin(content: Any) -> Dict[str, Any]:
     try:
         if isinstance(content, list):
             content = "".join(item if isinstance(item, str) else json.dumps(item) for item in content)
@@ -95,22 +97,65 @@ def generate_linkedin(
     return data
 
 
+def generate_linkedin(
+    llm: BaseChatModel,
+    topic: str,
+    sections: list[str],
+    documents: Iterable[Document],
+    user_prompt: str,
+    history: str = "",
+    brand_voice: str = "",
+) -> Dict[str, Any]:
+    """Create LinkedIn content from research documents."""
+    messages = _build_messages(topic, sections, documents, user_prompt, history, brand_voice)
+    response = llm.invoke(messages)
+    return _parse_linkedin(response.content)
+
+
+async def agenerate_linkedin(
+    llm: BaseChatModel,
+    topic: str,
+    sections: list[str],
+    documents: Iterable[Document],
+    user_prompt: str,
+    history: str = "",
+    brand_voice: str = "",
+) -> Dict[str, Any]:
+    """Async variant of :func:`generate_linkedin`."""
+    messages = _build_messages(topic, sections, documents, user_prompt, history, brand_voice)
+    response = await llm.ainvoke(messages)
+    return _parse_linkedin(response.content)
+
+
+def _node_inputs(state: ContentState) -> Dict[str, Any]:
+    """Collect generate_linkedin keyword arguments from graph state."""
+    brand_profile = state.get("brand_voice") or {}
+    fallback_brand = state.get("project_title") or "Brand"
+    return {
+        "topic": state.get("topic", ""),
+        "sections": state.get("sections") or [],
+        "documents": state.get("vector_documents") or [],
+        "user_prompt": state.get("prompt", ""),
+        "history": state.get("history", ""),
+        "brand_voice": _build_brand_voice(brand_profile, fallback_brand),
+    }
+
+
 def linkedin_agent_node(state: ContentState) -> ContentState:
     """Node wrapper around the LinkedIn generation agent."""
     try:
-        llm = get_chat_model()
-        brand_profile = state.get("brand_voice") or {}
-        fallback_brand = state.get("project_title") or "Brand"
-        brand_voice = _build_brand_voice(brand_profile, fallback_brand)
-        linkedin = generate_linkedin(
-            llm=llm,
-            topic=state.get("topic", ""),
-            sections=state.get("sections") or [],
-            documents=state.get("vector_documents") or [],
-            user_prompt=state.get("prompt", ""),
-            history=state.get("history", ""),
-            brand_voice=brand_voice,
-        )
+        linkedin = generate_linkedin(llm=get_chat_model(), **_node_inputs(state))
+        logger.info("LinkedIn agent completed for topic '%s'.", state.get("topic", ""))
+        return {"linkedin": linkedin}
+    except Exception as exc:
+        logger.exception("LinkedIn agent failed: %s", exc)
+        return {"linkedin": {}}
+
+
+async def alinkedin_agent_node(state: ContentState) -> ContentState:
+    """Async node wrapper around the LinkedIn generation agent."""
+    try:
+        linkedin = await agenerate_linkedin(llm=get_chat_model(), **_node_inputs(state))
         logger.info("LinkedIn agent completed for topic '%s'.", state.get("topic", ""))
         return {"linkedin": linkedin}
     except Exception as exc:
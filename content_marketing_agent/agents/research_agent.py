@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
 import json
 import os
-from typing import Dict, Any, TypedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, TypedDict
 
+import httpx
 import requests
 
 from content_marketing_agent.prompts.perplexity_prompt import PERPLEXITY_SYSTEM_PROMPT
+from content_marketing_agent.utils.async_runner import get_async_http_client
+from content_marketing_agent.utils.cache_store import CacheStore, get_cache_store
 
 
 class ResearchState(TypedDict, total=False):
@@ -23,18 +30,42 @@ class ResearchState(TypedDict, total=False):
     result: Dict[str, Any]
 
 
-def _call_perplexity(query: str, history: str = "", current_output: str = "", k: int = 5) -> Dict[str, Any]:
-    """Call Perplexity Sonar for grounded research with strict JSON output."""
+PERPLEXITY_URL = "https://api.perplexity.ai/chat/completions"
+PERPLEXITY_TIMEOUT_SECONDS = 60
+
+
+def _empty_analysis(summary: str = "") -> Dict[str, Any]:
+    return {
+        "summary": summary,
+        "keywords": [],
+        "insights": [],
+        "references": [],
+    }
 
-    api_key = os.getenv("PERPLEXITY_API_KEY")
-    if not api_key:
-        return {
-            "summary": "",
-            "keywords": [],
-            "insights": [],
-            "references": [],
-        }
 
+@lru_cache(maxsize=1)
+def _research_cache() -> Optional[CacheStore]:
+    """Cache of Perplexity analyses; freshness is ``RESEARCH_CACHE_TTL_SECONDS``."""
+    backend = os.getenv("RESEARCH_CACHE_BACKEND", os.getenv("CACHE_BACKEND", "file")).lower()
+    if backend == "off":
+        return None
+    return get_cache_store(
+        "research_cache",
+        ttl_seconds=float(os.getenv("RESEARCH_CACHE_TTL_SECONDS", "3600")),
+        max_entries=int(os.getenv("RESEARCH_CACHE_MAX_ENTRIES", "500")),
+        backend=backend,
+    )
+
+
+def _research_cache_key(query: str, history: str = "", current_output: str = "") -> str:
+    """Hash of the normalized query plus the exact output/history it updates."""
+    normalized_query = " ".join((query or "").lower().split())
+    material = json.dumps([normalized_query, current_output or "", history or ""])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _build_request(api_key: str, query: str, history: str = "", current_output: str = "") -> tuple[Dict[str, str], Dict[str, Any]]:
+    """Build Perplexity headers and payload for a research turn."""
     user_prompt = "Update the research output based on the user's latest prompt.\n"
     user_prompt += f"Latest prompt: {query}\n"
     if current_output:
@@ -57,31 +88,70 @@ def _call_perplexity(query: str, history: str = "", current_output: str = "", k:
         "temperature": 0.2,   # lower = more deterministic JSON
         "top_p": 0.9,
     }
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+    return headers, payload
 
-    resp = requests.post(
-        "https://api.perplexity.ai/chat/completions",
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        json=payload,
-        timeout=60,
-    )
-
-    resp.raise_for_status()
 
-    content = resp.json()["choices"][0]["message"]["content"]
+def _parse_response(data: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    """Return the analysis and whether it parsed as structured JSON (only those are cached)."""
+    content = data["choices"][0]["message"]["content"]
 
     try:
-        return json.loads(content)
+        analysis = json.loads(content)
     except json.JSONDecodeError:
-        # Hard fallback (should be rare if prompt is respected)
-        return {
-            "summary": content,
-            "keywords": [],
-            "insights": [],
-            "references": [],
-        }
+        analysis = None
+    if isinstance(analysis, dict):
+        return analysis, True
+    # Hard fallback (should be rare if prompt is respected)
+    return _empty_analysis(content), False
+
+
+def _call_perplexity(query: str, history: str = "", current_output: str = "", k: int = 5) -> Dict[str, Any]:
+    """Call Perplexity Sonar for grounded research with strict JSON output."""
+
+    api_key = os.getenv("PERPLEXITY_API_KEY")
+    if not api_key:
+        return _empty_analysis()
+
+    cache = _research_cache()
+    cache_key = _research_cache_key(query, history, current_output)
+    cached = cache.get(cache_key) if cache else None
+    if cached is not None:
+        return copy.deepcopy(cached)  # callers add fields; keep the cached entry intact
+
+    headers, payload = _build_request(api_key, query, history=history, current_output=current_output)
+    resp = requests.post(PERPLEXITY_URL, headers=headers, json=payload, timeout=PERPLEXITY_TIMEOUT_SECONDS)
+    resp.raise_for_status()
+    analysis, parsed = _parse_response(resp.json())
+    if cache and parsed:
+        cache.set(cache_key, copy.deepcopy(analysis))
+    return analysis
+
+
+async def _acall_perplexity(query: str, history: str = "", current_output: str = "", k: int = 5) -> Dict[str, Any]:
+    """Async variant of :func:`_call_perplexity` on the event loop's shared httpx client."""
+
+    api_key = os.getenv("PERPLEXITY_API_KEY")
+    if not api_key:
+        return _empty_analysis()
+
+    cache = _research_cache()
+    cache_key = _research_cache_key(query, history, current_output)
+    cached = await asyncio.to_thread(cache.get, cache_key) if cache else None
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    headers, payload = _build_request(api_key, query, history=history, current_output=current_output)
+    client = get_async_http_client()
+    resp = await client.post(PERPLEXITY_URL, headers=headers, json=payload, timeout=PERPLEXITY_TIMEOUT_SECONDS)
+    resp.raise_for_status()
+    analysis, parsed = _parse_response(resp.json())
+    if cache and parsed:
+        await asyncio.to_thread(cache.set, cache_key, copy.deepcopy(analysis))
+    return analysis
 
 
 def run_research(
@@ -106,12 +176,22 @@ def run_research(
         analysis = _call_perplexity(query, history=history, current_output=current_output, k=k)
     except requests.RequestException as exc:
         # Gracefully handle upstream errors and return a structured fallback
-        analysis = {
-            "summary": f"Perplexity API error: {exc}",
-            "keywords": [],
-            "insights": [],
-            "references": [],
-        }
+        analysis = _empty_analysis(f"Perplexity API error: {exc}")
+
+    return {"query": query, "analysis": analysis}
+
+
+async def arun_research(
+    query: str,
+    k: int = 5,
+    history: str = "",
+    current_output: str = "",
+) -> Dict[str, Any]:
+    """Async variant of :func:`run_research`."""
+    try:
+        analysis = await _acall_perplexity(query, history=history, current_output=current_output, k=k)
+    except httpx.HTTPError as exc:
+        analysis = _empty_analysis(f"Perplexity API error: {exc}")
 
     return {"query": query, "analysis": analysis}
 
@@ -123,3 +203,12 @@ def research_step(state: ResearchState) -> ResearchState:
     current_output = state.get("current_output", "")
     result = run_research(prompt, history=history, current_output=current_output)
     return {"result": result}
+
+
+async def aresearch_step(state: ResearchState) -> ResearchState:
+    """Async variant of :func:`research_step`."""
+    prompt = state.get("prompt", "")
+    history = state.get("history", "")
+    current_output = state.get("current_output", "")
+    result = await arun_research(prompt, history=history, current_output=current_output)
+    return {"result": result}
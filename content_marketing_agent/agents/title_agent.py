@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TypedDict
+from typing import Any, TypedDict
 
 from langchain_core.messages import HumanMessage
 
@@ -16,20 +16,36 @@ class TitleState(TypedDict, total=False):
     title: str
 
 
+def _title_prompt(summary: str) -> str:
+    return (
+        "Generate a concise, 3-6 word title for the following research summary. "
+        "Return only the title with no quotes.\n\nSummary:\n" + summary
+    )
+
+
+def _parse_title(content: Any) -> str:
+    if isinstance(content, list):
+        content = "".join(str(item) for item in content)
+    return (content or "").strip()
+
+
 def generate_title(state: TitleState) -> TitleState:
     """Generate a concise title from the research summary."""
     summary = (state.get("summary") or "").strip()
     if not summary:
         return {"title": ""}
 
-    prompt = (
-        "Generate a concise, 3-6 word title for the following research summary. "
-        "Return only the title with no quotes.\n\nSummary:\n" + summary
-    )
-    llm = get_chat_model(model="gpt-5-nano")
-    response = llm.invoke([HumanMessage(content=prompt)])
-    content = getattr(response, "content", "")
-    if isinstance(content, list):
-        content = "".join(str(item) for item in content)
-    title = (content or "").strip()
-    return {"title": title}
+    llm = get_chat_model(model="gpt-5-nano", cache=True)
+    response = llm.invoke([HumanMessage(content=_title_prompt(summary))])
+    return {"title": _parse_title(getattr(response, "content", ""))}
+
+
+async def agenerate_title(state: TitleState) -> TitleState:
+    """Async variant of :func:`generate_title`."""
+    summary = (state.get("summary") or "").strip()
+    if not summary:
+        return {"title": ""}
+
+    llm = get_chat_model(model="gpt-5-nano", cache=True)
+    response = await llm.ainvoke([HumanMessage(content=_title_prompt(summary))])
+    return {"title": _parse_title(getattr(response, "content", ""))}
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import List
+from typing import Any, List
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
@@ -15,13 +15,8 @@ from content_marketing_agent.utils.llm_loader import get_chat_model
 logger = logging.getLogger(__name__)
 
 
-def topic_and_sections_agent(state: ContentState) -> ContentState:
-    """Extract topic and sections directly from the user prompt."""
-    user_prompt = state.get("prompt", "")
-    llm = get_chat_model(model="gpt-4o-mini")
-    response = llm.invoke([SystemMessage(content=TOPIC_SECTIONS_PROMPT), HumanMessage(content=user_prompt)])
-
-    content = response.content
+def _parse_topic_sections(content: Any) -> ContentState:
+    """Parse the topic/sections JSON returned by the LLM."""
     topic = ""
     sections: List[str] = []
     try:
@@ -35,3 +30,19 @@ def topic_and_sections_agent(state: ContentState) -> ContentState:
 
     logger.info("Topic extraction result - topic: '%s', sections: %s", topic, sections)
     return {"topic": topic, "sections": sections}
+
+
+def topic_and_sections_agent(state: ContentState) -> ContentState:
+    """Extract topic and sections directly from the user prompt."""
+    user_prompt = state.get("prompt", "")
+    llm = get_chat_model(model="gpt-4o-mini", cache=True)
+    response = llm.invoke([SystemMessage(content=TOPIC_SECTIONS_PROMPT), HumanMessage(content=user_prompt)])
+    return _parse_topic_sections(response.content)
+
+
+async def atopic_and_sections_agent(state: ContentState) -> ContentState:
+    """Async variant of :func:`topic_and_sections_agent`."""
+    user_prompt = state.get("prompt", "")
+    llm = get_chat_model(model="gpt-4o-mini", cache=True)
+    response = await llm.ainvoke([SystemMessage(content=TOPIC_SECTIONS_PROMPT), HumanMessage(content=user_prompt)])
+    return _parse_topic_sections(response.content)
@@ -0,0 +1,190 @@
+"""Compare Pinecone REST and gRPC data-plane transports against a local stand-in server.
+
+Start Pinecone Local first (``docker-compose up -d pinecone``), then::
+
+    python -m content_marketing_agent.benchmarks.pinecone_transport --host http://localhost:5080
+
+Vectors are random unit vectors, so only transport and batching costs are measured (no
+embedding calls). Results are printed as JSON and optionally written to ``--output``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+from langchain_core.embeddings import FakeEmbeddings
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from content_marketing_agent.services.pinecone_store import PineconeDataPlaneStore  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+def _percentiles(samples_ms: List[float]) -> Dict[str, float]:
+    values = np.asarray(samples_ms, dtype=np.float64)
+    return {
+        "p50_ms": round(float(np.percentile(values, 50)), 3),
+        "p95_ms": round(float(np.percentile(values, 95)), 3),
+        "mean_ms": round(float(values.mean()), 3),
+    }
+
+
+def _random_vectors(count: int, dimension: int, seed: int) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((count, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _with_scheme(host: str, control_host: str) -> str:
+    if "://" in host:
+        return host
+    return ("http://" if control_host.startswith("http://") else "https://") + host
+
+
+def _index_handle(transport: str, args: argparse.Namespace) -> Any:
+    from pinecone import Pinecone
+
+    control = Pinecone(api_key=args.api_key, host=args.host)
+    index_host = control.describe_index(args.index).host
+    if transport == "rest":
+        return control.Index(host=_with_scheme(index_host, args.host), pool_threads=args.max_in_flight)
+
+    from pinecone.grpc import GRPCClientConfig, PineconeGRPC
+
+    client = PineconeGRPC(api_key=args.api_key, host=args.host)
+    return client.Index(host=index_host, grpc_config=GRPCClientConfig(secure=not args.host.startswith("http://")))
+
+
+def _ensure_index(args: argparse.Namespace) -> None:
+    from pinecone import Pinecone, ServerlessSpec
+
+    control = Pinecone(api_key=args.api_key, host=args.host)
+    if args.index not in set(control.list_indexes().names()):
+        control.create_index(
+            name=args.index,
+            dimension=args.dimension,
+            metric="cosine",
+            spec=ServerlessSpec(cloud="aws", region="us-east-1"),
+        )
+
+
+def _wait_for_count(index: Any, namespace: str, expected: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        stats = index.describe_index_stats()
+        namespaces = getattr(stats, "namespaces", None) or stats.get("namespaces", {})
+        summary = namespaces.get(namespace)
+        count = getattr(summary, "vector_count", None) if summary is not None else 0
+        if count is None and isinstance(summary, dict):
+            count = summary.get("vector_count", 0)
+        if (count or 0) >= expected:
+            return
+        time.sleep(0.2)
+    logger.warning("Namespace %s did not reach %s vectors within %ss", namespace, expected, timeout)
+
+
+def run_transport(transport: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """Upsert, query (sequential and concurrent) and delete through one transport."""
+    index = _index_handle(transport, args)
+    store = PineconeDataPlaneStore(
+        index=index,
+        embedding=FakeEmbeddings(size=args.dimension),
+        upsert_batch_size=args.batch_size,
+        max_in_flight=args.max_in_flight,
+    )
+    namespace = f"bench-{transport}"
+    vectors = _random_vectors(args.vectors, args.dimension, seed=7)
+    queries = _random_vectors(args.queries, args.dimension, seed=11)
+    ids = [f"bench-{idx}" for idx in range(args.vectors)]
+    metadatas = [{"text": f"document {idx}", "chat_id": f"chat-{idx % 50}"} for idx in range(args.vectors)]
+
+    started = time.perf_counter()
+    requests = store.upsert_vectors(ids, vectors.tolist(), metadatas, namespace=namespace)
+    upsert_seconds = time.perf_counter() - started
+    _wait_for_count(index, namespace, args.vectors)
+
+    latencies = []
+    for query in queries:
+        tick = time.perf_counter()
+        store.similarity_search_by_vector_with_score(query.tolist(), k=args.k, namespace=namespace)
+        latencies.append((time.perf_counter() - tick) * 1000)
+
+    def search(query: np.ndarray) -> Any:
+        return store.similarity_search_by_vector_with_score(query.tolist(), k=args.k, namespace=namespace)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(search, queries))
+    concurrent_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    store.delete(ids=ids, namespace=namespace)
+    delete_seconds = time.perf_counter() - started
+
+    return {
+        "transport": transport,
+        "upsert": {
+            "vectors": args.vectors,
+            "requests": requests,
+            "seconds": round(upsert_seconds, 3),
+            "vectors_per_second": round(args.vectors / upsert_seconds, 1),
+        },
+        "query": {"k": args.k, "count": args.queries, **_percentiles(latencies)},
+        "concurrent_query": {
+            "concurrency": args.concurrency,
+            "queries_per_second": round(args.queries / concurrent_seconds, 1),
+        },
+        "delete": {"ids": args.vectors, "seconds": round(delete_seconds, 3)},
+    }
+
+
+def _parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark Pinecone REST vs gRPC data-plane transports.")
+    parser.add_argument("--host", default="http://localhost:5080", help="Pinecone control-plane host.")
+    parser.add_argument("--api-key", default="pclocal")
+    parser.add_argument("--index", default="transport-benchmark")
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--vectors", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--transports", default="rest,grpc", help="Comma-separated subset of rest,grpc.")
+    parser.add_argument("--output", default=None, help="Optional path for the JSON report.")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+    args = _parse_args(argv)
+    _ensure_index(args)
+
+    results = []
+    for transport in [name.strip() for name in args.transports.split(",") if name.strip()]:
+        try:
+            results.append(run_transport(transport, args))
+        except ImportError as exc:
+            logger.warning("Skipping %s transport: %s", transport, exc)
+            results.append({"transport": transport, "skipped": str(exc)})
+
+    report = {"host": args.host, "index": args.index, "dimension": args.dimension, "results": results}
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
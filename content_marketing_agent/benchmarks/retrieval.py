@@ -0,0 +1,265 @@
+"""Offline retrieval benchmark over synthetic project corpora.
+
+Generates projects with research outputs, indexes them into the local vector backend and
+runs a query workload through ``vector_service.query_project_documents``::
+
+    python -m content_marketing_agent.benchmarks.retrieval --projects 4 --outputs 200 --output run.json
+
+No network, MongoDB or API keys are needed: repository calls are served from memory and
+texts are embedded with a deterministic hashing embedding (or ``StubEmbeddings``). The
+corpus and queries depend only on ``--seed``, so JSON reports from different runs (k,
+chunk size, retrieval mode, quantization, ...) are directly comparable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Package modules are imported in run_benchmark(), once main() has set the environment they read
+logger = logging.getLogger(__name__)
+
+_SYLLABLES = ["ka", "lo", "mi", "ren", "tu", "sa", "vex", "dor", "pli", "qua", "zen", "bri", "mo", "nex", "ta", "gul"]
+_FILLER = (
+    "teams report that adoption depends on onboarding pricing and integration effort while buyers compare "
+    "vendors on support reliability security reviews and total cost over the first year of rollout"
+).split()
+
+
+class HashingEmbeddings(Embeddings):
+    """Deterministic signed feature-hashing embedding: related texts share tokens, so they score higher."""
+
+    def __init__(self, dimension: int = 384) -> None:
+        self.dimension = dimension
+
+    def _embed(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for token in re.findall(r"[a-z0-9]+", text.lower()):
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dimension
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = float(np.linalg.norm(vector))
+        return (vector / norm if norm else vector).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+
+class InMemoryRepositories:
+    """Stand-ins for the MongoDB repository calls ``vector_service`` makes while indexing and querying."""
+
+    def __init__(self) -> None:
+        self.manifests: Dict[str, Dict[str, str]] = {}
+        self.versions: Dict[str, int] = {}
+        self.outputs: Dict[str, List[Dict[str, Any]]] = {}
+
+    def install(self) -> None:
+        from content_marketing_agent.data_access import project_repository, research_repository
+
+        research_repository.get_vector_manifest = lambda chat_id: dict(self.manifests.get(chat_id, {}))
+        research_repository.set_vector_manifest = self._set_manifest
+        research_repository.list_indexable_research_outputs = lambda project_id: list(
+            self.outputs.get(project_id, [])
+        )
+        project_repository.get_vector_version = lambda project_id: self.versions.get(project_id, 0)
+        project_repository.bump_vector_version = self._bump
+
+    def _set_manifest(self, chat_id: str, manifest: Dict[str, str]) -> bool:
+        self.manifests[chat_id] = dict(manifest)
+        return True
+
+    def _bump(self, project_id: str) -> int:
+        self.versions[project_id] = self.versions.get(project_id, 0) + 1
+        return self.versions[project_id]
+
+
+def _pseudo_word(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def build_corpus(
+    projects: int, outputs: int, paragraphs: int, seed: int
+) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str, str]]]:
+    """
+    Synthetic research outputs plus one ``(project_id, chat_id, query)`` per output.
+
+    Each project has a few topics; each output mixes its topic's terms with filler and
+    three signature terms of its own, which (with two topic terms) form its query.
+    """
+    rng = random.Random(seed)
+    docs: List[Dict[str, Any]] = []
+    queries: List[Tuple[str, str, str]] = []
+    for project_idx in range(projects):
+        project_id = f"bench-project-{project_idx}"
+        topics = [[_pseudo_word(rng) for _ in range(6)] for _ in range(max(2, outputs // 25))]
+        for output_idx in range(outputs):
+            chat_id = f"{project_id}-chat-{output_idx}"
+            topic = rng.choice(topics)
+            signature = [_pseudo_word(rng) + str(output_idx) for _ in range(3)]
+            body = []
+            for _ in range(paragraphs):
+                words = rng.sample(_FILLER, 12) + rng.sample(topic, 3) + rng.sample(signature, 2)
+                rng.shuffle(words)
+                body.append(" ".join(words).capitalize() + ".")
+            docs.append(
+                {
+                    "project_id": project_id,
+                    "chat_id": chat_id,
+                    "summary": body[0],
+                    "markdown": f"# Research {output_idx}\n\n" + "\n\n".join(body),
+                    "structured": {"summary": body[0], "keywords": signature + topic[:2], "insights": []},
+                }
+            )
+            queries.append((project_id, chat_id, " ".join(rng.sample(signature, 2) + rng.sample(topic, 2))))
+    return docs, queries
+
+
+def _percentiles(samples_ms: List[float]) -> Dict[str, float]:
+    values = np.asarray(samples_ms, dtype=np.float64)
+    return {
+        "p50_ms": round(float(np.percentile(values, 50)), 3),
+        "p95_ms": round(float(np.percentile(values, 95)), 3),
+        "mean_ms": round(float(values.mean()), 3),
+    }
+
+
+def _recall(results: List[Any], relevant: List[str], k: int) -> float:
+    found = sum(1 for doc in results[:k] if doc.id in relevant)
+    return found / max(1, min(k, len(relevant)))
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Index the synthetic corpus and run the query workload; return the JSON report."""
+    from content_marketing_agent.services import vector_service
+
+    repositories = InMemoryRepositories()
+    repositories.install()
+    embedding: Embeddings
+    if args.embedding == "stub":
+        from content_marketing_agent.utils.embedding_loader import StubEmbeddings
+
+        embedding = StubEmbeddings(dimension=args.dimension)
+    else:
+        embedding = HashingEmbeddings(dimension=args.dimension)
+    vector_service._embedding = lambda: embedding
+
+    docs, queries = build_corpus(args.projects, args.outputs, args.paragraphs, args.seed)
+    for doc in docs:
+        repositories.outputs.setdefault(doc["project_id"], []).append(doc)
+
+    started = time.perf_counter()
+    for start in range(0, len(docs), 64):
+        vector_service.index_research_outputs(docs[start : start + 64])
+    index_seconds = time.perf_counter() - started
+    chunk_ids = {chat_id: list(manifest) for chat_id, manifest in repositories.manifests.items()}
+    chunk_count = sum(len(ids) for ids in chunk_ids.values())
+
+    workload = queries * args.repeat
+    latencies, recalls, hits = [], [], 0
+    for project_id, chat_id, query in workload:
+        tick = time.perf_counter()
+        results = vector_service.query_project_documents(project_id, query, k=args.k)
+        latencies.append((time.perf_counter() - tick) * 1000)
+        recalls.append(_recall(results, chunk_ids.get(chat_id, []), args.k))
+        hits += any(doc.metadata.get("chat_id") == chat_id for doc in results[: args.k])
+
+    def run_query(item: Tuple[str, str, str]) -> Any:
+        return vector_service.query_project_documents(item[0], item[2], k=args.k)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(run_query, workload))
+    concurrent_seconds = time.perf_counter() - started
+
+    return {
+        "config": {
+            "projects": args.projects,
+            "outputs_per_project": args.outputs,
+            "paragraphs": args.paragraphs,
+            "seed": args.seed,
+            "k": args.k,
+            "embedding": args.embedding,
+            "dimension": args.dimension,
+            "retrieval_mode": vector_service.RETRIEVAL_MODE,
+            "quantization": vector_service.LOCAL_VECTOR_QUANTIZATION,
+            "chunk_size": int(os.getenv("VECTOR_CHUNK_SIZE", "1000")),
+            "chunk_overlap": int(os.getenv("VECTOR_CHUNK_OVERLAP", "150")),
+            "retrieval_cache": os.getenv("RETRIEVAL_CACHE_BACKEND"),
+        },
+        "index": {
+            "documents": len(docs),
+            "chunks": chunk_count,
+            "seconds": round(index_seconds, 3),
+            "chunks_per_second": round(chunk_count / index_seconds, 1) if index_seconds else None,
+        },
+        "query": {"count": len(workload), **_percentiles(latencies)},
+        "throughput": {
+            "concurrency": args.concurrency,
+            "queries_per_second": round(len(workload) / concurrent_seconds, 1),
+        },
+        "quality": {
+            "recall_at_k": round(float(np.mean(recalls)), 4),
+            "hit_rate_at_k": round(hits / len(workload), 4),
+        },
+    }
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark project retrieval on synthetic corpora (offline).")
+    parser.add_argument("--projects", type=int, default=4)
+    parser.add_argument("--outputs", type=int, default=100, help="Research outputs per project.")
+    parser.add_argument("--paragraphs", type=int, default=8, help="Paragraphs per research output.")
+    parser.add_argument("--k", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=1, help="Times each query is issued.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--embedding", choices=["hashing", "stub"], default="hashing")
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--cache", action="store_true", help="Keep the retrieval result cache enabled.")
+    parser.add_argument("--vector-dir", default=None, help="Local index directory (default: a temporary one).")
+    parser.add_argument("--output", default=None, help="Optional path for the JSON report.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+    args = _parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="retrieval-bench-") as scratch:
+        # Set before vector_service is imported so its module-level settings pick them up
+        os.environ["VECTOR_BACKEND"] = "local"
+        os.environ["LOCAL_VECTOR_DIR"] = args.vector_dir or scratch
+        os.environ["EMBEDDING_CACHE_BACKEND"] = "off"
+        os.environ["RETRIEVAL_CACHE_BACKEND"] = "memory" if args.cache else "off"
+        report = run_benchmark(args)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
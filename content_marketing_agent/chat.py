@@ -6,12 +6,14 @@ from typing import Any
 
 import streamlit as st
 
-from content_marketing_agent.graph.content_graph import build_research_graph, build_title_graph
-from content_marketing_agent.services import chat_service, vector_service
+from content_marketing_agent.graph.content_graph import build_async_research_graph, build_async_title_graph
+from content_marketing_agent.services import chat_service
 from content_marketing_agent.state import set_active_chat
+from content_marketing_agent.utils.async_runner import run_sync
 
 DEFAULT_RESEARCH_MESSAGE = "Research something with the chatbot to populate this section."
 CHAT_CONTAINER_HEIGHT = 400
+CHAT_PAGE_SIZE = 30  # messages loaded when a chat opens and per "Load older messages" click
 PROMPT_AREA_HEIGHT = 140
 FORM_PADDING_HEIGHT = 80  # Accounts for label, button, and spacing around the prompt area
 RESEARCH_CONTAINER_HEIGHT = CHAT_CONTAINER_HEIGHT + PROMPT_AREA_HEIGHT + FORM_PADDING_HEIGHT
@@ -19,14 +21,14 @@ RESEARCH_CONTAINER_HEIGHT = CHAT_CONTAINER_HEIGHT + PROMPT_AREA_HEIGHT + FORM_PA
 
 @st.cache_resource
 def _get_research_graph():
-    """Cache the compiled research graph."""
-    return build_research_graph()
+    """Cache the compiled (async) research graph."""
+    return build_async_research_graph()
 
 
 @st.cache_resource
 def _get_title_graph():
-    """Cache the compiled title generation graph."""
-    return build_title_graph()
+    """Cache the compiled (async) title generation graph."""
+    return build_async_title_graph()
 
 
 def _format_research_markdown(analysis: dict[str, Any]) -> str:
@@ -76,7 +78,7 @@ def _generate_title_from_summary(summary: str) -> str:
         return ""
     try:
         graph = _get_title_graph()
-        state = graph.invoke({"summary": text})
+        state = run_sync(graph.ainvoke({"summary": text}))
         title = state.get("title", "") if isinstance(state, dict) else ""
         title = (title or "").strip()
         if title:
@@ -89,20 +91,31 @@ def _generate_title_from_summary(summary: str) -> str:
     return fallback or "Untitled chat"
 
 
-def _maybe_set_title(chat_id: str, summary: str) -> None:
-    """Set an auto-generated title once, if not already set or edited by the user."""
-    chat = chat_service.get_chat(chat_id)
-    if not chat:
-        return
-    already_set = chat.get("title_generated")
-    existing_title = (chat.get("title") or "").strip()
-    if not already_set and not existing_title:
-        generated = _generate_title_from_summary(summary)
-        if generated:
-            chat_service.update_chat_title(chat_id, generated, generated=True)
-    else:
-        fallback_title = existing_title or "Untitled chat"
-        chat_service.update_chat_title(chat_id, fallback_title, generated=bool(already_set))
+def _message_window(chat_id: str) -> tuple[list[dict[str, Any]], bool]:
+    """
+    Return the loaded messages (oldest first) and whether older ones remain.
+
+    Opening a chat loads its newest page. Later reruns re-read only from the oldest loaded
+    message onward, so new messages show up without reloading the whole history.
+    """
+    window_key = f"chat_message_window_{chat_id}"
+    window = st.session_state.get(window_key)
+    if window and window.get("anchor"):
+        messages = chat_service.get_messages_since(chat_id, window["anchor"])
+        return messages, window["has_more"]
+    messages, has_more = chat_service.get_recent_messages(chat_id, CHAT_PAGE_SIZE)
+    anchor = chat_service.message_cursor(messages[0]) if messages else None
+    st.session_state[window_key] = {"anchor": anchor, "has_more": has_more}
+    return messages, has_more
+
+
+def _load_older_messages(chat_id: str) -> None:
+    """Extend the chat's message window by one page of older messages."""
+    window = st.session_state[f"chat_message_window_{chat_id}"]
+    older, has_more = chat_service.get_recent_messages(chat_id, CHAT_PAGE_SIZE, before=window["anchor"])
+    if older:
+        window["anchor"] = chat_service.message_cursor(older[0])
+    window["has_more"] = has_more
 
 
 def render_chat_detail(selected_chat: dict, project_id: str) -> None:
@@ -110,7 +123,7 @@ def render_chat_detail(selected_chat: dict, project_id: str) -> None:
     chat_id = selected_chat.get("id", "unknown")
     research_doc = chat_service.get_chat_research_output(chat_id, DEFAULT_RESEARCH_MESSAGE)
     research_markdown = research_doc.get("markdown", DEFAULT_RESEARCH_MESSAGE) or DEFAULT_RESEARCH_MESSAGE
-    messages = chat_service.get_chat_messages(chat_id)
+    messages, has_older_messages = _message_window(chat_id)
     input_key = f"project_chat_input_{chat_id}"
     reset_flag = f"{input_key}_reset"
 
@@ -132,6 +145,9 @@ def render_chat_detail(selected_chat: dict, project_id: str) -> None:
         st.subheader("Chat")
         chat_container = st.container(height=CHAT_CONTAINER_HEIGHT, border=True)
         with chat_container:
+            if has_older_messages and st.button("Load older messages", key=f"load_older_{chat_id}"):
+                _load_older_messages(chat_id)
+                st.rerun()
             for message in messages:
                 role = message.get("role", "").lower()
                 content = message.get("content", "")
@@ -167,13 +183,15 @@ def render_chat_detail(selected_chat: dict, project_id: str) -> None:
 
                     with st.spinner("Research agent is updating your output..."):
                         graph = _get_research_graph()
-                        state = graph.invoke(
-                            {
-                                "prompt": trimmed,
-                                "history": history_text,
-                                "current_output": current_output,
-                                "research_output": research_output_for_guard,
-                            }
+                        state = run_sync(
+                            graph.ainvoke(
+                                {
+                                    "prompt": trimmed,
+                                    "history": history_text,
+                                    "current_output": current_output,
+                                    "research_output": research_output_for_guard,
+                                }
+                            )
                         )
                     allowed = state.get("allowed", True) if isinstance(state, dict) else True
                     if not allowed:
@@ -189,21 +207,14 @@ def render_chat_detail(selected_chat: dict, project_id: str) -> None:
                     result = state.get("result", {}) if isinstance(state, dict) else {}
                     analysis = result.get("analysis", {})
                     research_markdown = _format_research_markdown(analysis)
-                    chat_service.save_research_output(
-                        project_id, chat_id, research_markdown, analysis, analysis.get("summary", "")
-                    )
-                    vector_service.upsert_research_output(
-                        project_id=project_id,
-                        chat_id=chat_id,
-                        summary=analysis.get("summary", ""),
-                        keywords=analysis.get("keywords") or (analysis.get("structured", {}) or {}).get("keywords", []),
-                        insights=analysis.get("insights") or (analysis.get("structured", {}) or {}).get("insights", []),
-                    )
-                    chat_service.add_message(
-                        project_id, chat_id, "assistant", "Research output updated. Let me know if you want to tweak anything else."
+                    chat_service.commit_research_turn(
+                        project_id,
+                        chat_id,
+                        research_markdown,
+                        analysis,
+                        "Research output updated. Let me know if you want to tweak anything else.",
+                        generate_title=_generate_title_from_summary,
                     )
-                    _maybe_set_title(chat_id, analysis.get("summary", ""))
-                    chat_service.update_chat_summary(chat_id, analysis.get("summary", ""))
                     st.session_state[reset_flag] = True
                     st.rerun()
 
@@ -0,0 +1,9 @@
+"""Async counterparts of the chat, message, project and research repositories.
+
+Each module mirrors the function surface of its sync namesake in ``data_access`` on
+PyMongo's ``AsyncMongoClient`` (same pool settings, indexes and read cache).
+"""
+
+from . import chat_repository, message_repository, project_repository, research_repository
+
+__all__ = ["chat_repository", "message_repository", "project_repository", "research_repository"]
@@ -0,0 +1,69 @@
+"""Async chat persistence helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from content_marketing_agent.data_access.chat_repository import _new_chat
+from content_marketing_agent.data_access.database import get_async_collection
+from content_marketing_agent.data_access.read_cache import cached_read, invalidate
+
+
+def _chats():
+    return get_async_collection("chats")
+
+
+def _chat_changed(chat_id: str) -> None:
+    invalidate("chat", chat_id)
+    invalidate("chats")
+
+
+async def create_chat(project_id: str) -> dict[str, Any]:
+    """Insert a chat belonging to a project."""
+    doc = _new_chat(project_id)
+    await _chats().insert_one(doc)
+    invalidate("chats", project_id)
+    return doc
+
+
+@cached_read("chat")
+async def get_chat(chat_id: str) -> Optional[dict[str, Any]]:
+    doc = await _chats().find_one({"_id": chat_id})
+    return dict(doc) if doc else None
+
+
+@cached_read("chats")
+async def list_chats(project_id: str) -> list[dict[str, Any]]:
+    """List chats for a project."""
+    cursor = _chats().find({"project_id": project_id}).sort("created_at", -1)
+    return [dict(doc) async for doc in cursor]
+
+
+async def delete_chat(chat_id: str) -> None:
+    await _chats().delete_one({"_id": chat_id})
+    _chat_changed(chat_id)
+
+
+async def update_chat_title(chat_id: str, title: str, generated: bool = False) -> None:
+    now = datetime.utcnow()
+    await _chats().update_one(
+        {"_id": chat_id}, {"$set": {"title": title, "title_generated": generated, "updated_at": now}}
+    )
+    _chat_changed(chat_id)
+
+
+async def update_chat_summary(chat_id: str, summary: str) -> None:
+    now = datetime.utcnow()
+    await _chats().update_one({"_id": chat_id}, {"$set": {"summary": summary, "updated_at": now}})
+    _chat_changed(chat_id)
+
+
+async def update_chat_fields(chat_id: str, fields: dict[str, Any]) -> None:
+    """Set several chat fields (e.g. title and summary together) in one write."""
+    await _chats().update_one({"_id": chat_id}, {"$set": {**fields, "updated_at": datetime.utcnow()}})
+    _chat_changed(chat_id)
+
+
+async def count_chats(project_id: str) -> int:
+    return await _chats().count_documents({"project_id": project_id})
@@ -0,0 +1,59 @@
+"""Async message persistence helpers."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from pymongo import ASCENDING, DESCENDING
+
+from content_marketing_agent.data_access.database import get_async_collection
+from content_marketing_agent.data_access import message_repository as sync_message_repository
+from content_marketing_agent.data_access.message_repository import MessageCursor, _beyond, _new_message
+
+
+def _messages():
+    return get_async_collection("messages")
+
+
+def message_cursor(message: dict[str, Any]) -> MessageCursor:
+    """Keyset position of a stored message (no I/O, so not a coroutine)."""
+    return sync_message_repository.message_cursor(message)
+
+
+async def add_message(project_id: str, chat_id: str, role: str, content: str) -> dict[str, Any]:
+    """Insert a message for a chat."""
+    doc = _new_message(project_id, chat_id, role, content)
+    await _messages().insert_one(doc)
+    return doc
+
+
+async def list_messages(chat_id: str, limit: Optional[int] = None) -> list[dict[str, Any]]:
+    """List messages for a chat ordered by time."""
+    cursor = _messages().find({"chat_id": chat_id}).sort([("created_at", ASCENDING), ("_id", ASCENDING)])
+    if limit:
+        cursor = cursor.limit(limit)
+    return [dict(doc) async for doc in cursor]
+
+
+async def list_recent_messages(
+    chat_id: str, limit: int, before: Optional[MessageCursor] = None
+) -> tuple[list[dict[str, Any]], bool]:
+    """Return up to ``limit`` of the newest messages older than ``before``, oldest first, and whether more remain."""
+    query: dict[str, Any] = {"chat_id": chat_id}
+    if before is not None:
+        query.update(_beyond(before, "$lt"))
+    cursor = _messages().find(query).sort([("created_at", DESCENDING), ("_id", DESCENDING)]).limit(limit + 1)
+    docs = [dict(doc) async for doc in cursor]
+    return list(reversed(docs[:limit])), len(docs) > limit
+
+
+async def list_messages_since(chat_id: str, since: MessageCursor) -> list[dict[str, Any]]:
+    """Messages at or after ``since``, oldest first."""
+    query = {"chat_id": chat_id, **_beyond(since, "$gt", inclusive=True)}
+    cursor = _messages().find(query).sort([("created_at", ASCENDING), ("_id", ASCENDING)])
+    return [dict(doc) async for doc in cursor]
+
+
+async def delete_messages_for_chat(chat_id: str) -> None:
+    """Remove all messages belonging to a chat."""
+    await _messages().delete_many({"chat_id": chat_id})
@@ -0,0 +1,63 @@
+"""Async project persistence helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from pymongo import ReturnDocument
+
+from content_marketing_agent.data_access.database import get_async_collection
+from content_marketing_agent.data_access.project_repository import _list_projects_pipeline, _new_project
+from content_marketing_agent.data_access.read_cache import cached_read, invalidate
+
+
+def _projects():
+    return get_async_collection("projects")
+
+
+async def create_project(title: str) -> dict[str, Any]:
+    """Insert a new project."""
+    doc = _new_project(title)
+    await _projects().insert_one(doc)
+    return doc
+
+
+async def list_projects(
+    limit: Optional[int] = None, before: Optional[Tuple[datetime, str]] = None
+) -> list[dict[str, Any]]:
+    """Return projects newest first with their ``chat_count``, one page at a time when ``limit`` is set."""
+    cursor = await _projects().aggregate(_list_projects_pipeline(limit, before))
+    return [dict(doc) async for doc in cursor]
+
+
+@cached_read("project")
+async def get_project(project_id: str) -> Optional[dict[str, Any]]:
+    """Fetch a project by id."""
+    doc = await _projects().find_one({"_id": project_id})
+    return dict(doc) if doc else None
+
+
+async def update_project_title(project_id: str, title: str) -> None:
+    """Update a project's title."""
+    now = datetime.utcnow()
+    await _projects().update_one({"_id": project_id}, {"$set": {"title": title, "updated_at": now}})
+    invalidate("project", project_id)
+
+
+async def get_vector_version(project_id: str) -> int:
+    """Return the project's vector data version (bumped on every research vector write)."""
+    doc = await _projects().find_one({"_id": project_id}, {"vector_version": 1})
+    return int((doc or {}).get("vector_version", 0))
+
+
+async def bump_vector_version(project_id: str) -> int:
+    """Increment and return the project's vector data version."""
+    doc = await _projects().find_one_and_update(
+        {"_id": project_id},
+        {"$inc": {"vector_version": 1}},
+        projection={"vector_version": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    invalidate("project", project_id)
+    return int((doc or {}).get("vector_version", 0))
@@ -0,0 +1,96 @@
+"""Async research output persistence helpers."""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Optional
+
+from pymongo import ASCENDING
+
+from content_marketing_agent.data_access.database import get_async_collection
+from content_marketing_agent.data_access.read_cache import cached_read, invalidate
+from content_marketing_agent.data_access.research_repository import (
+    _CONTENT_FIELDS,
+    _HAS_RESEARCH,
+    _INDEXABLE_FIELDS,
+    _research_document,
+)
+
+
+def _research_outputs():
+    return get_async_collection("research_outputs")
+
+
+async def upsert_research_output(
+    project_id: str, chat_id: str, markdown: str, structured: dict[str, Any], summary: str
+) -> dict[str, Any]:
+    """Create or replace a research output for a chat."""
+    doc = _research_document(project_id, chat_id, markdown, structured, summary)
+    await _research_outputs().update_one({"chat_id": chat_id}, {"$set": doc}, upsert=True)
+    invalidate("research_output", chat_id)
+    return doc
+
+
+@cached_read("research_output")
+async def get_research_output(chat_id: str) -> Optional[dict[str, Any]]:
+    doc = await _research_outputs().find_one({"chat_id": chat_id})
+    return dict(doc) if doc else None
+
+
+async def get_research_outputs(chat_ids: list[str]) -> list[dict[str, Any]]:
+    """Fetch several research outputs by chat id in one query."""
+    return [dict(doc) async for doc in _research_outputs().find({"chat_id": {"$in": list(chat_ids)}})]
+
+
+async def delete_research_output(chat_id: str) -> None:
+    await _research_outputs().delete_one({"chat_id": chat_id})
+    invalidate("research_output", chat_id)
+
+
+async def get_vector_manifest(chat_id: str) -> dict[str, str]:
+    """Return the chunk id -> content hash map from the last vector upsert."""
+    doc = await _research_outputs().find_one({"chat_id": chat_id}, {"vector_chunks": 1})
+    return dict((doc or {}).get("vector_chunks") or {})
+
+
+async def set_vector_manifest(chat_id: str, manifest: dict[str, str]) -> bool:
+    """Record which chunks (and content hashes) are indexed for a chat; False if its output is gone."""
+    result = await _research_outputs().update_one({"chat_id": chat_id}, {"$set": {"vector_chunks": manifest}})
+    invalidate("research_output", chat_id)
+    return result.matched_count > 0
+
+
+async def list_research_outputs(project_id: str) -> list[dict[str, Any]]:
+    """Return all research outputs for a project (only the fields content generation needs)."""
+    return [dict(doc) async for doc in _research_outputs().find({"project_id": project_id}, _CONTENT_FIELDS)]
+
+
+async def list_indexable_research_outputs(project_id: str) -> list[dict[str, Any]]:
+    """Return a project's research outputs with the fields needed to rebuild its search indexes."""
+    query = {"project_id": project_id, **_HAS_RESEARCH}
+    return [dict(doc) async for doc in _research_outputs().find(query, _INDEXABLE_FIELDS)]
+
+
+async def count_indexable_research_outputs(after_id: Any = None) -> int:
+    """Count research outputs with real research, optionally only those after ``after_id``."""
+    query = dict(_HAS_RESEARCH)
+    if after_id is not None:
+        query["_id"] = {"$gt": after_id}
+    return await _research_outputs().count_documents(query)
+
+
+async def iter_indexable_research_outputs(after_id: Any = None, batch_size: int = 100) -> AsyncIterator[dict[str, Any]]:
+    """Stream research outputs with real research in ``_id`` order, resumable from ``after_id``."""
+    query = dict(_HAS_RESEARCH)
+    if after_id is not None:
+        query["_id"] = {"$gt": after_id}
+    cursor = (
+        _research_outputs()
+        .find(query, {**_INDEXABLE_FIELDS, "vector_chunks": 1})
+        .sort("_id", ASCENDING)
+        .batch_size(batch_size)
+    )
+    try:
+        async for doc in cursor:
+            yield dict(doc)
+    finally:
+        await cursor.close()
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Dict
 
 from content_marketing_agent.data_access.database import get_collection
+from content_marketing_agent.data_access.read_cache import cached_read, invalidate
 
 _COLLECTION = "brand_voice"
 _DEFAULT_ID = "default"
@@ -15,6 +16,7 @@ def _collection():
     return get_collection(_COLLECTION)
 
 
+@cached_read("brand_voice")
 def get_brand_voice() -> Dict[str, str]:
     """Return the saved brand voice profile or empty defaults."""
     doc = _collection().find_one({"_id": _DEFAULT_ID})
@@ -43,5 +45,6 @@ def upsert_brand_voice(brand: str, tone: str, audience: str, guidelines: str) ->
         {"$set": payload, "$setOnInsert": {"created_at": now}},
         upsert=True,
     )
+    invalidate("brand_voice")
     payload.pop("updated_at", None)
     return payload
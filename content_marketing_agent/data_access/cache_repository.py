@@ -0,0 +1,56 @@
+"""Key/value cache entry persistence helpers (one collection per cache)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from pymongo import ASCENDING, ReturnDocument
+
+from content_marketing_agent.data_access.database import get_collection
+
+
+def _entries(collection: str):
+    return get_collection(collection)
+
+
+def get_entry(collection: str, key: str) -> Optional[dict[str, Any]]:
+    """Return a live cache entry and bump its access time, or None if missing/expired."""
+    now = datetime.utcnow()
+    doc = _entries(collection).find_one_and_update(
+        {"_id": key, "expires_at": {"$gt": now}},
+        {"$set": {"accessed_at": now}},
+        return_document=ReturnDocument.AFTER,
+    )
+    return dict(doc) if doc else None
+
+
+def put_entry(collection: str, key: str, value: str, expires_at: datetime) -> None:
+    """Create or replace a cache entry."""
+    now = datetime.utcnow()
+    _entries(collection).update_one(
+        {"_id": key},
+        {"$set": {"value": value, "expires_at": expires_at, "accessed_at": now}},
+        upsert=True,
+    )
+
+
+def delete_entry(collection: str, key: str) -> None:
+    _entries(collection).delete_one({"_id": key})
+
+
+def trim_entries(collection: str, max_entries: int) -> int:
+    """Evict least recently used entries beyond ``max_entries``; return how many were removed."""
+    entries = _entries(collection)
+    excess = entries.estimated_document_count() - max_entries
+    if excess <= 0:
+        return 0
+    cursor = entries.find({}, {"_id": 1}).sort("accessed_at", ASCENDING).limit(excess)
+    stale_ids = [doc["_id"] for doc in cursor]
+    if not stale_ids:
+        return 0
+    return entries.delete_many({"_id": {"$in": stale_ids}}).deleted_count
+
+
+def clear_entries(collection: str) -> None:
+    _entries(collection).delete_many({})
@@ -7,17 +7,17 @@ from typing import Any, Optional
 from uuid import uuid4
 
 from content_marketing_agent.data_access.database import get_collection
+from content_marketing_agent.data_access.read_cache import cached_read, invalidate
 
 
 def _chats():
     return get_collection("chats")
 
 
-def create_chat(project_id: str) -> dict[str, Any]:
-    """Insert a chat belonging to a project."""
+def _new_chat(project_id: str) -> dict[str, Any]:
     chat_id = uuid4().hex
     now = datetime.utcnow()
-    doc = {
+    return {
         "_id": chat_id,
         "id": chat_id,
         "project_id": project_id,
@@ -27,33 +27,56 @@ def create_chat(project_id: str) -> dict[str, Any]:
         "created_at": now,
         "updated_at": now,
     }
+
+
+def create_chat(project_id: str) -> dict[str, Any]:
+    """Insert a chat belonging to a project."""
+    doc = _new_chat(project_id)
     _chats().insert_one(doc)
+    invalidate("chats", project_id)
     return doc
 
 
+@cached_read("chat")
 def get_chat(chat_id: str) -> Optional[dict[str, Any]]:
     doc = _chats().find_one({"_id": chat_id})
     return dict(doc) if doc else None
 
 
+@cached_read("chats")
 def list_chats(project_id: str) -> list[dict[str, Any]]:
     """List chats for a project."""
     cursor = _chats().find({"project_id": project_id}).sort("created_at", -1)
     return [dict(doc) for doc in cursor]
 
 
+def _chat_changed(chat_id: str) -> None:
+    # Writes by chat id do not know the project, so every cached chat list is dropped
+    invalidate("chat", chat_id)
+    invalidate("chats")
+
+
 def delete_chat(chat_id: str) -> None:
     _chats().delete_one({"_id": chat_id})
+    _chat_changed(chat_id)
 
 
 def update_chat_title(chat_id: str, title: str, generated: bool = False) -> None:
     now = datetime.utcnow()
     _chats().update_one({"_id": chat_id}, {"$set": {"title": title, "title_generated": generated, "updated_at": now}})
+    _chat_changed(chat_id)
 
 
 def update_chat_summary(chat_id: str, summary: str) -> None:
     now = datetime.utcnow()
     _chats().update_one({"_id": chat_id}, {"$set": {"summary": summary, "updated_at": now}})
+    _chat_changed(chat_id)
+
+
+def update_chat_fields(chat_id: str, fields: dict[str, Any]) -> None:
+    """Set several chat fields (e.g. title and summary together) in one write."""
+    _chats().update_one({"_id": chat_id}, {"$set": {**fields, "updated_at": datetime.utcnow()}})
+    _chat_changed(chat_id)
 
 
 def count_chats(project_id: str) -> int:
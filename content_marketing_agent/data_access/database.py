@@ -2,23 +2,101 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
+import weakref
 from functools import lru_cache
 from typing import Any
 
 from pymongo import ASCENDING, DESCENDING, MongoClient
 from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.errors import OperationFailure
+
+try:
+    from pymongo import AsyncMongoClient
+except Exception:  # pragma: no cover - optional dependency (pymongo >= 4.13)
+    AsyncMongoClient = None  # type: ignore
 
 DEFAULT_URI = "mongodb://localhost:27017"
 DEFAULT_DB = "content_blitz"
+# Collections used by utils.cache_store when a cache is backed by Mongo
+CACHE_COLLECTIONS = ("llm_cache", "research_cache", "embedding_cache", "retrieval_cache")
+
+# (collection, keys, options) for every index the app queries rely on; shared by the sync and async setup
+INDEXES: list[tuple[str, list[tuple[str, int]], dict[str, Any]]] = [
+    ("projects", [("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+    ("chats", [("project_id", ASCENDING), ("created_at", DESCENDING)], {}),
+    ("chats", [("project_id", ASCENDING), ("title_generated", ASCENDING)], {}),
+    # _id completes the (created_at, _id) keyset used to page through a chat's messages
+    ("messages", [("chat_id", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)], {}),
+    ("messages", [("project_id", ASCENDING), ("created_at", ASCENDING)], {}),
+    ("research_outputs", [("chat_id", ASCENDING)], {"unique": True}),
+    ("vector_queue", [("available_at", ASCENDING), ("enqueued_at", ASCENDING)], {}),
+    ("vector_queue", [("enqueued_at", ASCENDING)], {}),
+]
+for _name in CACHE_COLLECTIONS:
+    INDEXES.append((_name, [("expires_at", ASCENDING)], {"expireAfterSeconds": 0}))
+    INDEXES.append((_name, [("accessed_at", ASCENDING)], {}))
+
+# (collection, index name) of older indexes that are now a prefix of one above; they only add write cost
+SUPERSEDED_INDEXES: list[tuple[str, str]] = [
+    ("messages", "chat_id_1_created_at_1"),
+    ("projects", "created_at_-1"),
+]
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+
+def _client_options() -> dict[str, Any]:
+    """Connection pool settings shared by the sync and async clients."""
+    options: dict[str, Any] = {
+        "appname": "content-blitz",
+        "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", "100")),
+        "minPoolSize": int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+        "serverSelectionTimeoutMS": int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "30000")),
+    }
+    max_idle_ms = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "0"))
+    if max_idle_ms > 0:
+        options["maxIdleTimeMS"] = max_idle_ms
+    return options
 
 
 @lru_cache(maxsize=1)
 def get_mongo_client() -> MongoClient[Any]:
     """Return a cached MongoDB client."""
     uri = os.getenv("MONGO_URI", DEFAULT_URI)
-    return MongoClient(uri, appname="content-blitz")
+    return MongoClient(uri, **_client_options())
+
+
+def get_async_mongo_client() -> Any:
+    """
+    Return the async MongoDB client for the running event loop.
+
+    An ``AsyncMongoClient`` is bound to the loop it first runs on, so one is kept per loop;
+    the app's async paths all run on the shared loop from ``utils.async_runner``.
+    """
+    if AsyncMongoClient is None:
+        raise RuntimeError("The async data-access layer needs pymongo>=4.13 (AsyncMongoClient)")
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            client = AsyncMongoClient(os.getenv("MONGO_URI", DEFAULT_URI), **_client_options())
+            _async_clients[loop] = client
+        return client
+
+
+def get_async_database() -> Any:
+    """Return the configured application database on the async client."""
+    return get_async_mongo_client()[os.getenv("MONGO_DB_NAME", DEFAULT_DB)]
+
+
+def get_async_collection(name: str) -> Any:
+    """Return an async collection by name."""
+    return get_async_database()[name]
 
 
 def get_database() -> Database[Any]:
@@ -33,11 +111,24 @@ def get_collection(name: str) -> Collection[Any]:
 
 
 def ensure_indexes() -> None:
-    """Create indexes needed for app queries."""
+    """Create indexes needed for app queries and drop the ones they superseded."""
     db = get_database()
-    db.projects.create_index([("created_at", DESCENDING)])
-    db.chats.create_index([("project_id", ASCENDING), ("created_at", DESCENDING)])
-    db.chats.create_index([("project_id", ASCENDING), ("title_generated", ASCENDING)])
-    db.messages.create_index([("chat_id", ASCENDING), ("created_at", ASCENDING)])
-    db.messages.create_index([("project_id", ASCENDING), ("created_at", ASCENDING)])
-    db.research_outputs.create_index([("chat_id", ASCENDING)], unique=True)
+    for collection, keys, options in INDEXES:
+        db[collection].create_index(keys, **options)
+    for collection, name in SUPERSEDED_INDEXES:
+        try:
+            db[collection].drop_index(name)
+        except OperationFailure:
+            pass  # already dropped (or never created)
+
+
+async def ensure_indexes_async() -> None:
+    """Create (and prune) the same indexes as :func:`ensure_indexes` through the async client."""
+    db = get_async_database()
+    for collection, keys, options in INDEXES:
+        await db[collection].create_index(keys, **options)
+    for collection, name in SUPERSEDED_INDEXES:
+        try:
+            await db[collection].drop_index(name)
+        except OperationFailure:
+            pass
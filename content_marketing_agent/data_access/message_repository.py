@@ -3,21 +3,29 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 from uuid import uuid4
 
+from pymongo import ASCENDING, DESCENDING
+
 from content_marketing_agent.data_access.database import get_collection
 
+# Position of a message in a chat's timeline; _id breaks ties between equal timestamps.
+# Messages written by this app have uuid-hex string _ids. Range operators on _id only match
+# values of the same BSON type, so a message with an ObjectId _id (e.g. imported by hand)
+# that shares its created_at with a string-id message at a page boundary would be skipped;
+# sorting still orders mixed types consistently, and other pages are unaffected.
+MessageCursor = Tuple[datetime, str]
+
 
 def _messages():
     return get_collection("messages")
 
 
-def add_message(project_id: str, chat_id: str, role: str, content: str) -> dict[str, Any]:
-    """Insert a message for a chat."""
+def _new_message(project_id: str, chat_id: str, role: str, content: str) -> dict[str, Any]:
     message_id = uuid4().hex
     now = datetime.utcnow()
-    doc = {
+    return {
         "_id": message_id,
         "id": message_id,
         "project_id": project_id,
@@ -26,18 +34,60 @@ def add_message(project_id: str, chat_id: str, role: str, content: str) -> dict[
         "content": content,
         "created_at": now,
     }
+
+
+def add_message(project_id: str, chat_id: str, role: str, content: str) -> dict[str, Any]:
+    """Insert a message for a chat."""
+    doc = _new_message(project_id, chat_id, role, content)
     _messages().insert_one(doc)
     return doc
 
 
 def list_messages(chat_id: str, limit: Optional[int] = None) -> list[dict[str, Any]]:
     """List messages for a chat ordered by time."""
-    cursor = _messages().find({"chat_id": chat_id}).sort("created_at", 1)
+    cursor = _messages().find({"chat_id": chat_id}).sort([("created_at", ASCENDING), ("_id", ASCENDING)])
     if limit:
         cursor = cursor.limit(limit)
     return [dict(doc) for doc in cursor]
 
 
+def message_cursor(message: dict[str, Any]) -> MessageCursor:
+    """Keyset position of a stored message."""
+    return message["created_at"], message["_id"]
+
+
+def _beyond(cursor: MessageCursor, op: str, inclusive: bool = False) -> dict[str, Any]:
+    """Filter for messages past ``cursor`` in the direction of ``op`` ("$lt" or "$gt")."""
+    created_at, message_id = cursor
+    tie_op = f"{op}e" if inclusive else op
+    return {"$or": [{"created_at": {op: created_at}}, {"created_at": created_at, "_id": {tie_op: message_id}}]}
+
+
+def list_recent_messages(
+    chat_id: str, limit: int, before: Optional[MessageCursor] = None
+) -> tuple[list[dict[str, Any]], bool]:
+    """
+    Return up to ``limit`` of the newest messages older than ``before``, oldest first.
+
+    The second value tells whether older messages remain. Pages are read newest-first on
+    the ``(chat_id, created_at, _id)`` index, so each page costs ``limit`` index entries
+    however long the chat is.
+    """
+    query: dict[str, Any] = {"chat_id": chat_id}
+    if before is not None:
+        query.update(_beyond(before, "$lt"))
+    cursor = _messages().find(query).sort([("created_at", DESCENDING), ("_id", DESCENDING)]).limit(limit + 1)
+    docs = [dict(doc) for doc in cursor]
+    return list(reversed(docs[:limit])), len(docs) > limit
+
+
+def list_messages_since(chat_id: str, since: MessageCursor) -> list[dict[str, Any]]:
+    """Messages at or after ``since``, oldest first."""
+    query = {"chat_id": chat_id, **_beyond(since, "$gt", inclusive=True)}
+    cursor = _messages().find(query).sort([("created_at", ASCENDING), ("_id", ASCENDING)])
+    return [dict(doc) for doc in cursor]
+
+
 def delete_messages_for_chat(chat_id: str) -> None:
     """Remove all messages belonging to a chat."""
     _messages().delete_many({"chat_id": chat_id})
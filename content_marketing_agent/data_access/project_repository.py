@@ -3,37 +3,75 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 from uuid import uuid4
 
+from pymongo import ReturnDocument
+
 from content_marketing_agent.data_access.database import get_collection
+from content_marketing_agent.data_access.read_cache import cached_read, invalidate
 
 
 def _projects():
     return get_collection("projects")
 
 
-def create_project(title: str) -> dict[str, Any]:
-    """Insert a new project."""
+def _new_project(title: str) -> dict[str, Any]:
     project_id = uuid4().hex
     now = datetime.utcnow()
-    doc = {
+    return {
         "_id": project_id,
         "id": project_id,
         "title": title,
         "created_at": now,
         "updated_at": now,
     }
+
+
+def create_project(title: str) -> dict[str, Any]:
+    """Insert a new project."""
+    doc = _new_project(title)
     _projects().insert_one(doc)
     return doc
 
 
-def list_projects() -> list[dict[str, Any]]:
-    """Return all projects sorted by creation time."""
-    cursor = _projects().find().sort("created_at", -1)
-    return [dict(doc) for doc in cursor]
+def list_projects(limit: Optional[int] = None, before: Optional[Tuple[datetime, str]] = None) -> list[dict[str, Any]]:
+    """
+    Return projects newest first, each with its ``chat_count``, in one aggregation.
 
+    With ``limit`` one page is returned; pass the last project's ``(created_at, _id)`` as
+    ``before`` for the next. Chats are counted per project on the chats
+    ``(project_id, created_at)`` index inside the same round trip.
+    """
+    return [dict(doc) for doc in _projects().aggregate(_list_projects_pipeline(limit, before))]
 
+
+def _list_projects_pipeline(limit: Optional[int], before: Optional[Tuple[datetime, str]]) -> list[dict[str, Any]]:
+    pipeline: list[dict[str, Any]] = []
+    if before is not None:
+        created_at, project_id = before
+        older = [{"created_at": {"$lt": created_at}}, {"created_at": created_at, "_id": {"$lt": project_id}}]
+        pipeline.append({"$match": {"$or": older}})
+    pipeline.append({"$sort": {"created_at": -1, "_id": -1}})
+    if limit:
+        pipeline.append({"$limit": limit})
+    pipeline += [
+        {
+            "$lookup": {
+                "from": "chats",
+                "localField": "_id",
+                "foreignField": "project_id",
+                "pipeline": [{"$count": "n"}],
+                "as": "chat_stats",
+            }
+        },
+        {"$set": {"chat_count": {"$ifNull": [{"$arrayElemAt": ["$chat_stats.n", 0]}, 0]}}},
+        {"$unset": "chat_stats"},
+    ]
+    return pipeline
+
+
+@cached_read("project")
 def get_project(project_id: str) -> Optional[dict[str, Any]]:
     """Fetch a project by id."""
     doc = _projects().find_one({"_id": project_id})
@@ -44,3 +82,22 @@ def update_project_title(project_id: str, title: str) -> None:
     """Update a project's title."""
     now = datetime.utcnow()
     _projects().update_one({"_id": project_id}, {"$set": {"title": title, "updated_at": now}})
+    invalidate("project", project_id)
+
+
+def get_vector_version(project_id: str) -> int:
+    """Return the project's vector data version (bumped on every research vector write)."""
+    doc = _projects().find_one({"_id": project_id}, {"vector_version": 1})
+    return int((doc or {}).get("vector_version", 0))
+
+
+def bump_vector_version(project_id: str) -> int:
+    """Increment and return the project's vector data version."""
+    doc = _projects().find_one_and_update(
+        {"_id": project_id},
+        {"$inc": {"vector_version": 1}},
+        projection={"vector_version": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    invalidate("project", project_id)
+    return int((doc or {}).get("vector_version", 0))
@@ -0,0 +1,121 @@
+"""In-process read-through cache for repository lookups, invalidated by repository writes."""
+
+from __future__ import annotations
+
+import copy
+import functools
+import inspect
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from content_marketing_agent.utils.cache_store import CacheStore, get_cache_store
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Generations are part of every key: invalidating bumps one, so entries read before the
+# write (even ones stored after it by a slower reader) are never looked up again.
+_generations: Dict[Tuple[str, Any], int] = {}
+_generations_lock = threading.Lock()
+_key_generations = 0  # per-key entries in _generations, bounded by _max_key_generations()
+
+
+def _max_key_generations() -> int:
+    return 4 * int(os.getenv("REPOSITORY_CACHE_MAX_ENTRIES", "1024"))
+
+
+def _store() -> Optional[CacheStore]:
+    ttl_seconds = float(os.getenv("REPOSITORY_CACHE_TTL_SECONDS", "60"))
+    if ttl_seconds <= 0:
+        return None
+    return get_cache_store(
+        "repository_cache",
+        ttl_seconds=ttl_seconds,
+        max_entries=int(os.getenv("REPOSITORY_CACHE_MAX_ENTRIES", "1024")),
+        backend="memory",
+    )
+
+
+def _key(namespace: str, args: Tuple[Any, ...]) -> str:
+    with _generations_lock:
+        namespace_gen = _generations.get((namespace, None), 0)
+        key_gen = _generations.get((namespace, args), 0)
+    return f"{namespace}:{namespace_gen}:{key_gen}:{args!r}"
+
+
+def cached_read(namespace: str) -> Callable[[F], F]:
+    """
+    Cache a repository read by its positional arguments under ``namespace``
+    (calls with keyword arguments go straight to the database).
+
+    Results (including None) are kept for ``REPOSITORY_CACHE_TTL_SECONDS`` in a bounded LRU
+    (``REPOSITORY_CACHE_MAX_ENTRIES``) and callers get their own copy. Writers call
+    :func:`invalidate` with the same arguments, or for the whole namespace. Coroutine
+    functions are supported and share entries with the sync read of the same namespace.
+    """
+
+    def decorate(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                store = _store()
+                if store is None or kwargs:
+                    return await func(*args, **kwargs)
+                key = _key(namespace, args)
+                entry = store.get(key)
+                if entry is not None:
+                    return copy.deepcopy(entry["value"])
+                value = await func(*args)
+                store.set(key, {"value": copy.deepcopy(value)})
+                return value
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            store = _store()
+            if store is None or kwargs:
+                return func(*args, **kwargs)
+            key = _key(namespace, args)
+            entry = store.get(key)
+            if entry is not None:
+                return copy.deepcopy(entry["value"])
+            value = func(*args)
+            store.set(key, {"value": copy.deepcopy(value)})
+            return value
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def invalidate(namespace: str, *args: Any) -> None:
+    """
+    Drop the cached read for ``args``, or every read in ``namespace`` when none are given.
+
+    Per-key generations are capped: past the cap they are dropped and every namespace that
+    had one is invalidated as a whole, which costs some hits but keeps memory bounded.
+    """
+    global _key_generations
+    scope = args if args else None
+    with _generations_lock:
+        if scope is not None and (namespace, scope) not in _generations:
+            if _key_generations >= _max_key_generations():
+                namespaces = {name for name, key_args in _generations if key_args is not None}
+                for name in namespaces:
+                    _generations[(name, None)] = _generations.get((name, None), 0) + 1
+                for key in [key for key in _generations if key[1] is not None]:
+                    del _generations[key]
+                _key_generations = 0
+            _key_generations += 1
+        _generations[(namespace, scope)] = _generations.get((namespace, scope), 0) + 1
+
+
+def get_repository_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters and size of the repository cache."""
+    store = _store()
+    return store.stats() if store else {"backend": "off"}
@@ -0,0 +1,59 @@
+"""Checkpoint persistence for resumable vector reindex jobs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from content_marketing_agent.data_access.database import get_collection
+
+
+def _reindex_jobs():
+    return get_collection("reindex_jobs")
+
+
+def get_job(job_id: str) -> Optional[dict[str, Any]]:
+    doc = _reindex_jobs().find_one({"_id": job_id})
+    return dict(doc) if doc else None
+
+
+def start_job(job_id: str, target: dict[str, Any], total: int) -> dict[str, Any]:
+    """Create (or reset) a job with an empty checkpoint."""
+    now = datetime.utcnow()
+    doc = {
+        "target": target,
+        "status": "running",
+        "last_id": None,
+        "processed": 0,
+        "chunks": 0,
+        "total": total,
+        "started_at": now,
+        "updated_at": now,
+        "completed_at": None,
+    }
+    _reindex_jobs().replace_one({"_id": job_id}, doc, upsert=True)
+    return {"_id": job_id, **doc}
+
+
+def save_checkpoint(job_id: str, last_id: Any, processed: int, chunks: int) -> None:
+    """Record the last fully indexed research output and running counters."""
+    _reindex_jobs().update_one(
+        {"_id": job_id},
+        {
+            "$set": {
+                "last_id": last_id,
+                "processed": processed,
+                "chunks": chunks,
+                "status": "running",
+                "updated_at": datetime.utcnow(),
+            }
+        },
+    )
+
+
+def finish_job(job_id: str, status: str = "completed") -> None:
+    now = datetime.utcnow()
+    update: dict[str, Any] = {"status": status, "updated_at": now}
+    if status == "completed":
+        update["completed_at"] = now
+    _reindex_jobs().update_one({"_id": job_id}, {"$set": update})
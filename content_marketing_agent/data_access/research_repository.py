@@ -3,39 +3,73 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+
+from pymongo import ASCENDING
 
 from content_marketing_agent.data_access.database import get_collection
+from content_marketing_agent.data_access.read_cache import cached_read, invalidate
+
+# Chats that only hold the placeholder research message have an empty structured payload
+_HAS_RESEARCH = {"structured": {"$nin": [{}, None]}}
+_CONTENT_FIELDS = {"chat_id": 1, "project_id": 1, "summary": 1, "structured": 1}
+_INDEXABLE_FIELDS = {**_CONTENT_FIELDS, "markdown": 1}
 
 
 def _research_outputs():
     return get_collection("research_outputs")
 
 
-def upsert_research_output(
+def _research_document(
     project_id: str, chat_id: str, markdown: str, structured: dict[str, Any], summary: str
 ) -> dict[str, Any]:
-    """Create or replace a research output for a chat."""
-    now = datetime.utcnow()
-    doc = {
+    return {
         "project_id": project_id,
         "chat_id": chat_id,
         "markdown": markdown,
         "structured": structured,
         "summary": summary,
-        "updated_at": now,
+        "updated_at": datetime.utcnow(),
     }
+
+
+def upsert_research_output(
+    project_id: str, chat_id: str, markdown: str, structured: dict[str, Any], summary: str
+) -> dict[str, Any]:
+    """Create or replace a research output for a chat."""
+    doc = _research_document(project_id, chat_id, markdown, structured, summary)
     _research_outputs().update_one({"chat_id": chat_id}, {"$set": doc}, upsert=True)
+    invalidate("research_output", chat_id)
     return doc
 
 
+@cached_read("research_output")
 def get_research_output(chat_id: str) -> Optional[dict[str, Any]]:
     doc = _research_outputs().find_one({"chat_id": chat_id})
     return dict(doc) if doc else None
 
 
+def get_research_outputs(chat_ids: list[str]) -> list[dict[str, Any]]:
+    """Fetch several research outputs by chat id in one query."""
+    return [dict(doc) for doc in _research_outputs().find({"chat_id": {"$in": list(chat_ids)}})]
+
+
 def delete_research_output(chat_id: str) -> None:
     _research_outputs().delete_one({"chat_id": chat_id})
+    invalidate("research_output", chat_id)
+
+
+def get_vector_manifest(chat_id: str) -> dict[str, str]:
+    """Return the chunk id -> content hash map from the last vector upsert."""
+    doc = _research_outputs().find_one({"chat_id": chat_id}, {"vector_chunks": 1})
+    return dict((doc or {}).get("vector_chunks") or {})
+
+
+def set_vector_manifest(chat_id: str, manifest: dict[str, str]) -> bool:
+    """Record which chunks (and content hashes) are indexed for a chat; False if its output is gone."""
+    result = _research_outputs().update_one({"chat_id": chat_id}, {"$set": {"vector_chunks": manifest}})
+    invalidate("research_output", chat_id)
+    return result.matched_count > 0
 
 
 def list_research_outputs(project_id: str) -> list[dict[str, Any]]:
@@ -44,8 +78,42 @@ def list_research_outputs(project_id: str) -> list[dict[str, Any]]:
 
     Only pulls the fields needed for downstream content generation.
     """
-    cursor = _research_outputs().find(
-        {"project_id": project_id},
-        {"chat_id": 1, "project_id": 1, "summary": 1, "structured": 1},
-    )
+    cursor = _research_outputs().find({"project_id": project_id}, _CONTENT_FIELDS)
     return [dict(doc) for doc in cursor]
+
+
+def list_indexable_research_outputs(project_id: str) -> list[dict[str, Any]]:
+    """Return a project's research outputs with the fields needed to rebuild its search indexes."""
+    query = {"project_id": project_id, **_HAS_RESEARCH}
+    cursor = _research_outputs().find(query, _INDEXABLE_FIELDS)
+    return [dict(doc) for doc in cursor]
+
+
+def count_indexable_research_outputs(after_id: Any = None) -> int:
+    """Count research outputs with real research, optionally only those after ``after_id``."""
+    query = dict(_HAS_RESEARCH)
+    if after_id is not None:
+        query["_id"] = {"$gt": after_id}
+    return _research_outputs().count_documents(query)
+
+
+def iter_indexable_research_outputs(after_id: Any = None, batch_size: int = 100) -> Iterator[dict[str, Any]]:
+    """
+    Stream research outputs with real research in ``_id`` order.
+
+    Resuming from ``after_id`` makes the stream restartable from a checkpoint.
+    """
+    query = dict(_HAS_RESEARCH)
+    if after_id is not None:
+        query["_id"] = {"$gt": after_id}
+    cursor = (
+        _research_outputs()
+        .find(query, {**_INDEXABLE_FIELDS, "vector_chunks": 1})
+        .sort("_id", ASCENDING)
+        .batch_size(batch_size)
+    )
+    try:
+        for doc in cursor:
+            yield dict(doc)
+    finally:
+        cursor.close()
@@ -0,0 +1,97 @@
+"""Durable write-behind queue for vector index updates (one entry per chat)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from pymongo import ASCENDING, ReturnDocument
+
+from content_marketing_agent.data_access.database import get_collection
+
+
+def _queue():
+    return get_collection("vector_queue")
+
+
+def enqueue(chat_id: str, project_id: str, op: str, payload: Optional[dict[str, Any]] = None) -> None:
+    """
+    Queue an ``upsert`` or ``delete`` for a chat, replacing any pending operation for it.
+
+    Repeated writes coalesce into one entry; ``enqueued_at`` keeps the time of the oldest
+    unprocessed write so lag is measured from when the index first fell behind.
+    """
+    now = datetime.utcnow()
+    _queue().update_one(
+        {"_id": chat_id},
+        {
+            "$set": {
+                "project_id": project_id,
+                "op": op,
+                "payload": payload or {},
+                "updated_at": now,
+                "available_at": now,
+                "attempts": 0,
+                "last_error": None,
+            },
+            "$setOnInsert": {"enqueued_at": now, "claimed_until": None},
+            "$inc": {"revision": 1},
+        },
+        upsert=True,
+    )
+
+
+def claim(worker_id: str, limit: int, lease_seconds: float) -> list[dict[str, Any]]:
+    """Lease up to ``limit`` due entries, oldest first; expired leases are reclaimed."""
+    now = datetime.utcnow()
+    claimed: list[dict[str, Any]] = []
+    for _ in range(limit):
+        doc = _queue().find_one_and_update(
+            {
+                "available_at": {"$lte": now},
+                "$or": [{"claimed_until": None}, {"claimed_until": {"$lt": now}}],
+            },
+            {"$set": {"claimed_until": now + timedelta(seconds=lease_seconds), "claimed_by": worker_id}},
+            sort=[("enqueued_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+        if not doc:
+            break
+        claimed.append(dict(doc))
+    return claimed
+
+
+def ack(chat_id: str, revision: int) -> bool:
+    """
+    Remove a processed entry unless it was rewritten meanwhile.
+
+    A newer revision is released for the next pass instead; returns True when removed.
+    """
+    if _queue().delete_one({"_id": chat_id, "revision": revision}).deleted_count:
+        return True
+    _queue().update_one({"_id": chat_id}, {"$set": {"claimed_until": None}})
+    return False
+
+
+def fail(chat_id: str, revision: int, error: str, retry_at: datetime) -> None:
+    """Release a failed entry and schedule its retry (a newer revision is retried immediately)."""
+    _queue().update_one(
+        {"_id": chat_id, "revision": revision},
+        {
+            "$set": {"claimed_until": None, "available_at": retry_at, "last_error": error[:500]},
+            "$inc": {"attempts": 1},
+        },
+    )
+    _queue().update_one({"_id": chat_id, "revision": {"$ne": revision}}, {"$set": {"claimed_until": None}})
+
+
+def stats() -> dict[str, Any]:
+    """Queue depth, retrying entries and the age of the oldest pending write."""
+    queue = _queue()
+    oldest = queue.find_one({}, {"enqueued_at": 1}, sort=[("enqueued_at", ASCENDING)])
+    lag = (datetime.utcnow() - oldest["enqueued_at"]).total_seconds() if oldest else 0.0
+    return {
+        "depth": queue.count_documents({}),
+        "retrying": queue.count_documents({"attempts": {"$gt": 0}}),
+        "lag_seconds": round(max(lag, 0.0), 3),
+    }
@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import inspect
 import logging
-from typing import Any, Dict, List
+import os
+from typing import Any, Callable, Dict, List
 
 from langgraph.graph import END, StateGraph
 
-from content_marketing_agent.agents.blog_agent import blog_agent_node
-from content_marketing_agent.agents.content_orchestrator_agent import content_orchestrator_agent
-from content_marketing_agent.agents.image_agent import image_agent_node
-from content_marketing_agent.agents.intent_agent import intent_agent
-from content_marketing_agent.agents.linkedin_agent import linkedin_agent_node
-from content_marketing_agent.agents.topic_and_section_generator_agent import topic_and_section_generator_agent
-from content_marketing_agent.agents.topic_and_sections_agent import topic_and_sections_agent
-from content_marketing_agent.agents.guard_agent import guard_relevance
-from content_marketing_agent.agents.research_agent import ResearchState, research_step
-from content_marketing_agent.agents.title_agent import TitleState, generate_title
+from content_marketing_agent.agents.blog_agent import ablog_agent_node, blog_agent_node
+from content_marketing_agent.agents.content_orchestrator_agent import (
+    acontent_orchestrator_agent,
+    content_orchestrator_agent,
+)
+from content_marketing_agent.agents.image_agent import aimage_agent_node, image_agent_node
+from content_marketing_agent.agents.intent_agent import aintent_agent, intent_agent
+from content_marketing_agent.agents.linkedin_agent import alinkedin_agent_node, linkedin_agent_node
+from content_marketing_agent.agents.topic_and_section_generator_agent import (
+    atopic_and_section_generator_agent,
+    topic_and_section_generator_agent,
+)
+from content_marketing_agent.agents.topic_and_sections_agent import atopic_and_sections_agent, topic_and_sections_agent
+from content_marketing_agent.agents.guard_agent import aguard_relevance, guard_relevance
+from content_marketing_agent.agents.research_agent import ResearchState, aresearch_step, research_step
+from content_marketing_agent.agents.title_agent import TitleState, agenerate_title, generate_title
 from content_marketing_agent.graph.content_state import ContentState
 
 logger = logging.getLogger(__name__)
@@ -59,11 +67,98 @@ def _content_router(state: ContentState):
     return END
 
 
-def build_research_graph():
-    """Compile and return a runnable research graph with guard."""
+def _parallel_content_router(state: ContentState):
+    """Route to the prerequisites, then fan out to every content branch at once."""
+    if not state.get("intent"):
+        logger.info("Routing (parallel): no intent detected yet -> intent_agent")
+        return "intent_agent"
+
+    topic = (state.get("topic") or "").strip()
+    sections = state.get("sections") or []
+    attempted = state.get("topic_generation_attempted", False)
+    if (not topic or not sections) and not attempted:
+        logger.info("Routing (parallel): missing topic/sections -> topic_and_section_generator_agent")
+        return "topic_and_section_generator_agent"
+
+    logger.info("Routing (parallel): context ready -> blog_agent + linkedin_agent")
+    return ["blog_agent", "linkedin_agent"]
+
+
+def _intent_requested(state: ContentState, intent: str) -> bool:
+    intents = [value.lower() for value in state.get("intent") or []]
+    if intent not in intents:
+        logger.info("Parallel branch '%s' skipped: intent not requested.", intent)
+        return False
+    return True
+
+
+def _intent_gated(node: Callable[[ContentState], Any], intent: str) -> Callable[[ContentState], Any]:
+    """Wrap a (sync or async) content node so it no-ops when its intent was not requested.
+
+    Both branches always run in parallel mode so the merge step can join on them.
+    """
+    if inspect.iscoroutinefunction(node):
+
+        async def _agated(state: ContentState) -> ContentState:
+            if not _intent_requested(state, intent):
+                return {}
+            return await node(state)
+
+        return _agated
+
+    def _gated(state: ContentState) -> ContentState:
+        if not _intent_requested(state, intent):
+            return {}
+        return node(state)
+
+    return _gated
+
+
+def merge_content_results(state: ContentState) -> ContentState:
+    """Join the parallel branches and normalize the generated outputs."""
+    blog = state.get("blog") or {}
+    linkedin = state.get("linkedin") or {}
+    images = state.get("images") or []
+    logger.info(
+        "Merge: blog=%s linkedin=%s images=%s",
+        bool(blog),
+        bool(linkedin),
+        len(images),
+    )
+    return {"blog": blog, "linkedin": linkedin, "images": images}
+
+
+def _parallel_enabled() -> bool:
+    return os.getenv("CONTENT_GRAPH_PARALLEL", "1") == "1"
+
+
+def _content_nodes(use_async: bool) -> Dict[str, Callable[[ContentState], Any]]:
+    """Return the content graph node callables for the sync or async path."""
+    if use_async:
+        return {
+            "content_orchestrator_agent": acontent_orchestrator_agent,
+            "intent_agent": aintent_agent,
+            "topic_and_sections_agent": atopic_and_sections_agent,
+            "topic_and_section_generator_agent": atopic_and_section_generator_agent,
+            "blog_agent": ablog_agent_node,
+            "image_agent": aimage_agent_node,
+            "linkedin_agent": alinkedin_agent_node,
+        }
+    return {
+        "content_orchestrator_agent": content_orchestrator_agent,
+        "intent_agent": intent_agent,
+        "topic_and_sections_agent": topic_and_sections_agent,
+        "topic_and_section_generator_agent": topic_and_section_generator_agent,
+        "blog_agent": blog_agent_node,
+        "image_agent": image_agent_node,
+        "linkedin_agent": linkedin_agent_node,
+    }
+
+
+def _compile_research_graph(guard: Callable[..., Any], research: Callable[..., Any]):
     graph = StateGraph(ResearchState)
-    graph.add_node("guard", guard_relevance)
-    graph.add_node("research", research_step)
+    graph.add_node("guard", guard)
+    graph.add_node("research", research)
     graph.set_entry_point("guard")
     graph.add_conditional_edges(
         "guard",
@@ -74,25 +169,59 @@ def build_research_graph():
     return graph.compile()
 
 
-def build_title_graph():
-    """Compile and return a runnable title-generation graph."""
+def build_research_graph():
+    """Compile and return a runnable research graph with guard."""
+    return _compile_research_graph(guard_relevance, research_step)
+
+
+def build_async_research_graph():
+    """Compile the research graph with async nodes; run it with ``ainvoke``."""
+    return _compile_research_graph(aguard_relevance, aresearch_step)
+
+
+def _compile_title_graph(title: Callable[..., Any]):
     graph = StateGraph(TitleState)
-    graph.add_node("title", generate_title)
+    graph.add_node("title", title)
     graph.set_entry_point("title")
     graph.add_edge("title", END)
     return graph.compile()
 
 
-def build_content_graph():
-    """Compile the content generation graph with orchestrated agents."""
+def build_title_graph():
+    """Compile and return a runnable title-generation graph."""
+    return _compile_title_graph(generate_title)
+
+
+def build_async_title_graph():
+    """Compile the title graph with an async node; run it with ``ainvoke``."""
+    return _compile_title_graph(agenerate_title)
+
+
+def build_content_graph(parallel: bool | None = None):
+    """
+    Compile the content generation graph with orchestrated agents.
+
+    Args:
+        parallel: Run the blog and LinkedIn branches concurrently. Defaults to the
+            ``CONTENT_GRAPH_PARALLEL`` environment flag (enabled unless set to ``0``).
+    """
+    return _compile_content_graph(_content_nodes(use_async=False), parallel)
+
+
+def build_async_content_graph(parallel: bool | None = None):
+    """Compile the content graph with async agent nodes; run it with ``ainvoke``."""
+    return _compile_content_graph(_content_nodes(use_async=True), parallel)
+
+
+def _compile_content_graph(nodes: Dict[str, Callable[[ContentState], Any]], parallel: bool | None):
+    if parallel is None:
+        parallel = _parallel_enabled()
+    if parallel:
+        return _compile_parallel_content_graph(nodes)
+
     graph = StateGraph(ContentState)
-    graph.add_node("content_orchestrator_agent", content_orchestrator_agent)
-    graph.add_node("intent_agent", intent_agent)
-    graph.add_node("topic_and_sections_agent", topic_and_sections_agent)
-    graph.add_node("topic_and_section_generator_agent", topic_and_section_generator_agent)
-    graph.add_node("blog_agent", blog_agent_node)
-    graph.add_node("image_agent", image_agent_node)
-    graph.add_node("linkedin_agent", linkedin_agent_node)
+    for name, node in nodes.items():
+        graph.add_node(name, node)
 
     graph.set_entry_point("content_orchestrator_agent")
     graph.add_edge("intent_agent", "topic_and_sections_agent")
@@ -116,3 +245,43 @@ def build_content_graph():
     )
 
     return graph.compile()
+
+
+def _compile_parallel_content_graph(nodes: Dict[str, Callable[[ContentState], Any]]):
+    """
+    Compile the content graph with blog and LinkedIn generation fanned out.
+
+    Once intent, topic/sections and vector context are ready the blog and LinkedIn
+    branches start together; images start as soon as the blog finishes and the
+    merge step joins both branches.
+    """
+    graph = StateGraph(ContentState)
+    graph.add_node("content_orchestrator_agent", nodes["content_orchestrator_agent"])
+    graph.add_node("intent_agent", nodes["intent_agent"])
+    graph.add_node("topic_and_sections_agent", nodes["topic_and_sections_agent"])
+    graph.add_node("topic_and_section_generator_agent", nodes["topic_and_section_generator_agent"])
+    graph.add_node("blog_agent", _intent_gated(nodes["blog_agent"], "blog"))
+    graph.add_node("image_agent", nodes["image_agent"])
+    graph.add_node("linkedin_agent", _intent_gated(nodes["linkedin_agent"], "linkedin"))
+    graph.add_node("merge_content", merge_content_results)
+
+    graph.set_entry_point("content_orchestrator_agent")
+    graph.add_edge("intent_agent", "topic_and_sections_agent")
+    graph.add_edge("topic_and_sections_agent", "content_orchestrator_agent")
+    graph.add_edge("topic_and_section_generator_agent", "content_orchestrator_agent")
+    graph.add_edge("blog_agent", "image_agent")
+    graph.add_edge(["image_agent", "linkedin_agent"], "merge_content")
+    graph.add_edge("merge_content", END)
+
+    graph.add_conditional_edges(
+        "content_orchestrator_agent",
+        _parallel_content_router,
+        {
+            "intent_agent": "intent_agent",
+            "topic_and_section_generator_agent": "topic_and_section_generator_agent",
+            "blog_agent": "blog_agent",
+            "linkedin_agent": "linkedin_agent",
+        },
+    )
+
+    return graph.compile()
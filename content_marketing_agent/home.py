@@ -7,6 +7,8 @@ import streamlit as st
 from content_marketing_agent.services import brand_voice_service, project_service
 from content_marketing_agent.state import DEFAULT_PROJECT_TITLE, set_current_project
 
+PROJECTS_PER_PAGE = 15  # plus the "Create New Project" tile: four full rows of four
+
 
 def _render_create_tile() -> None:
     card = st.container(height=170, border=True)
@@ -52,10 +54,12 @@ def render_home() -> None:
             st.session_state["brand_voice"] = saved_profile
             st.success("Brand voice saved.")
 
-    projects = project_service.list_projects()
+    # Cursors of the pages visited so far; the last one is the page being shown
+    page_cursors = st.session_state.setdefault("home_project_cursors", [None])
+    projects, next_cursor = project_service.list_project_page(PROJECTS_PER_PAGE, before=page_cursors[-1])
     tiles: list[dict] = [{"type": "create"}] + [{"type": "project", "data": proj} for proj in projects]
 
-    if not projects:
+    if not projects and len(page_cursors) == 1:
         st.write("You don't have any projects yet. Create one to begin.")
 
     for row_start in range(0, len(tiles), 4):
@@ -70,3 +74,16 @@ def render_home() -> None:
                     _render_create_tile()
                 else:
                     _render_project_tile(tile["data"])
+
+    if len(page_cursors) > 1 or next_cursor is not None:
+        prev_col, page_col, next_col = st.columns([0.2, 0.6, 0.2])
+        with prev_col:
+            if st.button("< Newer", key="projects_prev", disabled=len(page_cursors) == 1, use_container_width=True):
+                page_cursors.pop()
+                st.rerun()
+        with page_col:
+            st.caption(f"Page {len(page_cursors)}")
+        with next_col:
+            if st.button("Older >", key="projects_next", disabled=next_cursor is None, use_container_width=True):
+                page_cursors.append(next_cursor)
+                st.rerun()
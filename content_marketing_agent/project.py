@@ -9,17 +9,18 @@ import streamlit as st
 
 from content_marketing_agent.agents.image_agent import PLACEHOLDER_IMAGE
 from content_marketing_agent.chat import DEFAULT_RESEARCH_MESSAGE, render_chat_detail
-from content_marketing_agent.graph.content_graph import build_content_graph
+from content_marketing_agent.graph.content_graph import build_async_content_graph
 from content_marketing_agent.services import chat_service, project_service, linkedin_service, brand_voice_service
 from content_marketing_agent.state import DEFAULT_PROJECT_TITLE, get_current_project, set_active_chat, set_current_project
+from content_marketing_agent.utils.async_runner import run_sync
 
 logger = logging.getLogger(__name__)
 
 
 @st.cache_resource
 def _get_content_graph():
-    """Cache the compiled content graph."""
-    return build_content_graph()
+    """Cache the compiled (async) content graph."""
+    return build_async_content_graph()
 
 
 def _render_header(project_id: str, project_title: str) -> None:
@@ -160,13 +161,15 @@ def render_project() -> None:
                         with st.spinner("Generating content from research outputs..."):
                             graph = _get_content_graph()
                             try:
-                                state = graph.invoke(
-                                    {
-                                        "project_id": project_id,
-                                        "project_title": project.get("title") or DEFAULT_PROJECT_TITLE,
-                                        "prompt": trimmed,
-                                        "brand_voice": brand_voice,
-                                    }
+                                state = run_sync(
+                                    graph.ainvoke(
+                                        {
+                                            "project_id": project_id,
+                                            "project_title": project.get("title") or DEFAULT_PROJECT_TITLE,
+                                            "prompt": trimmed,
+                                            "brand_voice": brand_voice,
+                                        }
+                                    )
                                 )
                             except Exception as exc:
                                 st.error(f"Content generation failed: {exc}")
@@ -0,0 +1,71 @@
+"""Command line entry point for rebuilding the vector store from MongoDB research outputs.
+
+Examples::
+
+    # Re-embed into a fresh Pinecone index after changing EMBEDDING_MODEL / EMBEDDING_DIM
+    python -m content_marketing_agent.reindex --job embed-v2 --index content-blitz-v2
+
+    # Restore the live namespaces after data loss (rerun the same command to resume)
+    python -m content_marketing_agent.reindex --job restore
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Rebuild project vectors from stored research outputs.")
+    parser.add_argument("--job", default="reindex", help="Job id used for the resumable checkpoint.")
+    parser.add_argument("--index", default=None, help="Target index (default: PINECONE_INDEX_NAME).")
+    parser.add_argument(
+        "--namespace-suffix",
+        default=None,
+        help="Suffix appended to project ids for the target namespaces (default: VECTOR_NAMESPACE_SUFFIX).",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent embed+upsert batches (REINDEX_WORKERS).")
+    parser.add_argument("--batch-size", type=int, default=None, help="Chunks per upsert (VECTOR_UPSERT_BATCH_SIZE).")
+    parser.add_argument("--window", type=int, default=200, help="Documents indexed between checkpoints.")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint for this job.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+    )
+    args = _parse_args(argv)
+
+    # Imported after load_dotenv so module-level settings see the .env values
+    from content_marketing_agent.services.bootstrap import bootstrap_storage
+    from content_marketing_agent.services.reindex_service import reindex_research_outputs
+
+    # Queued writes are left to the app's worker; only the indexes are needed here
+    bootstrap_storage(start_vector_worker=False)
+    stats = reindex_research_outputs(
+        job_id=args.job,
+        index_name=args.index,
+        namespace_suffix=args.namespace_suffix,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        window=max(1, args.window),
+        restart=args.restart,
+    )
+    print(json.dumps(stats, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
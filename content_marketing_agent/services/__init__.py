@@ -1,13 +1,22 @@
 """Service layer for the content marketing agent."""
 
-from content_marketing_agent.services.project_service import create_project, get_project, list_projects, update_project_title
+from content_marketing_agent.services.project_service import (
+    create_project,
+    get_project,
+    list_project_page,
+    list_projects,
+    update_project_title,
+)
 from content_marketing_agent.services.chat_service import (
     add_message,
     add_new_chat,
+    commit_research_turn,
     delete_chat,
     get_chat,
     get_chat_messages,
     get_chat_research_output,
+    get_messages_since,
+    get_recent_messages,
     list_chats,
     save_research_output,
     update_chat_summary,
@@ -15,6 +24,7 @@ from content_marketing_agent.services.chat_service import (
 )
 from content_marketing_agent.services.bootstrap import bootstrap_storage
 from . import vector_service as vector_service  # noqa: F401 - re-export for convenience
+from . import vector_queue_service as vector_queue_service  # noqa: F401 - re-export for convenience
 from . import linkedin_service as linkedin_service  # noqa: F401 - re-export for convenience
 from . import brand_voice_service as brand_voice_service  # noqa: F401 - re-export for convenience
 
@@ -5,9 +5,17 @@ from __future__ import annotations
 from functools import lru_cache
 
 from content_marketing_agent.data_access.database import ensure_indexes
+from content_marketing_agent.services.vector_queue_service import start_worker
 
 
 @lru_cache(maxsize=1)
-def bootstrap_storage() -> None:
-    """Ensure indexes exist once per process."""
+def bootstrap_storage(start_vector_worker: bool = True) -> None:
+    """
+    Ensure indexes exist and resume queued vector writes once per process.
+
+    Offline tools such as the reindex CLI pass ``start_vector_worker=False`` so they do
+    not compete with the app's write-behind worker for the same chats and leases.
+    """
     ensure_indexes()
+    if start_vector_worker:
+        start_worker()
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
 from content_marketing_agent.data_access import chat_repository, message_repository, research_repository
-from content_marketing_agent.services import vector_service
+from content_marketing_agent.data_access.message_repository import MessageCursor
+from content_marketing_agent.services import vector_queue_service
+
+logger = logging.getLogger(__name__)
 
 
 def list_chats(project_id: str) -> list[dict[str, Any]]:
@@ -33,8 +38,16 @@ def add_new_chat(project_id: str, default_research_message: str) -> Optional[dic
 def delete_chat(project_id: str, chat_id: str) -> None:
     chat_repository.delete_chat(chat_id)
     message_repository.delete_messages_for_chat(chat_id)
+    # Capture the chunk ids before the research output (which holds the manifest) is removed;
+    # an upsert still in flight removes its own chunks once it finds the output gone
+    chunk_ids = list(research_repository.get_vector_manifest(chat_id))
+    vector_queue_service.enqueue_research_delete(project_id, chat_id, chunk_ids)
     research_repository.delete_research_output(chat_id)
-    vector_service.delete_chat_vectors(project_id, chat_id)
+
+
+def _summary_snippet(summary: str) -> str:
+    trimmed = (summary or "").strip()
+    return trimmed.splitlines()[0][:120] if trimmed else ""
 
 
 def update_chat_title(chat_id: str, title: str, generated: bool = False) -> None:
@@ -43,11 +56,9 @@ def update_chat_title(chat_id: str, title: str, generated: bool = False) -> None
 
 
 def update_chat_summary(chat_id: str, summary: str) -> None:
-    trimmed = (summary or "").strip()
-    if not trimmed:
-        return
-    snippet = trimmed.splitlines()[0][:120]
-    chat_repository.update_chat_summary(chat_id, snippet)
+    snippet = _summary_snippet(summary)
+    if snippet:
+        chat_repository.update_chat_summary(chat_id, snippet)
 
 
 def add_message(project_id: str, chat_id: str, role: str, content: str) -> dict[str, Any]:
@@ -58,6 +69,22 @@ def get_chat_messages(chat_id: str) -> list[dict[str, Any]]:
     return message_repository.list_messages(chat_id)
 
 
+def get_recent_messages(
+    chat_id: str, limit: int, before: Optional[MessageCursor] = None
+) -> tuple[list[dict[str, Any]], bool]:
+    """A page of messages older than ``before`` (newest page by default) and whether more remain."""
+    return message_repository.list_recent_messages(chat_id, limit, before)
+
+
+def get_messages_since(chat_id: str, since: MessageCursor) -> list[dict[str, Any]]:
+    return message_repository.list_messages_since(chat_id, since)
+
+
+def message_cursor(message: dict[str, Any]) -> MessageCursor:
+    """Position of ``message`` to page from with ``get_recent_messages`` / ``get_messages_since``."""
+    return message_repository.message_cursor(message)
+
+
 def get_chat_research_output(chat_id: str, default_message: str) -> dict[str, Any]:
     existing = research_repository.get_research_output(chat_id)
     if existing:
@@ -69,3 +96,62 @@ def save_research_output(
     project_id: str, chat_id: str, markdown: str, structured: dict[str, Any], summary: str
 ) -> dict[str, Any]:
     return research_repository.upsert_research_output(project_id, chat_id, markdown, structured, summary)
+
+
+def _save_and_index(project_id: str, chat_id: str, markdown: str, analysis: dict[str, Any], summary: str) -> None:
+    # The vector write reads the stored output, so it is queued only once the save lands
+    research_repository.upsert_research_output(project_id, chat_id, markdown, analysis, summary)
+    vector_queue_service.enqueue_research_upsert(project_id, chat_id)
+
+
+def _title_fields(chat_id: str, summary: str, generate_title: Callable[[str], str]) -> dict[str, Any]:
+    chat = chat_repository.get_chat(chat_id)
+    if not chat:
+        return {}
+    existing_title = (chat.get("title") or "").strip()
+    if not chat.get("title_generated") and not existing_title:
+        generated = (generate_title(summary) or "").strip()
+        return {"title": generated, "title_generated": True} if generated else {}
+    if not existing_title:
+        return {"title": "Untitled chat"}
+    return {}
+
+
+def commit_research_turn(
+    project_id: str,
+    chat_id: str,
+    markdown: str,
+    analysis: dict[str, Any],
+    assistant_message: str,
+    generate_title: Callable[[str], str],
+) -> None:
+    """
+    Persist the outcome of a research turn.
+
+    The research output (followed by its vector upsert) and the assistant message are
+    written concurrently while ``generate_title`` runs, if the chat still needs a title.
+    Summary and title then go to the chat in a single update. A failed title is logged and
+    left for the next turn; every write still runs, and the first write error is re-raised
+    once all of them have finished.
+    """
+    summary = analysis.get("summary", "")
+    snippet = _summary_snippet(summary)
+    fields: dict[str, Any] = {"summary": snippet} if snippet else {}
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="research-commit") as executor:
+        saved = executor.submit(_save_and_index, project_id, chat_id, markdown, analysis, summary)
+        message = executor.submit(message_repository.add_message, project_id, chat_id, "assistant", assistant_message)
+
+        try:
+            fields.update(_title_fields(chat_id, summary, generate_title))
+        except Exception as exc:
+            logger.warning("Could not title chat %s: %s", chat_id, exc)
+        update_error: Optional[BaseException] = None
+        if fields:
+            try:
+                chat_repository.update_chat_fields(chat_id, fields)
+            except Exception as exc:
+                update_error = exc
+        errors = [saved.exception(), message.exception(), update_error]
+    first_error = next((error for error in errors if error is not None), None)
+    if first_error is not None:
+        raise first_error
@@ -0,0 +1,118 @@
+"""Select distinct, relevant retrieved chunks that fit a prompt token budget."""
+
+from __future__ import annotations
+
+import logging
+import os
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+try:
+    import tiktoken
+except Exception:  # pragma: no cover - optional dependency
+    tiktoken = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _token_counter() -> Callable[[str], int]:
+    if tiktoken is not None:
+        try:
+            encoding = tiktoken.get_encoding("cl100k_base")
+            return lambda text: len(encoding.encode(text, disallowed_special=()))
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.info("tiktoken encoding unavailable (%s); estimating tokens from length.", exc)
+    return lambda text: max(1, len(text) // 4)
+
+
+def count_tokens(text: str) -> int:
+    """Token count for prompt budgeting (cl100k_base, or ~4 characters per token)."""
+    return _token_counter()(text or "")
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def select_context(
+    query: str,
+    documents: List[Document],
+    embedding: Embeddings,
+    max_documents: Optional[int] = None,
+    min_score: Optional[float] = None,
+    mmr_lambda: Optional[float] = None,
+    token_budget: Optional[int] = None,
+    duplicate_similarity: Optional[float] = None,
+) -> List[Document]:
+    """
+    Prune retrieved chunks to the distinct, relevant ones that fit ``token_budget``.
+
+    Chunks are scored by cosine similarity to the query; those under ``min_score`` are
+    dropped, the rest are picked greedily by maximal marginal relevance (``mmr_lambda``
+    trades relevance against redundancy) and packed until the budget is spent. Chunks at
+    least ``duplicate_similarity`` similar to one already selected are discarded.
+    Selected documents carry their similarity as ``metadata["score"]``. Defaults come
+    from the ``CONTEXT_*`` environment variables.
+    """
+    if not documents:
+        return []
+    max_documents = max_documents or int(os.getenv("CONTEXT_MAX_DOCUMENTS", "8"))
+    min_score = float(os.getenv("CONTEXT_MIN_SCORE", "0.2")) if min_score is None else min_score
+    mmr_lambda = float(os.getenv("CONTEXT_MMR_LAMBDA", "0.7")) if mmr_lambda is None else mmr_lambda
+    token_budget = token_budget or int(os.getenv("CONTEXT_TOKEN_BUDGET", "2000"))
+    if duplicate_similarity is None:
+        duplicate_similarity = float(os.getenv("CONTEXT_DUPLICATE_SIMILARITY", "0.95"))
+
+    query_vector = np.asarray(embedding.embed_query(query), dtype=np.float32)
+    if not np.any(query_vector):
+        # Placeholder embeddings carry no signal; keep retrieval order and only enforce the budget
+        similarities = np.zeros(len(documents), dtype=np.float32)
+        doc_vectors = np.zeros((len(documents), 1), dtype=np.float32)
+        min_score = -1.0
+    else:
+        texts = [doc.page_content for doc in documents]
+        doc_vectors = _unit_rows(np.asarray(embedding.embed_documents(texts), dtype=np.float32))
+        similarities = doc_vectors @ _unit_rows(query_vector)
+
+    remaining = [idx for idx in range(len(documents)) if similarities[idx] >= min_score]
+    selected: List[int] = []
+    used_tokens = 0
+    while remaining and len(selected) < max_documents:
+        if selected:
+            redundancy = (doc_vectors[remaining] @ doc_vectors[selected].T).max(axis=1)
+            distinct = redundancy < duplicate_similarity
+            remaining = [idx for idx, keep in zip(remaining, distinct) if keep]
+            redundancy = redundancy[distinct]
+            if not remaining:
+                break
+        else:
+            redundancy = np.zeros(len(remaining), dtype=np.float32)
+        mmr = mmr_lambda * similarities[remaining] - (1.0 - mmr_lambda) * redundancy
+        best = remaining.pop(int(np.argmax(mmr)))
+        tokens = count_tokens(documents[best].page_content)
+        if used_tokens + tokens > token_budget:
+            continue  # a shorter, less relevant chunk may still fit
+        selected.append(best)
+        used_tokens += tokens
+
+    chosen = []
+    for idx in selected:
+        doc = documents[idx]
+        metadata = {**doc.metadata, "score": round(float(similarities[idx]), 4)}
+        chosen.append(Document(id=doc.id, page_content=doc.page_content, metadata=metadata))
+    logger.info(
+        "Context selection: kept %s of %s chunks (%s tokens, budget %s, min score %.2f)",
+        len(chosen),
+        len(documents),
+        used_tokens,
+        token_budget,
+        min_score,
+    )
+    return chosen
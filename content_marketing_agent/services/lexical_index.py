@@ -0,0 +1,106 @@
+"""In-process BM25 inverted index over research chunks, updated incrementally per chat."""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+# Keep product names and versions such as "gpt-4o", "node.js" or "c++" as single tokens
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.\-_][a-z0-9+#]+)*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or that the this to was were what "
+    "when which who why will with about into your you our we they their".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without common English stopwords."""
+    return [token for token in _TOKEN_RE.findall((text or "").lower()) if token not in _STOPWORDS]
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a set of chunks.
+
+    Postings are kept per term so adding or removing a chat's chunks only touches the
+    terms those chunks contain; document frequencies and the average length are derived
+    on the fly at query time.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._docs: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, doc_id: str, text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Index a chunk, replacing any earlier chunk with the same id."""
+        terms = Counter(tokenize(text))
+        with self._lock:
+            self._remove(doc_id)
+            for term, freq in terms.items():
+                self._postings.setdefault(term, {})[doc_id] = freq
+            length = sum(terms.values())
+            self._lengths[doc_id] = length
+            self._total_length += length
+            self._docs[doc_id] = (text, dict(metadata or {}))
+
+    def remove(self, doc_id: str) -> None:
+        with self._lock:
+            self._remove(doc_id)
+
+    def remove_chat(self, chat_id: str) -> None:
+        """Drop every chunk whose metadata belongs to ``chat_id``."""
+        with self._lock:
+            for doc_id in [doc_id for doc_id, (_, meta) in self._docs.items() if meta.get("chat_id") == chat_id]:
+                self._remove(doc_id)
+
+    def _remove(self, doc_id: str) -> None:
+        entry = self._docs.pop(doc_id, None)
+        if entry is None:
+            return
+        for term in set(tokenize(entry[0])):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._lengths.pop(doc_id, 0)
+
+    def search(self, query: str, k: int) -> List[Tuple[str, float]]:
+        """Return up to ``k`` (doc id, BM25 score) pairs, best first."""
+        terms = set(tokenize(query))
+        with self._lock:
+            count = len(self._docs)
+            if not count or not terms:
+                return []
+            avg_length = self._total_length / count or 1.0
+            scores: Dict[str, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1.0 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, freq in postings.items():
+                    norm = self.k1 * (1.0 - self.b + self.b * self._lengths[doc_id] / avg_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * freq * (self.k1 + 1.0) / (freq + norm)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:k]
+
+    def document(self, doc_id: str) -> Optional[Document]:
+        with self._lock:
+            entry = self._docs.get(doc_id)
+        if entry is None:
+            return None
+        return Document(id=doc_id, page_content=entry[0], metadata=dict(entry[1]))
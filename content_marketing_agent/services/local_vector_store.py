@@ -0,0 +1,661 @@
+"""In-process NumPy vector index with per-namespace, memory-mapped on-disk storage."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - optional dependency (not available on Windows)
+    fcntl = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Every data file belongs to a generation; CURRENT names the live one and is switched last
+_CURRENT_FILE = "CURRENT"
+_LOCK_FILE = ".lock"
+_BASE_VECTORS = "base-{generation}.npy"
+_BASE_RECORDS = "base-{generation}.json"
+_CODES_FILE = "codes-{mode}-{generation}.npy"
+_SCALES_FILE = "scales-{mode}-{generation}.npy"
+_VECTOR_LOG = "vectors-{generation}.log"
+_RECORD_LOG = "records-{generation}.log"
+_GENERATION_FILE = re.compile(r"-(\d+)\.(npy|json|log)$")
+
+QUANTIZATIONS = ("none", "int8", "binary")
+# Shortlist size for full-precision rescoring, as a multiple of k (binary codes are coarser)
+_DEFAULT_RESCORE_FACTOR = {"int8": 4, "binary": 10}
+# Rows converted per step when scoring codes, bounding temporary float copies
+_SCORE_BLOCK = 65536
+
+# One index per directory and quantization per process, shared by every store instance
+_indexes: Dict[Tuple[Path, str], "NamespaceIndex"] = {}
+_indexes_lock = threading.Lock()
+
+_BYTE_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    return _BYTE_POPCOUNT[values]  # pragma: no cover - numpy < 2.0
+
+
+def quantize(vectors: np.ndarray, mode: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Compress L2-normalized rows to ``(codes, scales)``.
+
+    ``int8`` keeps one signed byte per dimension plus a per-row float scale (4x smaller);
+    ``binary`` keeps the sign of each dimension packed eight to a byte (32x smaller, no scale).
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if mode == "int8":
+        peaks = np.abs(vectors).max(axis=1) if len(vectors) else np.zeros(0, dtype=np.float32)
+        peaks[peaks == 0] = 1.0
+        codes = np.rint(vectors / peaks[:, None] * 127.0).astype(np.int8)
+        return codes, (peaks / 127.0).astype(np.float32)
+    if mode == "binary":
+        return np.packbits(vectors > 0, axis=1), None
+    raise ValueError(f"Unknown quantization '{mode}'; expected one of {', '.join(QUANTIZATIONS)}")
+
+
+def _gather(segments: Tuple[np.ndarray, ...], rows: np.ndarray) -> np.ndarray:
+    """Copy the given (sorted) row numbers out of consecutive segments."""
+    out = np.empty((len(rows), segments[0].shape[1]), dtype=np.float32)
+    offset = 0
+    for segment in segments:
+        lo, hi = np.searchsorted(rows, [offset, offset + len(segment)])
+        if hi > lo:
+            out[lo:hi] = segment[rows[lo:hi] - offset]
+        offset += len(segment)
+    return out
+
+
+def _matches(metadata: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+    return not filter or all(metadata.get(key) == value for key, value in filter.items())
+
+
+class NamespaceIndex:
+    """
+    Vectors and records for one namespace, shareable by several processes.
+
+    Rows live in two segments of the generation named in ``CURRENT``. The base segment is
+    ``base-<n>.npy`` (L2-normalized, opened with ``mmap_mode="r"`` so the OS pages it in on
+    demand) with ids, texts and metadata in ``base-<n>.json``. Writes only append: new and
+    overwritten rows go to an open segment (raw float32 rows in ``vectors-<n>.log`` plus one
+    JSON line per batch in ``records-<n>.log``, whose complete lines define the row count)
+    and the rows they replace or delete are tombstoned. Once the open segment and
+    tombstones outgrow ``compact_ratio`` of the base (and ``compact_min_rows``), or when
+    :meth:`compact` is called, the live rows are written as generation ``n + 1`` and
+    ``CURRENT`` is switched last, so a crash leaves one complete generation.
+
+    Writes and compaction hold an exclusive ``fcntl`` lock on the directory and first
+    replay whatever other processes appended; searches replay new rows too, taking a
+    shared lock only when the files changed. Rows never change once written, so a search
+    reads a snapshot taken under the in-process lock.
+
+    With ``quantization`` set to ``int8`` or ``binary`` only a compact copy of the vectors
+    is held in memory: codes for the base segment are saved as ``codes-<mode>-<n>.npy`` at
+    compaction, and each write quantizes just its own rows. Searches score every row on
+    the codes, then rescore the best ``k * rescore_factor`` rows with full-precision vectors
+    read from the memory maps, so only those pages are touched.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        quantization: str = "none",
+        rescore_factor: Optional[int] = None,
+        compact_ratio: float = 0.25,
+        compact_min_rows: int = 4096,
+    ) -> None:
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unknown quantization '{quantization}'; expected one of {', '.join(QUANTIZATIONS)}")
+        self.directory = directory
+        self.quantization = quantization
+        self.rescore_factor = max(1, rescore_factor or _DEFAULT_RESCORE_FACTOR.get(quantization, 1))
+        self.compact_ratio = compact_ratio
+        self.compact_min_rows = compact_min_rows
+        self._lock = threading.RLock()
+        self._generation: Optional[int] = None
+        self._reset()
+        with self._lock:
+            self._refresh()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def _reset(self) -> None:
+        # New objects rather than cleared ones, so searches holding a snapshot are unaffected
+        self._base: Optional[np.ndarray] = None
+        self._open: Optional[np.ndarray] = None
+        self._dimension: Optional[int] = None
+        # One entry per row across both segments, tombstoned rows included
+        self._ids: List[str] = []
+        self._texts: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        self._dead: Set[int] = set()
+        # Codes for every row, in buffers with room to append
+        self._codes: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._code_rows = 0
+        self._record_offset = 0  # bytes of records-<n>.log already applied
+
+    def _path(self, template: str, generation: Optional[int] = None) -> Path:
+        generation = self._generation if generation is None else generation
+        return self.directory / template.format(generation=generation, mode=self.quantization)
+
+    def _segments(self) -> Tuple[np.ndarray, ...]:
+        return tuple(segment for segment in (self._base, self._open) if segment is not None)
+
+    def _current_generation(self) -> int:
+        try:
+            return int((self.directory / _CURRENT_FILE).read_text(encoding="utf-8").strip())
+        except (OSError, ValueError):
+            return 0
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """Cross-process lock on the directory (not re-entrant: never nest it)."""
+        if fcntl is None:  # pragma: no cover - optional dependency
+            yield
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with (self.directory / _LOCK_FILE).open("a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _save_array(self, path: Path, array: np.ndarray) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as handle:
+            np.save(handle, array)
+        os.replace(tmp, path)
+
+    def _refresh(self) -> None:
+        """Pick up rows and compactions written by other processes since the last look."""
+        if not self.directory.exists():
+            return
+        if self._generation == self._current_generation():
+            try:
+                size = self._path(_RECORD_LOG).stat().st_size
+            except OSError:
+                size = 0
+            if size <= self._record_offset:
+                return
+        with self._file_lock(exclusive=False):
+            self._sync()
+
+    def _sync(self) -> None:
+        """Bring memory up to date with the files; the caller holds a file lock."""
+        generation = self._current_generation()
+        if generation != self._generation:
+            self._reset()
+            self._generation = generation
+            self._load_base()
+        self._replay_log()
+
+    def _load_base(self) -> None:
+        vectors_path = self._path(_BASE_VECTORS)
+        if not vectors_path.exists():
+            return
+        with self._path(_BASE_RECORDS).open("r", encoding="utf-8") as handle:
+            records = json.load(handle)
+        self._ids = records.get("ids", [])
+        self._texts = records.get("texts", [])
+        self._metadatas = records.get("metadatas", [])
+        self._positions = {doc_id: idx for idx, doc_id in enumerate(self._ids)}
+        self._base = np.load(vectors_path, mmap_mode="r")
+        self._dimension = self._base.shape[1]
+        if self.quantization != "none":
+            self._load_base_codes()
+
+    def _load_base_codes(self) -> None:
+        """Load the base segment's codes, rebuilding them block by block when missing or stale."""
+        base_rows = len(self._base)
+        try:
+            codes = np.load(self._path(_CODES_FILE))
+            scales = np.load(self._path(_SCALES_FILE)) if self.quantization == "int8" else None
+            if len(codes) == base_rows and (scales is None or len(scales) == base_rows):
+                self._codes, self._scales, self._code_rows = codes, scales, base_rows
+                return
+        except (OSError, ValueError):
+            pass
+        logger.info("Building %s codes for %s vectors in %s", self.quantization, base_rows, self.directory)
+        for start in range(0, base_rows, _SCORE_BLOCK):
+            self._append_codes(self._base[start : start + _SCORE_BLOCK])
+        if self._codes is not None:
+            self._save_codes(self._codes[:base_rows], None if self._scales is None else self._scales[:base_rows])
+
+    def _save_codes(self, codes: np.ndarray, scales: Optional[np.ndarray], generation: Optional[int] = None) -> None:
+        self._save_array(self._path(_CODES_FILE, generation), codes)
+        if scales is not None:
+            self._save_array(self._path(_SCALES_FILE, generation), scales)
+
+    def _replay_log(self) -> None:
+        """Apply the complete record lines past ``_record_offset`` and map their vector rows."""
+        record_log = self._path(_RECORD_LOG)
+        if not record_log.exists():
+            return
+        with record_log.open("rb") as handle:
+            handle.seek(self._record_offset)
+            data = handle.read()
+        previous_rows = len(self._open) if self._open is not None else 0
+        rows = previous_rows
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break  # a write in progress, or one torn by a crash
+            try:
+                batch = json.loads(line)
+            except ValueError:
+                break
+            self._record_offset += len(line)
+            if batch.get("op") == "add":
+                self._dimension = self._dimension or int(batch["dimension"])
+                rows += len(batch["ids"])
+                self._apply_add(batch["ids"], batch["texts"], batch["metadatas"])
+            elif batch.get("op") == "delete":
+                self._apply_delete(batch["ids"])
+        if rows > previous_rows:
+            # The vector log may run past the recorded rows while another process is mid-write
+            self._open = np.memmap(
+                self._path(_VECTOR_LOG), dtype=np.float32, mode="r", shape=(rows, self._dimension)
+            )
+            if self.quantization != "none":
+                for start in range(previous_rows, rows, _SCORE_BLOCK):
+                    self._append_codes(self._open[start : min(start + _SCORE_BLOCK, rows)])
+
+    def _append_codes(self, vectors: np.ndarray) -> None:
+        """Quantize new rows and append them to the in-memory codes, growing the buffers geometrically."""
+        codes, scales = quantize(vectors, self.quantization)
+        start = self._code_rows
+        if self._codes is None or start + len(codes) > len(self._codes):
+            capacity = max(start + len(codes), 2 * start, 1024)
+            grown = np.empty((capacity, codes.shape[1]), dtype=codes.dtype)
+            grown[:start] = self._codes[:start] if self._codes is not None else codes[:0]
+            # A new buffer rather than a resize, so searches holding the old one are unaffected
+            self._codes = grown
+            if scales is not None:
+                grown_scales = np.empty(capacity, dtype=np.float32)
+                grown_scales[:start] = self._scales[:start] if self._scales is not None else scales[:0]
+                self._scales = grown_scales
+        self._codes[start : start + len(codes)] = codes
+        if scales is not None:
+            self._scales[start : start + len(scales)] = scales
+        self._code_rows = start + len(codes)
+
+    def _apply_add(self, ids: List[str], texts: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        for doc_id, text, metadata in zip(ids, texts, metadatas):
+            previous = self._positions.get(doc_id)
+            if previous is not None:
+                self._dead.add(previous)
+            self._positions[doc_id] = len(self._ids)
+            self._ids.append(doc_id)
+            self._texts.append(text)
+            self._metadatas.append(metadata)
+
+    def _apply_delete(self, ids: List[str]) -> None:
+        for doc_id in ids:
+            position = self._positions.pop(doc_id, None)
+            if position is not None:
+                self._dead.add(position)
+
+    def _append(self, batch: Dict[str, Any], vectors: Optional[np.ndarray] = None) -> None:
+        """Append a batch to the open segment and apply it; the caller holds the exclusive lock and has synced."""
+        if vectors is not None:
+            rows = len(self._open) if self._open is not None else 0
+            with self._path(_VECTOR_LOG).open("ab") as handle:
+                handle.truncate(rows * vectors.shape[1] * 4)  # drop rows an interrupted write left behind
+                handle.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        with self._path(_RECORD_LOG).open("ab") as handle:
+            handle.truncate(self._record_offset)
+            handle.write((json.dumps(batch) + "\n").encode("utf-8"))
+        self._replay_log()
+
+    def _maybe_compact(self) -> None:
+        base_rows = len(self._base) if self._base is not None else 0
+        garbage = len(self._ids) - base_rows + len(self._dead)
+        if garbage > max(self.compact_min_rows, self.compact_ratio * base_rows):
+            self._compact()
+
+    def upsert(
+        self,
+        ids: List[str],
+        vectors: np.ndarray,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Insert new rows and replace rows whose id already exists."""
+        if not ids:
+            return
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync()
+            if self._dimension is not None and vectors.shape[1] != self._dimension:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match index dimension {self._dimension} "
+                    f"in {self.directory}"
+                )
+            batch = {"op": "add", "dimension": vectors.shape[1], "ids": ids, "texts": texts, "metadatas": metadatas}
+            self._append(batch, vectors)
+            self._maybe_compact()
+
+    def delete(self, ids: Optional[Iterable[str]] = None, filter: Optional[Dict[str, Any]] = None) -> int:
+        """Delete rows by id and/or metadata filter; return how many rows were removed."""
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync()
+            drop = [doc_id for doc_id in (ids or []) if doc_id in self._positions]
+            if filter:
+                drop.extend(
+                    doc_id for doc_id, row in self._positions.items() if _matches(self._metadatas[row], filter)
+                )
+            drop = list(dict.fromkeys(drop))
+            if not drop:
+                return 0
+            self._append({"op": "delete", "ids": drop})
+            self._maybe_compact()
+            return len(drop)
+
+    def compact(self) -> None:
+        """Fold the open segment and tombstones into a new base segment now."""
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync()
+            self._compact()
+
+    def _compact(self) -> None:
+        """Write the live rows as the next generation and switch ``CURRENT`` to it."""
+        if self._dimension is None:
+            return
+        live = np.array(sorted(self._positions.values()), dtype=np.int64)
+        generation = self._generation + 1
+        segments = self._segments()
+        vectors_path = self._path(_BASE_VECTORS, generation)
+        tmp_vectors = vectors_path.with_name(f"{vectors_path.name}.{os.getpid()}.tmp")
+        merged = np.lib.format.open_memmap(tmp_vectors, mode="w+", dtype=np.float32, shape=(len(live), self._dimension))
+        for start in range(0, len(live), _SCORE_BLOCK):
+            merged[start : start + _SCORE_BLOCK] = _gather(segments, live[start : start + _SCORE_BLOCK])
+        merged.flush()
+        del merged
+        os.replace(tmp_vectors, vectors_path)
+
+        records_path = self._path(_BASE_RECORDS, generation)
+        tmp_records = records_path.with_name(f"{records_path.name}.{os.getpid()}.tmp")
+        with tmp_records.open("w", encoding="utf-8") as handle:
+            json.dump(
+                {
+                    "ids": [self._ids[row] for row in live],
+                    "texts": [self._texts[row] for row in live],
+                    "metadatas": [self._metadatas[row] for row in live],
+                },
+                handle,
+            )
+        os.replace(tmp_records, records_path)
+        if self._codes is not None:
+            # Live rows keep their codes; nothing is requantized
+            self._save_codes(
+                self._codes[live], self._scales[live] if self._scales is not None else None, generation
+            )
+
+        current = self.directory / _CURRENT_FILE
+        tmp_current = current.with_name(f"{_CURRENT_FILE}.{os.getpid()}.tmp")
+        tmp_current.write_text(str(generation), encoding="utf-8")
+        os.replace(tmp_current, current)  # the switch: readers now load the new generation
+        for path in self.directory.iterdir():
+            match = _GENERATION_FILE.search(path.name)
+            if match and int(match.group(1)) != generation:
+                path.unlink(missing_ok=True)
+        self._sync()
+        logger.info("Compacted %s to %s rows (generation %s)", self.directory, len(live), generation)
+
+    def _coarse_scores(
+        self, codes: np.ndarray, scales: Optional[np.ndarray], query: np.ndarray, rows: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """Approximate scores from the quantized codes (higher is better)."""
+        codes = codes if rows is None else codes[rows]
+        scores = np.empty(len(codes), dtype=np.float32)
+        if self.quantization == "int8":
+            for start in range(0, len(codes), _SCORE_BLOCK):
+                block = codes[start : start + _SCORE_BLOCK]
+                scores[start : start + len(block)] = block.astype(np.float32) @ query
+            return scores * (scales if rows is None else scales[rows])
+        query_bits = np.packbits(query > 0)
+        for start in range(0, len(codes), _SCORE_BLOCK):
+            block = codes[start : start + _SCORE_BLOCK]
+            scores[start : start + len(block)] = -_popcount(block ^ query_bits).sum(axis=1, dtype=np.int32)
+        return scores
+
+    def _rank(
+        self,
+        segments: Tuple[np.ndarray, ...],
+        codes: Optional[Tuple[np.ndarray, Optional[np.ndarray]]],
+        query: np.ndarray,
+        k: int,
+        rows: Optional[np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the best ``k`` row numbers and their cosine scores, best first."""
+        total = len(rows) if rows is not None else sum(len(segment) for segment in segments)
+        top = min(k, total)
+        if codes is None or top * self.rescore_factor >= total:
+            # Cheaper to score everything at full precision than to shortlist
+            candidates = rows if rows is not None else np.arange(total)
+        else:
+            coarse = self._coarse_scores(codes[0], codes[1], query, rows)
+            shortlist = np.argpartition(-coarse, top * self.rescore_factor - 1)[: top * self.rescore_factor]
+            candidates = np.sort(shortlist if rows is None else rows[shortlist])
+        if rows is None and len(candidates) == total:
+            scores = np.concatenate([segment @ query for segment in segments])
+        else:
+            scores = _gather(segments, candidates) @ query
+        order = np.argpartition(-scores, top - 1)[:top]
+        order = order[np.argsort(-scores[order])]
+        return candidates[order], scores[order]
+
+    def search(
+        self, query: np.ndarray, k: int, filter: Optional[Dict[str, Any]] = None, exact: bool = False
+    ) -> List[Tuple[str, str, Dict[str, Any], float]]:
+        """
+        Return up to ``k`` (id, text, metadata, cosine score) tuples, best first.
+
+        ``exact`` skips the quantized shortlist and scores every row at full precision.
+        """
+        with self._lock:
+            self._refresh()
+            if not self._positions:
+                return []
+            # Rows below ``total`` are never modified, and compaction swaps in new lists and
+            # arrays, so this snapshot stays consistent after the lock is released
+            total = len(self._ids)
+            segments = self._segments()
+            codes = None
+            if not exact and self._codes is not None:
+                codes = (self._codes[:total], None if self._scales is None else self._scales[:total])
+            ids, texts, metadatas = self._ids, self._texts, self._metadatas
+            dead = np.fromiter(self._dead, dtype=np.int64, count=len(self._dead))
+
+        query = _normalize(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+        rows = None
+        if filter or dead.size:
+            alive = np.ones(total, dtype=bool)
+            alive[dead] = False
+            rows = np.flatnonzero(alive)
+            if filter:
+                rows = rows[[_matches(metadatas[row], filter) for row in rows]]
+            if rows.size == 0:
+                return []
+        found, scores = self._rank(segments, codes, query, k, rows)
+        return [(ids[row], texts[row], metadatas[row], float(score)) for row, score in zip(found, scores)]
+
+    def recall_at_k(self, queries: np.ndarray, k: int) -> float:
+        """Mean fraction of the exact top ``k`` ids that the quantized search also returns."""
+        if not self._positions or self._codes is None:
+            return 1.0
+        recalls = []
+        for query in np.asarray(queries, dtype=np.float32):
+            exact = {hit[0] for hit in self.search(query, k, exact=True)}
+            approx = {hit[0] for hit in self.search(query, k)}
+            recalls.append(len(exact & approx) / max(1, len(exact)))
+        return float(np.mean(recalls)) if recalls else 1.0
+
+
+class LocalVectorStore(VectorStore):
+    """
+    LangChain vector store over :class:`NamespaceIndex` directories.
+
+    Mirrors the ``PineconeVectorStore`` call shape: a default namespace is bound at
+    construction and every operation accepts a ``namespace`` override. ``quantization``,
+    ``rescore_factor`` and the compaction settings are passed to each :class:`NamespaceIndex`.
+    """
+
+    def __init__(
+        self,
+        embedding: Embeddings,
+        root_dir: str,
+        namespace: str = "default",
+        quantization: str = "none",
+        rescore_factor: Optional[int] = None,
+        compact_ratio: float = 0.25,
+        compact_min_rows: int = 4096,
+    ) -> None:
+        self._embedding = embedding
+        self._root = Path(root_dir)
+        self._namespace = namespace
+        self._quantization = quantization
+        self._rescore_factor = rescore_factor
+        self._compact_ratio = compact_ratio
+        self._compact_min_rows = compact_min_rows
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    def _index(self, namespace: Optional[str]) -> NamespaceIndex:
+        directory = (self._root / (namespace or self._namespace)).resolve()
+        with _indexes_lock:
+            index = _indexes.get((directory, self._quantization))
+            if index is None:
+                index = NamespaceIndex(
+                    directory,
+                    self._quantization,
+                    self._rescore_factor,
+                    compact_ratio=self._compact_ratio,
+                    compact_min_rows=self._compact_min_rows,
+                )
+                _indexes[(directory, self._quantization)] = index
+            return index
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[dict]] = None,
+        ids: Optional[List[str]] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        texts = list(texts)
+        if not texts:
+            return []
+        metadatas = metadatas or [{} for _ in texts]
+        if ids is None:
+            from uuid import uuid4
+
+            ids = [uuid4().hex for _ in texts]
+        vectors = np.asarray(self._embedding.embed_documents(texts), dtype=np.float32)
+        self._index(namespace).upsert(list(ids), vectors, texts, [dict(meta) for meta in metadatas])
+        return list(ids)
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        vector = self._embedding.embed_query(query)
+        return self.similarity_search_by_vector_with_score(vector, k=k, filter=filter, namespace=namespace)
+
+    def similarity_search_by_vector_with_score(
+        self,
+        embedding: List[float],
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+    ) -> List[Tuple[Document, float]]:
+        hits = self._index(namespace).search(np.asarray(embedding, dtype=np.float32), k, filter=filter)
+        return [
+            (Document(id=doc_id, page_content=text, metadata=dict(metadata)), score)
+            for doc_id, text, metadata, score in hits
+        ]
+
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k=k, filter=filter, namespace=namespace)]
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_by_vector_with_score(embedding, k=k, **kwargs)]
+
+    def recall_at_k(self, queries: List[str], k: int = 8, namespace: Optional[str] = None) -> float:
+        """Recall@k of the quantized search against exact search for sample query texts."""
+        vectors = np.asarray(self._embedding.embed_documents(list(queries)), dtype=np.float32)
+        return self._index(namespace).recall_at_k(vectors, k)
+
+    def compact(self, namespace: Optional[str] = None) -> None:
+        """Fold a namespace's open segment and tombstones into its base segment now."""
+        self._index(namespace).compact()
+
+    def _select_relevance_score_fn(self):
+        return lambda score: (score + 1.0) / 2.0
+
+    def delete(
+        self,
+        ids: Optional[List[str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[bool]:
+        removed = self._index(namespace).delete(ids=ids, filter=filter)
+        logger.info("Local vector store: removed %s rows from namespace=%s", removed, namespace or self._namespace)
+        return True
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        *,
+        ids: Optional[List[str]] = None,
+        root_dir: str = "vector_data",
+        namespace: str = "default",
+        **kwargs: Any,
+    ) -> "LocalVectorStore":
+        store = cls(embedding=embedding, root_dir=root_dir, namespace=namespace)
+        store.add_texts(texts, metadatas=metadatas, ids=ids)
+        return store
@@ -0,0 +1,196 @@
+"""Batched Pinecone data-plane vector store usable with the REST or gRPC index client."""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve(pending: Any) -> Any:
+    """Wait for an async request: gRPC returns futures, REST returns ``ApplyResult``."""
+    if hasattr(pending, "result"):
+        return pending.result()
+    if hasattr(pending, "get"):
+        return pending.get()
+    return pending
+
+
+def _field(item: Any, name: str, default: Any = None) -> Any:
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+class PineconeDataPlaneStore(VectorStore):
+    """
+    Vector store over a Pinecone data-plane index handle (``Index`` or ``GRPCIndex``).
+
+    Upserts and id deletes are split into fixed-size batches sent as async requests, with at
+    most ``max_in_flight`` outstanding; with the gRPC client they share one multiplexed
+    HTTP/2 channel. No namespace is bound: every operation takes one, like
+    :class:`~content_marketing_agent.services.local_vector_store.LocalVectorStore`.
+    """
+
+    def __init__(
+        self,
+        index: Any,
+        embedding: Embeddings,
+        text_key: str = "text",
+        upsert_batch_size: int = 100,
+        delete_batch_size: int = 1000,
+        max_in_flight: int = 8,
+    ) -> None:
+        self._index = index
+        self._embedding = embedding
+        self._text_key = text_key
+        self.upsert_batch_size = max(1, upsert_batch_size)
+        self.delete_batch_size = max(1, delete_batch_size)
+        self.max_in_flight = max(1, max_in_flight)
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    def _pipelined(self, calls: Iterable[Callable[[], Any]]) -> int:
+        """Issue async requests keeping at most ``max_in_flight`` outstanding; return the count."""
+        in_flight: Deque[Any] = deque()
+        sent = 0
+        for call in calls:
+            if len(in_flight) >= self.max_in_flight:
+                _resolve(in_flight.popleft())
+            in_flight.append(call())
+            sent += 1
+        while in_flight:
+            _resolve(in_flight.popleft())
+        return sent
+
+    def upsert_vectors(
+        self,
+        ids: List[str],
+        vectors: List[List[float]],
+        metadatas: List[Dict[str, Any]],
+        namespace: Optional[str] = None,
+    ) -> int:
+        """Upsert precomputed vectors in batches; return the number of requests sent."""
+        records = [(doc_id, [float(x) for x in vector], meta) for doc_id, vector, meta in zip(ids, vectors, metadatas)]
+        size = self.upsert_batch_size
+        return self._pipelined(
+            partial(self._index.upsert, vectors=records[start : start + size], namespace=namespace, async_req=True)
+            for start in range(0, len(records), size)
+        )
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[dict]] = None,
+        ids: Optional[List[str]] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        texts = list(texts)
+        if not texts:
+            return []
+        ids = list(ids) if ids is not None else [uuid4().hex for _ in texts]
+        metadatas = [dict(meta) for meta in (metadatas or [{} for _ in texts])]
+        for metadata, text in zip(metadatas, texts):
+            metadata[self._text_key] = text
+        vectors = self._embedding.embed_documents(texts)
+        self.upsert_vectors(ids, vectors, metadatas, namespace=namespace)
+        return ids
+
+    def similarity_search_by_vector_with_score(
+        self,
+        embedding: List[float],
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+    ) -> List[Tuple[Document, float]]:
+        response = self._index.query(
+            vector=[float(x) for x in embedding],
+            top_k=k,
+            namespace=namespace,
+            filter=filter,
+            include_metadata=True,
+        )
+        results = []
+        for match in _field(response, "matches", []) or []:
+            metadata = dict(_field(match, "metadata", {}) or {})
+            text = metadata.pop(self._text_key, None)
+            if text is None:
+                logger.warning("Pinecone match %s has no '%s' metadata; skipping.", _field(match, "id"), self._text_key)
+                continue
+            doc = Document(id=_field(match, "id"), page_content=text, metadata=metadata)
+            results.append((doc, float(_field(match, "score", 0.0))))
+        return results
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        vector = self._embedding.embed_query(query)
+        return self.similarity_search_by_vector_with_score(vector, k=k, filter=filter, namespace=namespace)
+
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k=k, filter=filter, namespace=namespace)]
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_by_vector_with_score(embedding, k=k, **kwargs)]
+
+    def _select_relevance_score_fn(self):
+        return lambda score: (score + 1.0) / 2.0
+
+    def delete(
+        self,
+        ids: Optional[List[str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[bool]:
+        if filter:
+            self._index.delete(filter=filter, namespace=namespace)
+        if ids:
+            ids = list(ids)
+            size = self.delete_batch_size
+            self._pipelined(
+                partial(self._index.delete, ids=ids[start : start + size], namespace=namespace, async_req=True)
+                for start in range(0, len(ids), size)
+            )
+        return True
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        *,
+        index: Any = None,
+        ids: Optional[List[str]] = None,
+        namespace: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "PineconeDataPlaneStore":
+        if index is None:
+            raise ValueError("PineconeDataPlaneStore.from_texts requires an index handle")
+        store = cls(index=index, embedding=embedding, **kwargs)
+        store.add_texts(texts, metadatas=metadatas, ids=ids, namespace=namespace)
+        return store
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, Optional, Tuple
 
-from content_marketing_agent.data_access import chat_repository, project_repository
+from content_marketing_agent.data_access import project_repository
 
 
 def create_project(title: str) -> dict[str, Any]:
@@ -16,11 +17,22 @@ def create_project(title: str) -> dict[str, Any]:
 
 def list_projects() -> list[dict[str, Any]]:
     """List projects with chat counts for the home view."""
-    projects = project_repository.list_projects()
-    counts = {proj["id"]: chat_repository.count_chats(proj["id"]) for proj in projects}
-    for proj in projects:
-        proj["chat_count"] = counts.get(proj["id"], 0)
-    return projects
+    return project_repository.list_projects()
+
+
+def list_project_page(
+    limit: int, before: Optional[Tuple[datetime, str]] = None
+) -> tuple[list[dict[str, Any]], Optional[Tuple[datetime, str]]]:
+    """
+    One page of projects (with chat counts) and the cursor for the next page, if any.
+
+    Pass the returned cursor as ``before`` to fetch the following page.
+    """
+    projects = project_repository.list_projects(limit=limit + 1, before=before)
+    if len(projects) <= limit:
+        return projects, None
+    projects = projects[:limit]
+    return projects, (projects[-1]["created_at"], projects[-1]["_id"])
 
 
 def get_project(project_id: Optional[str]) -> Optional[dict[str, Any]]:
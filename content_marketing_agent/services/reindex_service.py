@@ -0,0 +1,219 @@
+"""Rebuild project vectors from the research outputs stored in MongoDB."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from content_marketing_agent.data_access import reindex_repository, research_repository
+from content_marketing_agent.services import vector_service
+
+logger = logging.getLogger(__name__)
+
+Chunk = Tuple[str, str, Dict[str, Any]]
+
+
+@dataclass
+class ReindexProgress:
+    """Running totals reported after every checkpoint."""
+
+    job_id: str
+    total: int
+    processed: int = 0
+    chunks: int = 0
+    skipped: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    # Counters carried over from an earlier run are excluded from the rates
+    resumed_docs: int = 0
+    resumed_chunks: int = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def as_dict(self) -> Dict[str, Any]:
+        elapsed = max(self.elapsed, 1e-9)
+        return {
+            "job_id": self.job_id,
+            "total": self.total,
+            "processed": self.processed,
+            "chunks": self.chunks,
+            "skipped": self.skipped,
+            "elapsed_seconds": round(self.elapsed, 2),
+            "docs_per_second": round((self.processed - self.resumed_docs) / elapsed, 2),
+            "chunks_per_second": round((self.chunks - self.resumed_chunks) / elapsed, 2),
+            "percent": round(100.0 * self.processed / self.total, 1) if self.total else 100.0,
+        }
+
+
+def _upsert_batch(namespace: str, index_name: str, batch: List[Chunk]) -> int:
+    store = vector_service.get_vector_store(index_name)
+    if store is None:
+        raise RuntimeError(f"Vector store unavailable for index {index_name}")
+    store.add_texts(
+        [text for _, text, _ in batch],
+        metadatas=[metadata for _, _, metadata in batch],
+        ids=[chunk_id for chunk_id, _, _ in batch],
+        namespace=namespace,
+    )
+    return len(batch)
+
+
+def _index_window(
+    docs: List[Dict[str, Any]],
+    executor: ThreadPoolExecutor,
+    index_name: str,
+    namespace_suffix: str,
+    batch_size: int,
+    in_place: bool,
+) -> Tuple[int, int]:
+    """Embed and upsert one window of documents; return (chunks written, documents skipped)."""
+    pending: Dict[str, List[Chunk]] = {}
+    manifests: List[Tuple[Dict[str, Any], Dict[str, str]]] = []
+    skipped = 0
+    for doc in docs:
+        chunks = vector_service.research_output_chunks(doc)
+        if not chunks or not doc.get("project_id") or not doc.get("chat_id"):
+            skipped += 1
+            continue
+        namespace = vector_service.project_namespace(doc["project_id"], namespace_suffix)
+        pending.setdefault(namespace, []).extend(chunks)
+        manifests.append((doc, {chunk_id: metadata["chunk_hash"] for chunk_id, _, metadata in chunks}))
+
+    futures = [
+        executor.submit(_upsert_batch, namespace, index_name, chunks[start : start + batch_size])
+        for namespace, chunks in pending.items()
+        for start in range(0, len(chunks), batch_size)
+    ]
+    # result() re-raises the first failure so the checkpoint is not advanced past this window
+    written = sum(future.result() for future in futures)
+
+    if in_place:
+        # Rebuilding the live namespaces: drop chunks the new chunking no longer produces
+        for doc, manifest in manifests:
+            stale = vector_service.stale_chunk_ids(doc["chat_id"], doc.get("vector_chunks") or {}, manifest)
+            if stale:
+                namespace = vector_service.project_namespace(doc["project_id"], namespace_suffix)
+                vector_service.get_vector_store(index_name).delete(ids=stale, namespace=namespace)
+            research_repository.set_vector_manifest(doc["chat_id"], manifest)
+        for project_id in {doc["project_id"] for doc, _ in manifests}:
+            vector_service.invalidate_project_vectors(project_id)
+    return written, skipped
+
+
+def reindex_research_outputs(
+    job_id: str = "reindex",
+    index_name: Optional[str] = None,
+    namespace_suffix: Optional[str] = None,
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    window: int = 200,
+    restart: bool = False,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Re-embed every stored research output into ``index_name`` / ``namespace_suffix``.
+
+    Research outputs are streamed in ``_id`` order and indexed ``window`` documents at a time,
+    with up to ``workers`` embedding+upsert batches of ``batch_size`` chunks in flight. A
+    checkpoint is saved under ``job_id`` after each window, so rerunning the same job resumes
+    after the last completed window (chunk ids are stable, so repeated upserts are harmless).
+    Chunk manifests are only rewritten when the target is the live index and namespace.
+    """
+    target_index = index_name or vector_service.INDEX_NAME
+    suffix = vector_service.VECTOR_NAMESPACE_SUFFIX if namespace_suffix is None else namespace_suffix
+    in_place = target_index == vector_service.INDEX_NAME and suffix == vector_service.VECTOR_NAMESPACE_SUFFIX
+    workers = max(1, workers or int(os.getenv("REINDEX_WORKERS", "4")))
+    batch_size = max(1, batch_size or int(os.getenv("VECTOR_UPSERT_BATCH_SIZE", "64")))
+    target = {
+        "index": target_index,
+        "namespace_suffix": suffix,
+        "backend": vector_service.VECTOR_BACKEND,
+        "embedding_model": os.getenv("EMBEDDING_MODEL", ""),
+    }
+
+    job = None if restart else reindex_repository.get_job(job_id)
+    if job and job.get("status") == "completed":
+        logger.info("Reindex job '%s' already completed; pass restart=True to run it again.", job_id)
+        processed, chunks = job.get("processed", 0), job.get("chunks", 0)
+        done = ReindexProgress(
+            job_id, job.get("total", 0), processed, chunks, resumed_docs=processed, resumed_chunks=chunks
+        )
+        return done.as_dict()
+    if job and job.get("target") != target:
+        raise ValueError(f"Reindex job '{job_id}' was started for {job.get('target')}; use a new job id or restart.")
+
+    if job:
+        after_id = job.get("last_id")
+        processed, chunks = job.get("processed", 0), job.get("chunks", 0)
+        progress = ReindexProgress(
+            job_id,
+            total=processed + research_repository.count_indexable_research_outputs(after_id),
+            processed=processed,
+            chunks=chunks,
+            resumed_docs=processed,
+            resumed_chunks=chunks,
+        )
+        logger.info("Resuming reindex job '%s' after %s documents", job_id, progress.processed)
+    else:
+        after_id = None
+        total = research_repository.count_indexable_research_outputs()
+        reindex_repository.start_job(job_id, target, total)
+        progress = ReindexProgress(job_id, total=total)
+        logger.info("Starting reindex job '%s' into %s (%s documents)", job_id, target, total)
+
+    def report() -> Dict[str, Any]:
+        stats = progress.as_dict()
+        logger.info(
+            "Reindex %s: %s/%s docs (%s%%), %s chunks, %s docs/s, %s chunks/s",
+            job_id,
+            stats["processed"],
+            stats["total"],
+            stats["percent"],
+            stats["chunks"],
+            stats["docs_per_second"],
+            stats["chunks_per_second"],
+        )
+        if on_progress:
+            on_progress(stats)
+        return stats
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reindex") as executor:
+            docs: List[Dict[str, Any]] = []
+            for doc in research_repository.iter_indexable_research_outputs(after_id, batch_size=window):
+                docs.append(doc)
+                if len(docs) < window:
+                    continue
+                _flush(docs, executor, target_index, suffix, batch_size, in_place, progress)
+                report()
+                docs = []
+            if docs:
+                _flush(docs, executor, target_index, suffix, batch_size, in_place, progress)
+    except Exception:
+        reindex_repository.finish_job(job_id, status="failed")
+        logger.exception("Reindex job '%s' failed after %s documents; rerun to resume.", job_id, progress.processed)
+        raise
+
+    reindex_repository.finish_job(job_id)
+    return report()
+
+
+def _flush(
+    docs: List[Dict[str, Any]],
+    executor: ThreadPoolExecutor,
+    index_name: str,
+    namespace_suffix: str,
+    batch_size: int,
+    in_place: bool,
+    progress: ReindexProgress,
+) -> None:
+    written, skipped = _index_window(docs, executor, index_name, namespace_suffix, batch_size, in_place)
+    progress.processed += len(docs)
+    progress.chunks += written
+    progress.skipped += skipped
+    reindex_repository.save_checkpoint(progress.job_id, docs[-1]["_id"], progress.processed, progress.chunks)
@@ -0,0 +1,158 @@
+"""Write-behind processing of vector upserts and deletes queued in MongoDB."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from content_marketing_agent.data_access import research_repository, vector_queue_repository
+from content_marketing_agent.services import vector_service
+
+logger = logging.getLogger(__name__)
+
+# "queue" (default) defers index writes to the background worker; "sync" applies them inline
+VECTOR_WRITE_MODE = os.getenv("VECTOR_WRITE_MODE", "queue").lower()
+
+_WORKER_ID = f"{os.getpid()}-{uuid4().hex[:8]}"
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+_wake = threading.Event()
+_counters = {"processed": 0, "failed": 0, "batches": 0}
+_counters_lock = threading.Lock()
+
+
+def enqueue_research_upsert(project_id: str, chat_id: str) -> None:
+    """
+    Schedule indexing of a chat's stored research output.
+
+    The worker reads the research output when it runs, so several saves of the same chat
+    before then collapse into a single upsert of the latest version.
+    """
+    _submit(project_id, chat_id, "upsert", {})
+
+
+def enqueue_research_delete(project_id: str, chat_id: str, ids: Optional[List[str]] = None) -> None:
+    """
+    Schedule removal of a chat's vectors.
+
+    Pass the chunk ``ids`` when the research output (and its manifest) is about to be deleted;
+    the worker adds whatever the manifest holds when it runs.
+    """
+    _submit(project_id, chat_id, "delete", {"ids": ids} if ids is not None else {})
+
+
+def _submit(project_id: str, chat_id: str, op: str, payload: Dict[str, Any]) -> None:
+    if VECTOR_WRITE_MODE == "sync":
+        _process([{"_id": chat_id, "project_id": project_id, "op": op, "payload": payload}], durable=False)
+        return
+    try:
+        vector_queue_repository.enqueue(chat_id, project_id, op, payload)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Vector queue unavailable (%s); applying %s for chat_id=%s inline.", exc, op, chat_id)
+        _process([{"_id": chat_id, "project_id": project_id, "op": op, "payload": payload}], durable=False)
+        return
+    start_worker()
+    _wake.set()
+
+
+def _retry_at(attempts: int) -> datetime:
+    backoff = min(float(os.getenv("VECTOR_QUEUE_MAX_BACKOFF_SECONDS", "300")), 2.0 ** (attempts + 1))
+    return datetime.utcnow() + timedelta(seconds=backoff)
+
+
+def _settle(jobs: List[Dict[str, Any]], error: Optional[Exception], durable: bool) -> None:
+    with _counters_lock:
+        _counters["failed" if error else "processed"] += len(jobs)
+    if not durable:
+        if error:
+            logger.warning("Vector write failed for %s chats: %s", len(jobs), error)
+        return
+    for job in jobs:
+        if error is None:
+            vector_queue_repository.ack(job["_id"], job["revision"])
+        else:
+            vector_queue_repository.fail(job["_id"], job["revision"], str(error), _retry_at(job.get("attempts", 0)))
+
+
+def _process(jobs: List[Dict[str, Any]], durable: bool = True) -> None:
+    """Apply a batch of queued operations: deletes in one pass, then upserts in one pass."""
+    deletes = [job for job in jobs if job.get("op") == "delete"]
+    upserts = [job for job in jobs if job.get("op") == "upsert"]
+
+    if deletes:
+        try:
+            vector_service.delete_research_vectors(
+                [(job["project_id"], job["_id"], (job.get("payload") or {}).get("ids")) for job in deletes]
+            )
+            _settle(deletes, None, durable)
+        except Exception as exc:
+            _settle(deletes, exc, durable)
+
+    if upserts:
+        try:
+            docs = research_repository.get_research_outputs([job["_id"] for job in upserts])
+            vector_service.index_research_outputs(docs)
+            _settle(upserts, None, durable)
+        except Exception as exc:
+            _settle(upserts, exc, durable)
+
+
+def process_pending(limit: Optional[int] = None) -> int:
+    """Claim and apply one batch of due queue entries; return how many were claimed."""
+    limit = limit or int(os.getenv("VECTOR_QUEUE_BATCH_SIZE", "32"))
+    lease = float(os.getenv("VECTOR_QUEUE_LEASE_SECONDS", "120"))
+    jobs = vector_queue_repository.claim(_WORKER_ID, limit, lease)
+    if not jobs:
+        return 0
+    started = time.perf_counter()
+    _process(jobs)
+    with _counters_lock:
+        _counters["batches"] += 1
+    logger.info(
+        "Vector queue: applied %s operations in %.0f ms (%s)",
+        len(jobs),
+        (time.perf_counter() - started) * 1000,
+        ", ".join(f"{key}={value}" for key, value in get_queue_stats().items()),
+    )
+    return len(jobs)
+
+
+def _run_worker() -> None:
+    poll_seconds = float(os.getenv("VECTOR_QUEUE_POLL_SECONDS", "2"))
+    while True:
+        try:
+            if process_pending():
+                continue
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Vector queue worker error: %s", exc)
+        _wake.wait(poll_seconds)
+        _wake.clear()
+
+
+def start_worker() -> None:
+    """Start the background worker for this process (idempotent; no-op in sync mode)."""
+    global _worker
+    if VECTOR_WRITE_MODE == "sync":
+        return
+    with _worker_lock:
+        if _worker is not None and _worker.is_alive():
+            return
+        _worker = threading.Thread(target=_run_worker, name="vector-queue", daemon=True)
+        _worker.start()
+        logger.info("Vector queue worker started (%s)", _WORKER_ID)
+
+
+def get_queue_stats() -> Dict[str, Any]:
+    """Queue depth and lag from Mongo plus this process's processed/failed counters."""
+    with _counters_lock:
+        stats: Dict[str, Any] = dict(_counters)
+    try:
+        stats.update(vector_queue_repository.stats())
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Vector queue stats unavailable: %s", exc)
+    return stats
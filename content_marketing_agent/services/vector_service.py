@@ -1,22 +1,63 @@
-"""Vector store helpers backed by Pinecone (local or hosted)."""
+"""Vector store helpers backed by Pinecone (local or hosted) or an in-process index."""
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
 import logging
 import os
+import threading
+import time
 from functools import lru_cache
-from typing import Any, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
 from langchain_pinecone import PineconeVectorStore
 from pinecone import Pinecone, ServerlessSpec
 
+from content_marketing_agent.data_access import project_repository, research_repository
+from content_marketing_agent.services.context_selector import select_context
+from content_marketing_agent.services.lexical_index import BM25Index
+from content_marketing_agent.services.local_vector_store import LocalVectorStore
+from content_marketing_agent.services.pinecone_store import PineconeDataPlaneStore
+from content_marketing_agent.utils.cache_store import CacheStore, get_cache_store
 from content_marketing_agent.utils.embedding_loader import get_embedding_dimension, get_embedding_model
+from content_marketing_agent.utils.reranker import rerank_documents
+from content_marketing_agent.utils.text_chunker import chunk_hash, chunk_text, format_references
+
+try:
+    from pinecone.grpc import GRPCClientConfig, PineconeGRPC
+except Exception:  # pragma: no cover - optional dependency (pip install "pinecone[grpc]")
+    GRPCClientConfig = None  # type: ignore
+    PineconeGRPC = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
 INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "content-blitz")
 DEFAULT_METRIC = os.getenv("PINECONE_METRIC", "cosine")
+# "pinecone" (default) or "local" for the in-process NumPy index under LOCAL_VECTOR_DIR
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "pinecone").lower()
+LOCAL_VECTOR_DIR = os.getenv("LOCAL_VECTOR_DIR", "vector_data")
+# "none" (default), "int8" or "binary": quantized in-memory codes with full-precision rescoring
+LOCAL_VECTOR_QUANTIZATION = os.getenv("LOCAL_VECTOR_QUANTIZATION", "none").lower()
+# Pinecone data-plane transport: "rest" (PineconeVectorStore) or "grpc" (batched, multiplexed gRPC client)
+PINECONE_TRANSPORT = os.getenv("PINECONE_TRANSPORT", "rest").lower()
+# Appended to project ids to form namespaces; lets a reindex be written side by side and switched to
+VECTOR_NAMESPACE_SUFFIX = os.getenv("VECTOR_NAMESPACE_SUFFIX", "")
+# "hybrid" (default) fuses BM25 and dense rankings; "dense" is similarity search only
+RETRIEVAL_MODE = os.getenv("RETRIEVAL_MODE", "hybrid").lower()
+_RRF_K = 60  # reciprocal rank fusion damping constant
+
+# One store handle per index, shared by every namespace; failed builds are retried after a delay
+_stores: Dict[str, VectorStore] = {}
+_store_failures: Dict[str, float] = {}
+_stores_lock = threading.Lock()
+
+# Per-project BM25 indexes: project_id -> (index, project vector_version it reflects)
+_lexical_indexes: Dict[str, Tuple[BM25Index, Optional[int]]] = {}
+_lexical_lock = threading.Lock()
 
 
 def _list_index_names(client: Pinecone) -> set[str]:
@@ -39,25 +80,22 @@ def _embedding():
 
 @lru_cache(maxsize=1)
 def _pinecone_client() -> Pinecone:
+    """Return the shared Pinecone client (failures raise and are not cached)."""
     api_key = os.getenv("PINECONE_API_KEY", "local-dev-key")
     host = os.getenv("PINECONE_HOST")
-    try:
-        if host:
-            logger.info("Using Pinecone local host: %s", host)
-            return Pinecone(api_key=api_key, host=host)
-        logger.info("Using Pinecone client with default environment")
-        return Pinecone(api_key=api_key)
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("Pinecone client unavailable: %s", exc)
-        return None  # type: ignore[return-value]
+    if host:
+        logger.info("Using Pinecone local host: %s", host)
+        return Pinecone(api_key=api_key, host=host)
+    logger.info("Using Pinecone client with default environment")
+    return Pinecone(api_key=api_key)
 
 
-def _ensure_index(client: Pinecone, dimension: int) -> bool:
+def _ensure_index(client: Pinecone, dimension: int, index_name: str = INDEX_NAME) -> bool:
     if client is None:
         return False
 
     existing = _list_index_names(client)
-    if INDEX_NAME in existing:
+    if index_name in existing:
         return True
 
     try:
@@ -69,40 +107,105 @@ def _ensure_index(client: Pinecone, dimension: int) -> bool:
                 cloud=os.getenv("PINECONE_CLOUD", "aws"),
                 region=os.getenv("PINECONE_REGION", "us-east-1"),
             )
-        logger.info("Creating Pinecone index '%s' (dim=%s)", INDEX_NAME, dimension)
-        client.create_index(name=INDEX_NAME, dimension=dimension, metric=DEFAULT_METRIC, spec=spec)
+        logger.info("Creating Pinecone index '%s' (dim=%s)", index_name, dimension)
+        client.create_index(name=index_name, dimension=dimension, metric=DEFAULT_METRIC, spec=spec)
         return True
     except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("Failed to ensure Pinecone index '%s': %s", INDEX_NAME, exc)
+        logger.warning("Failed to ensure Pinecone index '%s': %s", index_name, exc)
         return False
 
 
-@lru_cache(maxsize=16)
-def _vector_store(namespace: str) -> PineconeVectorStore | None:
-    """Return a vector store bound to a namespace."""
-    try:
-        embedding = _embedding()
-        dimension = get_embedding_dimension(embedding)
-        client = _pinecone_client()
-        if client is None:
-            logger.info("Vector store unavailable: Pinecone client not initialized.")
-            return None
+def _local_root(index_name: str) -> str:
+    if index_name == INDEX_NAME:
+        return LOCAL_VECTOR_DIR
+    return os.path.join(LOCAL_VECTOR_DIR, "_indexes", index_name)
 
-        if not _ensure_index(client, dimension):
-            logger.info("Vector store unavailable: index creation/listing failed.")
-            return None
 
-        host = os.getenv("PINECONE_HOST")
-        index = client.Index(INDEX_NAME, host=host) if host else client.Index(INDEX_NAME)
-        return PineconeVectorStore(
-            index=index,
+def _build_vector_store(index_name: str) -> VectorStore:
+    """Create the store handle for an index, running the readiness checks once."""
+    if VECTOR_BACKEND == "local":
+        return LocalVectorStore(
+            embedding=_embedding(),
+            root_dir=_local_root(index_name),
+            quantization=LOCAL_VECTOR_QUANTIZATION,
+            rescore_factor=int(os.getenv("LOCAL_VECTOR_RESCORE_FACTOR", "0")) or None,
+            compact_ratio=float(os.getenv("LOCAL_VECTOR_COMPACT_RATIO", "0.25")),
+            compact_min_rows=int(os.getenv("LOCAL_VECTOR_COMPACT_MIN_ROWS", "4096")),
+        )
+
+    embedding = _embedding()
+    dimension = get_embedding_dimension(embedding)
+    client = _pinecone_client()
+    if not _ensure_index(client, dimension, index_name):
+        raise RuntimeError(f"index '{index_name}' could not be listed or created")
+
+    if PINECONE_TRANSPORT == "grpc":
+        return PineconeDataPlaneStore(
+            index=grpc_index(index_name),
             embedding=embedding,
-            namespace=namespace,
-            text_key="text",
+            upsert_batch_size=int(os.getenv("PINECONE_UPSERT_BATCH_SIZE", "100")),
+            max_in_flight=int(os.getenv("PINECONE_MAX_IN_FLIGHT", "8")),
         )
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("Vector store unavailable for namespace %s: %s", namespace, exc)
-        return None
+
+    host = os.getenv("PINECONE_HOST")
+    index = client.Index(index_name, host=host) if host else client.Index(index_name)
+    # No default namespace: every call passes the project's namespace explicitly
+    return PineconeVectorStore(index=index, embedding=embedding, text_key="text")
+
+
+def grpc_index(index_name: str = INDEX_NAME) -> Any:
+    """
+    Return a gRPC data-plane handle for an index.
+
+    The data-plane host comes from ``describe_index``; for local Pinecone
+    (``PINECONE_HOST=http://...``) the channel is opened without TLS.
+    """
+    if PineconeGRPC is None:
+        raise RuntimeError('PINECONE_TRANSPORT=grpc requires the gRPC extra: pip install "pinecone[grpc]"')
+    api_key = os.getenv("PINECONE_API_KEY", "local-dev-key")
+    control_host = os.getenv("PINECONE_HOST")
+    index_host = _pinecone_client().describe_index(index_name).host
+    secure = not (control_host or "").startswith("http://")
+    client = PineconeGRPC(api_key=api_key, host=control_host) if control_host else PineconeGRPC(api_key=api_key)
+    logger.info("Using Pinecone gRPC data plane for index %s at %s (tls=%s)", index_name, index_host, secure)
+    return client.Index(host=index_host, grpc_config=GRPCClientConfig(secure=secure))
+
+
+def _vector_store(index_name: str = INDEX_NAME) -> VectorStore | None:
+    """
+    Return the shared, namespace-agnostic store for an index, or None while it is unavailable.
+
+    A failed build is remembered for ``VECTOR_STORE_RETRY_SECONDS`` so a broken backend is
+    not probed on every request, then retried.
+    """
+    with _stores_lock:
+        store = _stores.get(index_name)
+        if store is not None:
+            return store
+        failed_at = _store_failures.get(index_name)
+        retry_after = float(os.getenv("VECTOR_STORE_RETRY_SECONDS", "30"))
+        if failed_at is not None and time.monotonic() - failed_at < retry_after:
+            return None
+        try:
+            store = _build_vector_store(index_name)
+        except Exception as exc:
+            _store_failures[index_name] = time.monotonic()
+            logger.warning("Vector store unavailable for index %s (retry in %ss): %s", index_name, retry_after, exc)
+            return None
+        _stores[index_name] = store
+        _store_failures.pop(index_name, None)
+        logger.info("Vector store ready for index %s (backend=%s)", index_name, VECTOR_BACKEND)
+        return store
+
+
+def get_vector_store(index_name: Optional[str] = None) -> VectorStore | None:
+    """Return the shared store for ``index_name`` (default ``PINECONE_INDEX_NAME``); pass namespaces per call."""
+    return _vector_store(index_name or INDEX_NAME)
+
+
+def project_namespace(project_id: str, suffix: Optional[str] = None) -> str:
+    """Namespace holding a project's vectors (``VECTOR_NAMESPACE_SUFFIX`` unless overridden)."""
+    return f"{project_id}{VECTOR_NAMESPACE_SUFFIX if suffix is None else suffix}"
 
 
 def _build_payload(summary: str, keywords: Iterable[str], insights: Iterable[str]) -> str:
@@ -116,52 +219,432 @@ def _build_payload(summary: str, keywords: Iterable[str], insights: Iterable[str
     return "\n".join(parts).strip()
 
 
-def upsert_research_output(project_id: str, chat_id: str, summary: str, keywords: Any, insights: Any) -> None:
-    """Upsert a research output into the Pinecone namespace for a project."""
-    namespace = str(project_id)
-    payload_text = _build_payload(summary, keywords or [], insights or [])
-    if not payload_text:
+def _chunk_ids(chat_id: str, count: int) -> List[str]:
+    return [f"{chat_id}:{idx}" for idx in range(count)]
+
+
+def research_chunks(
+    project_id: str,
+    chat_id: str,
+    summary: str,
+    keywords: Any,
+    insights: Any,
+    markdown: str = "",
+    references: Any = None,
+) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Split a research output into ``(id, text, metadata)`` chunks.
+
+    Chunks get stable ids ``chat_id:n`` and a ``chunk_hash`` in their metadata.
+    """
+    payload_text = (markdown or "").strip() or _build_payload(summary, keywords or [], insights or [])
+    if references and not markdown:
+        payload_text = "\n".join(part for part in [payload_text, format_references(references)] if part)
+    chunks = chunk_text(payload_text)
+    return [
+        (
+            chunk_id,
+            chunk,
+            {"chat_id": chat_id, "project_id": project_id, "chunk_index": idx, "chunk_hash": chunk_hash(chunk)},
+        )
+        for idx, (chunk_id, chunk) in enumerate(zip(_chunk_ids(chat_id, len(chunks)), chunks))
+    ]
+
+
+def research_output_chunks(doc: Dict[str, Any]) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """Chunks for a stored research output document."""
+    structured = doc.get("structured") or {}
+    return research_chunks(
+        project_id=doc.get("project_id", ""),
+        chat_id=doc.get("chat_id", ""),
+        summary=doc.get("summary") or structured.get("summary", ""),
+        keywords=structured.get("keywords", []),
+        insights=structured.get("insights", []),
+        markdown=doc.get("markdown", ""),
+        references=structured.get("references"),
+    )
+
+
+def stale_chunk_ids(chat_id: str, previous: Dict[str, str], manifest: Dict[str, str]) -> List[str]:
+    """Ids indexed by a previous save that the new manifest no longer contains."""
+    stale = [chunk_id for chunk_id in previous if chunk_id not in manifest]
+    if not previous:
+        stale.append(chat_id)  # single-vector id used before chunking
+    return stale
+
+
+ResearchChunks = List[Tuple[str, str, Dict[str, Any]]]
+
+
+def _index_research_chunks(store: VectorStore, items: List[Tuple[str, str, ResearchChunks, Dict[str, str]]]) -> None:
+    """
+    Upsert changed chunks and delete stale ones for ``(project_id, chat_id, chunks, previous)`` items.
+
+    Changed chunks from every item are grouped by namespace and written in batches of
+    ``VECTOR_UPSERT_BATCH_SIZE``; stale ids are deleted with one call per namespace. Chunks of
+    a chat whose research output was deleted while they were written are removed again.
+    """
+    batch_size = max(1, int(os.getenv("VECTOR_UPSERT_BATCH_SIZE", "64")))
+    changed: Dict[str, ResearchChunks] = {}
+    stale: Dict[str, List[str]] = {}
+    manifests: List[Tuple[str, str, ResearchChunks, Dict[str, str]]] = []
+    for project_id, chat_id, chunks, previous in items:
+        namespace = project_namespace(project_id)
+        manifest = {chunk_id: metadata["chunk_hash"] for chunk_id, _, metadata in chunks}
+        chat_changed = [chunk for chunk in chunks if previous.get(chunk[0]) != chunk[2]["chunk_hash"]]
+        chat_stale = stale_chunk_ids(chat_id, previous, manifest)
+        changed.setdefault(namespace, []).extend(chat_changed)
+        stale.setdefault(namespace, []).extend(chat_stale)
+        manifests.append((project_id, chat_id, chunks, manifest))
+        logger.info(
+            "Upserting research chunks (namespace=%s, chat_id=%s): %s total, %s changed, %s stale",
+            namespace,
+            chat_id,
+            len(chunks),
+            len(chat_changed),
+            len(chat_stale),
+        )
+
+    for namespace, chunks in changed.items():
+        for start in range(0, len(chunks), batch_size):
+            batch = chunks[start : start + batch_size]
+            store.add_texts(
+                [text for _, text, _ in batch],
+                metadatas=[metadata for _, _, metadata in batch],
+                ids=[chunk_id for chunk_id, _, _ in batch],
+                namespace=namespace,
+            )
+    for namespace, ids in stale.items():
+        if ids:
+            store.delete(ids=ids, namespace=namespace)
+    orphaned: Dict[str, List[str]] = {}
+    for project_id, chat_id, chunks, manifest in manifests:
+        if not research_repository.set_vector_manifest(chat_id, manifest):
+            orphaned.setdefault(project_namespace(project_id), []).extend(manifest)
+        _project_vectors_changed(project_id, chat_id, chunks)
+    for namespace, ids in orphaned.items():
+        logger.info("Removing %s chunks of deleted chats from namespace=%s", len(ids), namespace)
+        store.delete(ids=ids, namespace=namespace)
+
+
+def upsert_research_output(
+    project_id: str,
+    chat_id: str,
+    summary: str,
+    keywords: Any,
+    insights: Any,
+    markdown: str = "",
+    references: Any = None,
+) -> None:
+    """
+    Chunk a research output and upsert the changed chunks into the project's namespace.
+
+    The chunk hashes from the previous save (kept on the research output document) decide
+    which chunks are re-embedded and which trailing chunks are deleted.
+    """
+    namespace = project_namespace(project_id)
+    chunks = research_chunks(project_id, chat_id, summary, keywords, insights, markdown, references)
+    if not chunks:
         logger.info("Skipping vector upsert: no payload text for chat_id=%s", chat_id)
         return
 
-    store = _vector_store(namespace)
+    store = _vector_store()
     if not store:
         logger.info("Skipping vector upsert: vector store unavailable for namespace %s", namespace)
         return
+    _index_research_chunks(store, [(project_id, chat_id, chunks, research_repository.get_vector_manifest(chat_id))])
+
+
+def index_research_outputs(docs: List[Dict[str, Any]]) -> int:
+    """
+    Index stored research output documents in one batched pass; return how many were indexed.
+
+    Each document's ``vector_chunks`` manifest decides which chunks are re-embedded.
+    Raises when the vector store is unavailable or a write fails, so callers can retry.
+    """
+    items = []
+    for doc in docs:
+        chunks = research_output_chunks(doc)
+        if chunks and doc.get("project_id") and doc.get("chat_id"):
+            items.append((doc["project_id"], doc["chat_id"], chunks, dict(doc.get("vector_chunks") or {})))
+    if not items:
+        return 0
+    store = _vector_store()
+    if store is None:
+        raise RuntimeError("vector store unavailable")
+    _index_research_chunks(store, items)
+    return len(items)
+
+
+@lru_cache(maxsize=1)
+def _retrieval_cache() -> Optional[CacheStore]:
+    """Cache of retrieval results; entries are keyed by the project's vector version."""
+    backend = os.getenv("RETRIEVAL_CACHE_BACKEND", "memory").lower()
+    if backend == "off":
+        return None
+    return get_cache_store(
+        "retrieval_cache",
+        ttl_seconds=float(os.getenv("RETRIEVAL_CACHE_TTL_SECONDS", "3600")),
+        max_entries=int(os.getenv("RETRIEVAL_CACHE_MAX_ENTRIES", "256")),
+        backend=backend,
+    )
+
+
+def _vector_version(project_id: str) -> Optional[int]:
+    try:
+        return project_repository.get_vector_version(str(project_id))
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Vector version unavailable for project %s; skipping version checks: %s", project_id, exc)
+        return None
+
 
-    metadata = {"chat_id": chat_id, "project_id": project_id}
-    logger.info("Upserting research output into vector store (namespace=%s, chat_id=%s)", namespace, chat_id)
-    store.add_texts([payload_text], metadatas=[metadata], ids=[chat_id])
+def _retrieval_cache_key(namespace: str, version: int, query: str, k: int) -> str:
+    normalized_query = " ".join((query or "").lower().split())
+    material = json.dumps([namespace, version, RETRIEVAL_MODE, normalized_query, k])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _project_vectors_changed(
+    project_id: str, chat_id: str, chunks: Optional[List[Tuple[str, str, Dict[str, Any]]]] = None
+) -> None:
+    """
+    Record a vector write for a project.
+
+    Bumping the project's vector version invalidates every cached retrieval for it (in
+    all processes). The in-process BM25 index is patched when it was current before this
+    write and dropped otherwise, so it is rebuilt from Mongo on the next query.
+    """
+    key = str(project_id)
+    try:
+        version: Optional[int] = project_repository.bump_vector_version(key)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Could not bump vector version for project %s: %s", key, exc)
+        version = None
+
+    with _lexical_lock:
+        entry = _lexical_indexes.get(key)
+        if entry is None:
+            return
+        index, indexed_version = entry
+        if version is not None and indexed_version is not None and indexed_version != version - 1:
+            del _lexical_indexes[key]
+            return
+        _lexical_indexes[key] = (index, version)
+    index.remove_chat(chat_id)
+    for chunk_id, text, metadata in chunks or []:
+        index.add(chunk_id, text, metadata)
+
+
+def invalidate_project_vectors(project_id: str) -> None:
+    """Invalidate cached retrievals and the BM25 index after an out-of-band vector rebuild."""
+    key = str(project_id)
+    try:
+        project_repository.bump_vector_version(key)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Could not bump vector version for project %s: %s", key, exc)
+    with _lexical_lock:
+        _lexical_indexes.pop(key, None)
+
+
+def _lexical_index(project_id: str, version: Optional[int] = None) -> BM25Index:
+    """
+    Return the project's BM25 index, building it from Mongo when missing or stale.
+
+    Writes in this process patch it in place; writes from other processes change the
+    project's vector version, which triggers a rebuild here.
+    """
+    key = str(project_id)
+    with _lexical_lock:
+        entry = _lexical_indexes.get(key)
+    if entry and (version is None or entry[1] == version):
+        return entry[0]
+
+    started = time.perf_counter()
+    index = BM25Index()
+    for doc in research_repository.list_indexable_research_outputs(key):
+        for chunk_id, text, metadata in research_output_chunks(doc):
+            index.add(chunk_id, text, metadata)
+    with _lexical_lock:
+        _lexical_indexes[key] = (index, version)
+    logger.info(
+        "Built lexical index for project %s: %s chunks in %.1f ms",
+        key,
+        len(index),
+        (time.perf_counter() - started) * 1000,
+    )
+    return index
+
+
+def _document_key(doc: Document) -> str:
+    if doc.id:
+        return str(doc.id)
+    meta = doc.metadata or {}
+    if "chunk_index" in meta:
+        return f"{meta.get('chat_id')}:{meta['chunk_index']}"
+    return str(meta.get("chat_id") or hash(doc.page_content))
+
+
+def _scored(results: List[Tuple[Document, float]], field: str) -> List[Document]:
+    """Copy each search score into the document metadata under ``field``."""
+    for doc, score in results:
+        doc.metadata[field] = round(float(score), 4)
+    return [doc for doc, _ in results]
+
+
+def _fuse_rankings(rankings: List[Tuple[List[Document], float]], k: int) -> List[Document]:
+    """Weighted reciprocal rank fusion of several ranked lists (robust to their score scales)."""
+    fused: Dict[str, float] = {}
+    documents: Dict[str, Document] = {}
+    for docs, weight in rankings:
+        for rank, doc in enumerate(docs):
+            key = _document_key(doc)
+            if key in documents:
+                documents[key].metadata.update(doc.metadata)  # keep every retriever's score
+            else:
+                documents[key] = doc
+            fused[key] = fused.get(key, 0.0) + weight / (_RRF_K + rank + 1)
+    ordered = sorted(fused, key=fused.get, reverse=True)
+    for key in ordered:
+        documents[key].metadata["fused_score"] = round(fused[key], 6)
+    return [documents[key] for key in ordered[:k]]
+
+
+def _hybrid_search(
+    store: VectorStore, namespace: str, project_id: str, query: str, k: int, version: Optional[int] = None
+) -> List[Document]:
+    candidates = max(k * 3, int(os.getenv("HYBRID_CANDIDATES", "24")))
+    dense_weight = float(os.getenv("HYBRID_DENSE_WEIGHT", "1.0"))
+    lexical_weight = float(os.getenv("HYBRID_LEXICAL_WEIGHT", "1.0"))
+
+    started = time.perf_counter()
+    dense = _scored(store.similarity_search_with_score(query, k=candidates, namespace=namespace), "dense_score")
+    dense_ms = (time.perf_counter() - started) * 1000
+
+    lexical_docs: List[Document] = []
+    try:
+        lexical = _lexical_index(project_id, version)
+        for doc_id, score in lexical.search(query, candidates):
+            doc = lexical.document(doc_id)
+            if doc is not None:
+                doc.metadata["bm25_score"] = round(score, 4)
+                lexical_docs.append(doc)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Lexical retrieval failed for project %s; using dense results only: %s", project_id, exc)
+    lexical_ms = (time.perf_counter() - started) * 1000 - dense_ms
+
+    fused = _fuse_rankings([(dense, dense_weight), (lexical_docs, lexical_weight)], candidates)
+    reranked = rerank_documents(query, fused)[:k]
+    logger.info(
+        "Hybrid retrieval for project %s: %s dense + %s lexical -> %s docs "
+        "(dense %.1f ms, lexical %.1f ms, total %.1f ms)",
+        project_id,
+        len(dense),
+        len(lexical_docs),
+        len(reranked),
+        dense_ms,
+        lexical_ms,
+        (time.perf_counter() - started) * 1000,
+    )
+    return reranked
 
 
 def query_project_documents(project_id: str, query: str, k: int = 8) -> list[Document]:
-    """Retrieve similar documents for a project namespace."""
-    namespace = str(project_id)
-    store = _vector_store(namespace)
+    """
+    Retrieve relevant documents for a project namespace.
+
+    In hybrid mode, dense similarity and BM25 keyword rankings are fused and optionally
+    reranked by a local cross-encoder (``RERANK_MODEL``). Retriever scores are returned in
+    the document metadata (``dense_score``, ``bm25_score``, ``fused_score``).
+
+    Results are cached per (namespace, vector version, normalized query, k); any research
+    vector write for the project bumps the version, so cached results are never stale. The
+    version is also read in hybrid mode without the cache, so the in-process BM25 index is
+    rebuilt after writes from other processes (queue worker, reindex CLI). Cached entries
+    are copied in and out, so callers may modify the returned documents.
+    """
+    namespace = project_namespace(project_id)
+    store = _vector_store()
     if not store:
         logger.info("Vector retrieval skipped: vector store unavailable for namespace %s", namespace)
         return []
 
+    cache = _retrieval_cache()
+    version = _vector_version(project_id) if cache or RETRIEVAL_MODE == "hybrid" else None
+    cache_key = _retrieval_cache_key(namespace, version, query, k) if cache and version is not None else None
+    cached = cache.get(cache_key) if cache_key else None
+    if cached is not None:
+        logger.info("Retrieval cache hit for namespace=%s (%s documents)", namespace, len(cached))
+        return [
+            Document(id=entry["id"], page_content=entry["page_content"], metadata=copy.deepcopy(entry["metadata"]))
+            for entry in cached
+        ]
+
     try:
-        retriever = store.as_retriever(search_type="similarity", search_kwargs={"k": k})
-        docs = retriever.invoke(query)
-        logger.info("Retrieved %s vector documents for namespace=%s", len(docs), namespace)
-        return docs
+        if RETRIEVAL_MODE == "hybrid":
+            docs = _hybrid_search(store, namespace, str(project_id), query, k, version)
+        else:
+            docs = _scored(store.similarity_search_with_score(query, k=k, namespace=namespace), "dense_score")
+            logger.info("Retrieved %s vector documents for namespace=%s", len(docs), namespace)
     except Exception as exc:  # pragma: no cover - defensive
         logger.warning("Vector retrieval failed for namespace %s: %s", namespace, exc)
         return []
 
+    if cache_key:
+        entries = [
+            {"id": doc.id, "page_content": doc.page_content, "metadata": copy.deepcopy(doc.metadata)} for doc in docs
+        ]
+        cache.set(cache_key, entries)
+    return docs
 
-def delete_chat_vectors(project_id: str, chat_id: str) -> None:
-    """Remove vectors for a chat from the project's namespace."""
-    namespace = str(project_id)
-    store = _vector_store(namespace)
-    if not store:
-        logger.info("Skipping vector delete: vector store unavailable for namespace %s", namespace)
-        return
 
+def retrieve_project_context(project_id: str, query: str, k: Optional[int] = None) -> list[Document]:
+    """
+    Retrieve candidates for a project and prune them to prompt-ready context.
+
+    ``CONTEXT_CANDIDATES`` chunks are retrieved, then :func:`select_context` keeps the
+    distinct, relevant ones within the ``CONTEXT_TOKEN_BUDGET``.
+    """
+    candidates = int(os.getenv("CONTEXT_CANDIDATES", "16"))
+    docs = query_project_documents(project_id, query, k=max(candidates, k or 0))
+    if not docs:
+        return []
+    try:
+        return select_context(query, docs, _embedding(), max_documents=k)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Context selection failed for project %s; using top %s documents: %s", project_id, k or 8, exc)
+        return docs[: k or 8]
+
+
+def delete_research_vectors(items: List[Tuple[str, str, Optional[List[str]]]]) -> None:
+    """
+    Delete the vectors of several chats given as ``(project_id, chat_id, chunk ids)``.
+
+    The given ids (captured when the chat was deleted) are combined with the chat's manifest
+    as it is now, so chunks written by an upsert that finished in between are removed too.
+    Pinecone deletes are grouped into one call per namespace; the local index deletes by
+    ``chat_id`` metadata. Raises on failure.
+    """
+    store = _vector_store()
+    if store is None:
+        raise RuntimeError("vector store unavailable")
+    by_namespace: Dict[str, List[str]] = {}
+    for project_id, chat_id, ids in items:
+        namespace = project_namespace(project_id)
+        if isinstance(store, LocalVectorStore):
+            store.delete(filter={"chat_id": chat_id}, namespace=namespace)
+            continue
+        chunk_ids = dict.fromkeys([*(ids or []), *research_repository.get_vector_manifest(chat_id), chat_id])
+        by_namespace.setdefault(namespace, []).extend(chunk_ids)
+    for namespace, ids in by_namespace.items():
+        store.delete(ids=ids, namespace=namespace)
+    for project_id, chat_id, _ in items:
+        logger.info("Deleted vector entries for chat_id=%s in namespace=%s", chat_id, project_namespace(project_id))
+        _project_vectors_changed(project_id, chat_id)
+
+
+def delete_chat_vectors(project_id: str, chat_id: str, ids: Optional[List[str]] = None) -> None:
+    """Remove every chunk vector for a chat from the project's namespace."""
     try:
-        store.delete(ids=[chat_id])
-        logger.info("Deleted vector entry for chat_id=%s in namespace=%s", chat_id, namespace)
+        delete_research_vectors([(project_id, chat_id, ids)])
     except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("Vector delete failed for chat_id=%s namespace=%s: %s", chat_id, namespace, exc)
+        logger.warning("Vector delete failed for chat_id=%s project=%s: %s", chat_id, project_id, exc)
@@ -0,0 +1,74 @@
+"""Shared background event loop for driving async agents from sync callers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Coroutine, Optional, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_http_clients_lock = threading.Lock()
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the process-wide event loop, starting its thread on first use.
+
+    Keeping a single long-lived loop lets async clients (HTTP pools, model
+    clients) be reused across calls and lets many generations share one loop.
+    """
+    global _loop
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_run_loop, args=(_loop,), name="async-runner", daemon=True)
+            thread.start()
+            logger.info("Started background event loop for async agents.")
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the shared loop and block until it completes."""
+    future = asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+    return future.result(timeout=timeout)
+
+
+def http_pool_limits() -> httpx.Limits:
+    """Keep-alive pool limits for provider HTTP clients (tunable via env)."""
+    return httpx.Limits(
+        max_connections=int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "20")),
+        max_keepalive_connections=int(os.getenv("LLM_POOL_MAX_KEEPALIVE", "10")),
+        keepalive_expiry=float(os.getenv("LLM_POOL_KEEPALIVE_SECONDS", "30")),
+    )
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Return the pooled ``httpx.AsyncClient`` for the running event loop.
+
+    An async client is bound to the loop it first runs on, so one is kept per loop and
+    reused by every call on it; connections stay open between requests.
+    """
+    loop = asyncio.get_running_loop()
+    with _http_clients_lock:
+        client = _http_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(limits=http_pool_limits())
+            _http_clients[loop] = client
+        return client
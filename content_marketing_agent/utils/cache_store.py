@@ -0,0 +1,246 @@
+"""Bounded TTL/LRU key-value caches with optional file or Mongo persistence."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "content_blitz_cache.sqlite3")
+_TRIM_EVERY = 50  # persistent stores are trimmed every N writes, not on every write
+
+_stores: Dict[str, "CacheStore"] = {}
+_stores_lock = threading.Lock()
+
+
+class _SqliteBackend:
+    """Single-file persistence; one table per cache name."""
+
+    def __init__(self, name: str, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._table = f"cache_{name}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {self._table}_accessed ON {self._table} (accessed_at)")
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self._table} WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row:
+                self._conn.execute(f"UPDATE {self._table} SET accessed_at = ? WHERE key = ?", (now, key))
+        return (row[0], row[1]) if row else None
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self._table} (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, time.time()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+
+    def trim(self, max_entries: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self._table} WHERE expires_at <= ?", (time.time(),))
+            self._conn.execute(
+                f"DELETE FROM {self._table} WHERE key NOT IN "
+                f"(SELECT key FROM {self._table} ORDER BY accessed_at DESC LIMIT ?)",
+                (max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self._table}")
+
+
+class _MongoBackend:
+    """Mongo persistence through the cache repository (TTL index handles expiry)."""
+
+    def __init__(self, collection: str) -> None:
+        from content_marketing_agent.data_access import cache_repository
+
+        self._repo = cache_repository
+        self._collection = collection
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        doc = self._repo.get_entry(self._collection, key)
+        if not doc:
+            return None
+        return doc["value"], (doc["expires_at"] - datetime.utcnow()).total_seconds() + time.time()
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        ttl = max(0.0, expires_at - time.time())
+        self._repo.put_entry(self._collection, key, value, datetime.utcnow() + timedelta(seconds=ttl))
+
+    def delete(self, key: str) -> None:
+        self._repo.delete_entry(self._collection, key)
+
+    def trim(self, max_entries: int) -> None:
+        self._repo.trim_entries(self._collection, max_entries)
+
+    def clear(self) -> None:
+        self._repo.clear_entries(self._collection)
+
+
+class CacheStore:
+    """
+    Thread-safe cache with TTL, LRU size limit and hit/miss counters.
+
+    An in-process LRU sits in front of an optional persistent backend ("file" for
+    SQLite, "mongo" for the ``<name>`` collection). Values must be JSON-serializable and
+    are shared between callers, so treat returned values as read-only.
+    Backend failures are logged and treated as misses so callers never fail on cache I/O.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        max_entries: int,
+        backend: str = "memory",
+        memory_entries: Optional[int] = None,
+    ) -> None:
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        # The in-process LRU may be smaller than the persistent store for large values
+        self.memory_entries = max(1, memory_entries or max_entries)
+        self.backend_name = backend
+        self._memory: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._backend = self._make_backend(backend)
+
+    def _make_backend(self, backend: str):
+        try:
+            if backend == "file":
+                return _SqliteBackend(self.name, os.getenv("CACHE_PATH", DEFAULT_CACHE_PATH))
+            if backend == "mongo":
+                return _MongoBackend(self.name)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Cache '%s': %s backend unavailable (%s); using memory only.", self.name, backend, exc)
+        return None
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._memory.move_to_end(key)
+                    self._hits += 1
+                    return entry[0]
+                del self._memory[key]
+
+        stored = self._backend_call("get", key) if self._backend else None
+        with self._lock:
+            if stored is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            value = json.loads(stored[0])
+            self._remember(key, value, stored[1])
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._remember(key, value, expires_at)
+            self._writes += 1
+            trim = self._writes % _TRIM_EVERY == 0
+        if self._backend:
+            self._backend_call("set", key, json.dumps(value), expires_at)
+            if trim:
+                self._backend_call("trim", self.max_entries)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+        if self._backend:
+            self._backend_call("delete", key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self._backend:
+            self._backend_call("clear")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": self.backend_name,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits / lookups) if lookups else 0.0,
+                "size": len(self._memory),
+            }
+
+    def _remember(self, key: str, value: Any, expires_at: float) -> None:
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _backend_call(self, method: str, *args: Any) -> Any:
+        try:
+            return getattr(self._backend, method)(*args)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Cache '%s': %s backend %s failed: %s", self.name, self.backend_name, method, exc)
+            return None
+
+
+def get_cache_store(
+    name: str,
+    ttl_seconds: float,
+    max_entries: int,
+    backend: Optional[str] = None,
+    memory_entries: Optional[int] = None,
+) -> CacheStore:
+    """
+    Return the process-wide cache store registered under ``name``, creating it on first use.
+
+    ``backend`` is one of "memory", "file" or "mongo"; it defaults to ``CACHE_BACKEND`` (file).
+    """
+    with _stores_lock:
+        store = _stores.get(name)
+        if store is None:
+            resolved = (backend or os.getenv("CACHE_BACKEND", "file")).lower()
+            store = CacheStore(
+                name,
+                ttl_seconds=ttl_seconds,
+                max_entries=max_entries,
+                backend=resolved,
+                memory_entries=memory_entries,
+            )
+            _stores[name] = store
+            logger.info("Cache '%s' initialized (backend=%s, ttl=%ss, max=%s)", name, resolved, ttl_seconds, max_entries)
+        return store
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return hit/miss statistics for every registered cache store."""
+    with _stores_lock:
+        stores = list(_stores.values())
+    return {store.name: store.stats() for store in stores}
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import logging
 import os
-from typing import List
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_core.embeddings import Embeddings
 
+from content_marketing_agent.utils.cache_store import CacheStore, get_cache_store
+from content_marketing_agent.utils.local_embeddings import get_local_embeddings
+
 try:
     from langchain_openai import OpenAIEmbeddings
 except Exception:  # pragma: no cover - optional dependency
@@ -34,30 +43,287 @@ class StubEmbeddings(Embeddings):
         return [0.0] * self.dimension
 
 
+class CachedEmbeddings(Embeddings):
+    """
+    Content-addressed cache in front of another embedding model.
+
+    Vectors are keyed by (model, dimension, kind, text hash), so unchanged texts and repeated
+    queries skip the provider round trip; only cache misses are sent, in one batch. Queries
+    and documents are cached apart because providers may embed them differently.
+    """
+
+    def __init__(self, inner: Embeddings, model_name: str, dimension: int, store: CacheStore) -> None:
+        self.inner = inner
+        self.model_name = model_name
+        self.dimension = dimension
+        self._store = store
+
+    def _key(self, text: str, kind: str = "d") -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{self.dimension}:{kind}:{digest}"
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors: Dict[str, List[float]] = {}
+        misses: List[str] = []
+        for text in dict.fromkeys(texts):
+            cached = self._store.get(self._key(text))
+            if cached is not None:
+                vectors[text] = cached
+            else:
+                misses.append(text)
+
+        if misses:
+            for text, vector in zip(misses, self.inner.embed_documents(misses)):
+                vector = list(vector)
+                self._store.set(self._key(text), vector)
+                vectors[text] = vector
+        return [vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key(text, kind="q")
+        cached = self._store.get(key)
+        if cached is not None:
+            return cached
+        vector = list(self.inner.embed_query(text))
+        self._store.set(key, vector)
+        return vector
+
+
+class MicroBatchingEmbeddings(Embeddings):
+    """
+    Coalesce concurrent embedding calls into shared provider requests.
+
+    Each call is queued; a dispatcher thread gathers the calls arriving within ``window_ms``
+    of the first one (or until ``max_batch_size`` texts are waiting), embeds their distinct
+    texts in one batch and hands every caller its own vectors. Up to ``max_concurrency``
+    batches are in flight at once. Documents and queries are gathered in separate lanes so
+    they never share a batch: with ``query_as_documents`` (providers whose ``embed_query``
+    is ``embed_documents`` on one text) a query batch is one ``embed_documents`` request,
+    otherwise it calls the inner ``embed_query`` per distinct text, keeping the provider's
+    query path (instructions, prefixes). :meth:`close` stops the dispatchers and the pool.
+    """
+
+    def __init__(
+        self,
+        inner: Embeddings,
+        window_ms: float = 5.0,
+        max_batch_size: int = 64,
+        max_concurrency: int = 4,
+        query_as_documents: bool = False,
+    ) -> None:
+        self.inner = inner
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self.query_as_documents = query_as_documents
+        self._requests: Dict[str, "queue.Queue[Optional[Tuple[List[str], Future]]]"] = {
+            "documents": queue.Queue(),
+            "queries": queue.Queue(),
+        }
+        self._closed = False
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="embedding-batch")
+        self._counters = {"calls": 0, "texts": 0, "batches": 0}
+        self._counters_lock = threading.Lock()
+        self._dispatchers = [
+            threading.Thread(target=self._dispatch, args=(kind,), name=f"embedding-batcher-{kind}", daemon=True)
+            for kind in self._requests
+        ]
+        for dispatcher in self._dispatchers:
+            dispatcher.start()
+
+    def _dispatch(self, kind: str) -> None:
+        requests = self._requests[kind]
+        carry: Optional[Tuple[List[str], Future]] = None
+        stopping = False
+        while not stopping:
+            first = carry or requests.get()
+            carry = None
+            if first is None:
+                break
+            batch, size = [first], len(first[0])
+            deadline = time.monotonic() + self.window
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True  # dispatch what was gathered, then exit
+                    break
+                if size + len(request[0]) > self.max_batch_size:
+                    carry = request  # starts the next batch instead of overfilling this one
+                    break
+                batch.append(request)
+                size += len(request[0])
+            self._pool.submit(self._run, kind, batch)
+
+    def _embed(self, kind: str, texts: List[str]) -> List[List[float]]:
+        if kind == "documents" or self.query_as_documents:
+            return self.inner.embed_documents(texts)
+        return [self.inner.embed_query(text) for text in texts]
+
+    def _run(self, kind: str, batch: List[Tuple[List[str], Future]]) -> None:
+        texts = list(dict.fromkeys(text for texts, _ in batch for text in texts))
+        try:
+            vectors = dict(zip(texts, self._embed(kind, texts)))
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        with self._counters_lock:
+            self._counters["batches"] += 1
+        logger.debug("Embedding %s batch: %s calls, %s distinct texts", kind, len(batch), len(texts))
+        for texts_for_call, future in batch:
+            future.set_result([vectors[text] for text in texts_for_call])
+
+    def _submit(self, kind: str, texts: List[str]) -> List[List[float]]:
+        if self._closed:
+            return self._embed(kind, texts)
+        with self._counters_lock:
+            self._counters["calls"] += 1
+            self._counters["texts"] += len(texts)
+        future: Future = Future()
+        self._requests[kind].put((texts, future))
+        return future.result()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return self._submit("documents", list(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._submit("queries", [text])[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Calls, texts and provider batches so far; ``calls / batches`` is the coalescing factor."""
+        with self._counters_lock:
+            return dict(self._counters)
+
+    def close(self) -> None:
+        """Finish queued calls and stop the dispatcher threads and batch pool; later calls go direct."""
+        if self._closed:
+            return
+        self._closed = True
+        for requests in self._requests.values():
+            requests.put(None)
+        for dispatcher in self._dispatchers:
+            dispatcher.join()
+        self._pool.shutdown(wait=True)
+        for kind, requests in self._requests.items():
+            while True:  # calls that raced with close() and were queued behind the stop marker
+                try:
+                    request = requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is not None:
+                    self._run(kind, [request])
+
+
+# One batcher per model per process, so repeated get_embedding_model() calls share its threads
+_batchers: Dict[str, MicroBatchingEmbeddings] = {}
+_batchers_lock = threading.Lock()
+
+
+@atexit.register
+def close_batchers() -> None:
+    """Stop every shared :class:`MicroBatchingEmbeddings` (also run at interpreter exit)."""
+    with _batchers_lock:
+        batchers = list(_batchers.values())
+        _batchers.clear()
+    for batcher in batchers:
+        batcher.close()
+
+
+def _with_batching(embedding: Embeddings, model_key: str, query_as_documents: bool = False) -> Embeddings:
+    """
+    Return the process-wide :class:`MicroBatchingEmbeddings` for ``model_key`` (created
+    around ``embedding`` on first use), or ``embedding`` itself when ``EMBEDDING_BATCH_WINDOW_MS=0``.
+    """
+    window_ms = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
+    if window_ms <= 0:
+        return embedding
+    with _batchers_lock:
+        batcher = _batchers.get(model_key)
+        if batcher is None:
+            batcher = MicroBatchingEmbeddings(
+                embedding,
+                window_ms=window_ms,
+                max_batch_size=int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "64")),
+                max_concurrency=int(os.getenv("EMBEDDING_BATCH_CONCURRENCY", "4")),
+                query_as_documents=query_as_documents,
+            )
+            _batchers[model_key] = batcher
+        return batcher
+
+
+def _with_cache(
+    embedding: Embeddings, model_name: str, dimension: int, query_as_documents: bool = False
+) -> Embeddings:
+    """
+    Wrap a real provider with micro-batching and, unless ``EMBEDDING_CACHE_BACKEND=off``,
+    the embedding cache, so only cache misses reach the batcher. ``query_as_documents``
+    marks providers whose query embedding is a one-text document embedding.
+    """
+    embedding = _with_batching(embedding, f"{model_name}:{dimension}", query_as_documents)
+    backend = os.getenv("EMBEDDING_CACHE_BACKEND", os.getenv("CACHE_BACKEND", "file")).lower()
+    if backend == "off":
+        return embedding
+    store = get_cache_store(
+        "embedding_cache",
+        ttl_seconds=float(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", str(30 * 24 * 3600))),
+        max_entries=int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "20000")),
+        backend=backend,
+        memory_entries=int(os.getenv("EMBEDDING_CACHE_MEMORY_ENTRIES", "512")),
+    )
+    return CachedEmbeddings(embedding, model_name=model_name, dimension=dimension, store=store)
+
+
 def get_embedding_model() -> Embeddings:
     """
     Load an embedding model using environment variables.
 
-    Prefers OpenAI embeddings by default; falls back to HuggingFace if requested.
+    Prefers OpenAI embeddings by default; ``USE_LOCAL_EMBEDDINGS=1`` selects the offline
+    ONNX model and ``USE_HF_EMBEDDINGS=1`` HuggingFace. Real providers are wrapped in
+    :class:`MicroBatchingEmbeddings` and :class:`CachedEmbeddings`.
     """
     model_name = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
     use_hf = os.getenv("USE_HF_EMBEDDINGS", "0") == "1"
     dimension = int(os.getenv("EMBEDDING_DIM", "1536"))
 
+    if os.getenv("USE_LOCAL_EMBEDDINGS", "0") == "1":
+        try:
+            local = get_local_embeddings()
+            local_name = f"local/{local.model_dir.name}/{local.model_path.name}"
+            return _with_cache(local, local_name, len(local.embed_query("dimension probe")), query_as_documents=True)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Local embedding model unavailable (%s); trying other providers.", exc)
+
     if use_hf and HuggingFaceEmbeddings:
         logger.info("Loading HuggingFace embeddings: %s", model_name)
-        return HuggingFaceEmbeddings(model_name=model_name)
+        return _with_cache(HuggingFaceEmbeddings(model_name=model_name), f"hf/{model_name}", dimension)
 
     if OpenAIEmbeddings and os.getenv("OPENAI_API_KEY"):
         logger.info("Loading OpenAI embeddings: %s (dim=%s)", model_name, dimension)
-        return OpenAIEmbeddings(model=model_name, dimensions=dimension)
+        return _with_cache(
+            OpenAIEmbeddings(model=model_name, dimensions=dimension),
+            f"openai/{model_name}",
+            dimension,
+            query_as_documents=True,
+        )
 
     logger.warning("Falling back to stub embeddings; configure an embedding provider.")
     return StubEmbeddings(dimension=dimension)
 
 
 def get_embedding_dimension(embedding: Embeddings) -> int:
-    """Infer the dimension of an embedding model (with a safe fallback)."""
+    """
+    Infer the dimension of an embedding model (with a safe fallback).
+
+    With :class:`CachedEmbeddings` the probe vector is cached, so only the first
+    process start against a given model/dimension pays for the call.
+    """
     try:
         return len(embedding.embed_query("dimension probe"))
     except Exception as exc:  # pragma: no cover - defensive
@@ -0,0 +1,89 @@
+"""Persistent LLM response cache for deterministic, opt-in agent calls."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from content_marketing_agent.utils.cache_store import CacheStore, get_cache_store
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache(BaseCache):
+    """
+    LangChain cache adapter over a :class:`CacheStore`.
+
+    LangChain passes the serialized, id-normalized message list as ``prompt`` and the
+    provider/model/parameter fingerprint as ``llm_string``; both are hashed into the key.
+    Generations are stored as plain message dicts rather than revivable LangChain objects.
+    """
+
+    def __init__(self, store: CacheStore) -> None:
+        self._store = store
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        entries = self._store.get(self._key(prompt, llm_string))
+        if entries is None:
+            return None
+        try:
+            generations: list[Generation] = []
+            for entry in entries:
+                info = entry.get("generation_info")
+                if "message" in entry:
+                    message = messages_from_dict([entry["message"]])[0]
+                    generations.append(ChatGeneration(message=message, generation_info=info))
+                else:
+                    generations.append(Generation(text=entry.get("text", ""), generation_info=info))
+            return generations
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("LLM cache entry could not be decoded; ignoring it: %s", exc)
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        entries = []
+        for generation in return_val:
+            entry: Dict[str, Any] = {"generation_info": generation.generation_info}
+            if isinstance(generation, ChatGeneration):
+                entry["message"] = message_to_dict(generation.message)
+            else:
+                entry["text"] = generation.text
+            entries.append(entry)
+        self._store.set(self._key(prompt, llm_string), entries)
+
+    def clear(self, **kwargs: Any) -> None:
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._store.stats()
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Return the shared response cache, or None when ``LLM_CACHE_BACKEND=off``.
+
+    Backend ("memory", "file", "mongo"), TTL and LRU size come from ``LLM_CACHE_*``.
+    """
+    backend = os.getenv("LLM_CACHE_BACKEND", os.getenv("CACHE_BACKEND", "file")).lower()
+    if backend == "off":
+        return None
+    store = get_cache_store(
+        "llm_cache",
+        ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400")),
+        max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000")),
+        backend=backend,
+    )
+    return ResponseCache(store)
+
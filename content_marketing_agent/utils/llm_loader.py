@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import logging
 import os
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
+import httpx
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage
 from langchain_core.outputs import ChatResult, ChatGeneration
 from langchain_openai import ChatOpenAI
 
+from content_marketing_agent.utils.async_runner import get_async_http_client, http_pool_limits
+from content_marketing_agent.utils.llm_cache import get_response_cache
+
 try:
     from langchain_anthropic import ChatAnthropic
 except Exception:  # pragma: no cover - optional dependency
@@ -20,13 +27,27 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     ChatGoogleGenerativeAI = None  # type: ignore
 
+logger = logging.getLogger(__name__)
+
+ModelKey = Tuple[str, str, float, bool]
+
+_registry: Dict[ModelKey, BaseChatModel] = {}
+_registry_lock = threading.Lock()
+_registry_stats = {"hits": 0, "misses": 0}
+
 
 class StubChatModel(BaseChatModel):
     """Minimal chat model used when API keys are missing."""
 
     model_name: str = "stub-model"
 
-    def _generate(self, messages: list[BaseMessage], **kwargs) -> ChatResult:
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
         content = "Stub response: please configure a real LLM provider via environment variables."
         generation = ChatGeneration(message=AIMessage(content=content))
         return ChatResult(generations=[generation])
@@ -36,48 +57,131 @@ class StubChatModel(BaseChatModel):
         return "stub"
 
 
-def get_chat_model(provider: str | None = None, model: Optional[str] = None) -> BaseChatModel:
+class _LoopPooledAsyncClient(httpx.AsyncClient):
+    """
+    Async client for models built once and used from several event loops.
+
+    Requests are sent through :func:`get_async_http_client`, the pooled client of the loop
+    making the call, so no connection is shared across loops; this client opens none itself.
+    """
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        return await get_async_http_client().send(request, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _openai_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """HTTP clients shared by every OpenAI chat model: one sync pool, async pools per loop."""
+    return httpx.Client(limits=http_pool_limits()), _LoopPooledAsyncClient()
+
+
+def _resolve_model_name(provider: str, model: Optional[str]) -> str:
+    if provider == "openai":
+        return model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    if provider == "anthropic":
+        return model or os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-20241022")
+    if provider in {"gemini", "google"}:
+        configured_model = model or os.getenv("GEMINI_MODEL", "gemini-1.5-flash-002")
+        # Normalize older model aliases to current API names
+        if configured_model == "gemini-1.5-flash":
+            configured_model = "gemini-1.5-flash-002"
+        elif configured_model == "gemini-1.5-pro":
+            configured_model = "gemini-1.5-pro-002"
+        return configured_model
+    return model or ""
+
+
+def _build_chat_model(provider: str, model_name: str, temperature: float, cached: bool) -> Optional[BaseChatModel]:
+    """Construct a provider client, or return None when the provider is not configured."""
+    llm = _build_provider_model(provider, model_name, temperature)
+    if llm is not None and cached:
+        response_cache = get_response_cache()
+        if response_cache is not None:
+            llm.cache = response_cache
+    return llm
+
+
+def _build_provider_model(provider: str, model_name: str, temperature: float) -> Optional[BaseChatModel]:
+    if provider == "openai":
+        if os.getenv("OPENAI_API_KEY"):
+            http_client, http_async_client = _openai_http_clients()
+            return ChatOpenAI(
+                model=model_name,
+                temperature=temperature,
+                http_client=http_client,
+                http_async_client=http_async_client,
+            )
+        return None
+
+    if provider == "anthropic":
+        if os.getenv("ANTHROPIC_API_KEY") and ChatAnthropic:
+            return ChatAnthropic(
+                model_name=model_name,
+                temperature=temperature,
+                timeout=None,  # or a reasonable default like 60
+                stop=None
+            )
+        return None
+
+    if provider in {"gemini", "google"}:
+        if os.getenv("GOOGLE_API_KEY") and ChatGoogleGenerativeAI:
+            return ChatGoogleGenerativeAI(model=model_name, temperature=temperature)
+        return None
+
+    return None
+
+
+def get_chat_model(
+    provider: str | None = None,
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+    cache: bool = False,
+) -> BaseChatModel:
     """
     Load a chat model with the requested provider, falling back to a stub when keys are absent.
 
+    Clients are kept in a process-wide registry keyed by (provider, model, temperature),
+    so repeated calls reuse the same thread-safe instance and its warm connection pool.
+    Callers sending deterministic prompts can opt into the persistent response cache.
+
     Args:
         provider: Identifier for the provider ("openai", "anthropic", "gemini").
         model: Optional explicit model name.
+        temperature: Optional sampling temperature; defaults to ``LLM_TEMPERATURE``.
+        cache: Serve repeated prompts from the LLM response cache (see ``utils.llm_cache``).
 
     Returns:
         BaseChatModel instance ready for use.
     """
 
     resolved_provider = (provider or os.getenv("LLM_PROVIDER") or "openai").lower()
-    temperature = float(os.getenv("LLM_TEMPERATURE", "0.3"))
-
-    if resolved_provider == "openai":
-        api_key = os.getenv("OPENAI_API_KEY")
-        if api_key:
-            return ChatOpenAI(model=model or os.getenv("OPENAI_MODEL", "gpt-4o-mini"), temperature=temperature)
-        return StubChatModel()
-
-    if resolved_provider == "anthropic":
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if api_key and ChatAnthropic:
-            return ChatAnthropic(
-                model_name=model or os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-20241022"),
-                temperature=temperature,
-                timeout=None,  # or a reasonable default like 60
-                stop=None
-            )
-        return StubChatModel()
-
-    if resolved_provider in {"gemini", "google"}:
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if api_key and ChatGoogleGenerativeAI:
-            configured_model = model or os.getenv("GEMINI_MODEL", "gemini-1.5-flash-002")
-            # Normalize older model aliases to current API names
-            if configured_model == "gemini-1.5-flash":
-                configured_model = "gemini-1.5-flash-002"
-            elif configured_model == "gemini-1.5-pro":
-                configured_model = "gemini-1.5-pro-002"
-            return ChatGoogleGenerativeAI(model=configured_model, temperature=temperature)
-        return StubChatModel()
-
-    return StubChatModel()
+    resolved_temperature = float(os.getenv("LLM_TEMPERATURE", "0.3")) if temperature is None else float(temperature)
+    key: ModelKey = (resolved_provider, _resolve_model_name(resolved_provider, model), resolved_temperature, cache)
+
+    with _registry_lock:
+        cached = _registry.get(key)
+        if cached is not None:
+            _registry_stats["hits"] += 1
+            return cached
+        _registry_stats["misses"] += 1
+
+        llm = _build_chat_model(*key)
+        if llm is None:
+            # Stubs are cheap and should not outlive a provider being configured later.
+            return StubChatModel()
+        logger.info("Model registry: created %s client for model '%s' (temperature=%s, cached=%s)", *key)
+        _registry[key] = llm
+        return llm
+
+
+def get_model_registry_stats() -> Dict[str, int]:
+    """Return hit/miss counts and the number of registered chat models."""
+    with _registry_lock:
+        return {**_registry_stats, "size": len(_registry)}
+
+
+def clear_model_registry() -> None:
+    """Drop all registered chat models (pooled HTTP clients are kept)."""
+    with _registry_lock:
+        _registry.clear()
+        _registry_stats.update(hits=0, misses=0)
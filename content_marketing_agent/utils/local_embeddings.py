@@ -0,0 +1,181 @@
+"""Offline sentence embeddings with an ONNX Runtime CPU model (quantized by default)."""
+
+from __future__ import annotations
+
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+try:
+    import onnxruntime as ort
+except Exception:  # pragma: no cover - optional dependency
+    ort = None  # type: ignore
+
+try:
+    from tokenizers import Tokenizer
+except Exception:  # pragma: no cover - optional dependency
+    Tokenizer = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCAL_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+# int8 export shipped in the model repo; runs on any x86-64 CPU with AVX2
+DEFAULT_ONNX_FILE = "onnx/model_quint8_avx2.onnx"
+_ONNX_CANDIDATES = ("model_quantized.onnx", "onnx/model_quantized.onnx", "model.onnx", "onnx/model.onnx")
+
+
+def _resolve_model_dir(model: str, onnx_file: str) -> Path:
+    """A local directory as-is, otherwise a Hugging Face repo fetched once into the hub cache."""
+    path = Path(model).expanduser()
+    if path.is_dir():
+        return path
+    from huggingface_hub import snapshot_download
+
+    logger.info("Fetching local embedding model %s (%s) into the Hugging Face cache", model, onnx_file)
+    return Path(snapshot_download(model, allow_patterns=["*.json", onnx_file]))
+
+
+def _find_onnx_file(model_dir: Path, onnx_file: str, quantize: bool) -> Path:
+    configured = model_dir / onnx_file
+    if configured.exists():
+        return configured
+    for name in _ONNX_CANDIDATES:
+        candidate = model_dir / name
+        if not candidate.exists():
+            continue
+        if quantize and "quantized" not in name:
+            return _quantize_model(candidate)
+        return candidate
+    raise FileNotFoundError(f"No ONNX model found in {model_dir} (looked for {onnx_file})")
+
+
+def _quantize_model(source: Path) -> Path:
+    """Write a dynamically int8-quantized copy next to ``source`` once; fall back to ``source``."""
+    target = source.with_name("model_quantized.onnx")
+    if target.exists():
+        return target
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(str(source), str(target), weight_type=QuantType.QInt8)
+        logger.info("Quantized %s to %s", source, target)
+        return target
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Could not quantize %s (%s); using the float model.", source, exc)
+        return source
+
+
+class LocalOnnxEmbeddings(Embeddings):
+    """
+    Sentence embeddings from an ONNX transformer encoder run on CPU.
+
+    Texts are sorted by length and encoded in batches of ``batch_size`` padded only to
+    the longest text in each batch, so short texts do not pay for long ones. Token states
+    are mean-pooled (or the CLS state is taken) and L2-normalized. ``threads`` sets ONNX
+    Runtime's intra-op pool; one session is shared by all callers.
+    """
+
+    def __init__(
+        self,
+        model_dir: Path,
+        onnx_file: str = DEFAULT_ONNX_FILE,
+        batch_size: int = 32,
+        max_length: int = 256,
+        threads: Optional[int] = None,
+        pooling: str = "mean",
+        quantize: bool = True,
+    ) -> None:
+        if ort is None or Tokenizer is None:
+            raise RuntimeError("Local embeddings need onnxruntime and tokenizers: pip install onnxruntime tokenizers")
+        self.model_dir = model_dir
+        self.batch_size = max(1, batch_size)
+        self.pooling = pooling
+        self.model_path = _find_onnx_file(model_dir, onnx_file, quantize)
+
+        self._tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self._tokenizer.enable_truncation(max_length=max_length)
+        if self._tokenizer.padding is None:
+            pad_token = "[PAD]" if self._tokenizer.token_to_id("[PAD]") is not None else "<pad>"
+            self._tokenizer.enable_padding(pad_id=self._tokenizer.token_to_id(pad_token) or 0, pad_token=pad_token)
+        else:
+            padding = dict(self._tokenizer.padding)
+            padding.pop("length", None)  # pad to the longest text in each batch, not a fixed length
+            self._tokenizer.enable_padding(**padding)
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads or os.cpu_count() or 1
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._session = ort.InferenceSession(str(self.model_path), options, providers=["CPUExecutionProvider"])
+        self._input_names = {item.name for item in self._session.get_inputs()}
+        self._output_names = [item.name for item in self._session.get_outputs()]
+        logger.info(
+            "Loaded local embedding model %s (threads=%s, batch=%s)",
+            self.model_path,
+            options.intra_op_num_threads,
+            self.batch_size,
+        )
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self._tokenizer.encode_batch(texts)
+        feeds: Dict[str, Any] = {
+            "input_ids": np.asarray([enc.ids for enc in encodings], dtype=np.int64),
+            "attention_mask": np.asarray([enc.attention_mask for enc in encodings], dtype=np.int64),
+        }
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.asarray([enc.type_ids for enc in encodings], dtype=np.int64)
+        feeds = {name: value for name, value in feeds.items() if name in self._input_names}
+
+        if "sentence_embedding" in self._output_names:
+            pooled = self._session.run(["sentence_embedding"], feeds)[0]
+        else:
+            states = self._session.run([self._output_names[0]], feeds)[0]
+            if self.pooling == "cls":
+                pooled = states[:, 0]
+            else:
+                mask = feeds["attention_mask"][..., None].astype(np.float32)
+                pooled = (states * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return pooled / np.clip(norms, 1e-12, None)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        order = sorted(range(len(texts)), key=lambda idx: len(texts[idx]))
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start : start + self.batch_size]
+            for idx, vector in zip(batch, self._encode_batch([texts[idx] or " " for idx in batch])):
+                vectors[idx] = vector.astype(np.float32).tolist()
+        return vectors  # type: ignore[return-value]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+@lru_cache(maxsize=1)
+def get_local_embeddings() -> LocalOnnxEmbeddings:
+    """
+    Return the process-wide local embedding model configured by ``LOCAL_EMBEDDING_*``.
+
+    ``LOCAL_EMBEDDING_MODEL`` is a directory holding ``tokenizer.json`` and an ONNX export,
+    or a Hugging Face repo id downloaded on first use (set ``HF_HUB_OFFLINE=1`` to only
+    use the local cache).
+    """
+    model = os.getenv("LOCAL_EMBEDDING_MODEL", DEFAULT_LOCAL_MODEL)
+    onnx_file = os.getenv("LOCAL_EMBEDDING_ONNX_FILE", DEFAULT_ONNX_FILE)
+    threads = int(os.getenv("LOCAL_EMBEDDING_THREADS", "0")) or None
+    return LocalOnnxEmbeddings(
+        model_dir=_resolve_model_dir(model, onnx_file),
+        onnx_file=onnx_file,
+        batch_size=int(os.getenv("LOCAL_EMBEDDING_BATCH_SIZE", "32")),
+        max_length=int(os.getenv("LOCAL_EMBEDDING_MAX_LENGTH", "256")),
+        threads=threads,
+        pooling=os.getenv("LOCAL_EMBEDDING_POOLING", "mean").lower(),
+        quantize=os.getenv("LOCAL_EMBEDDING_QUANTIZE", "1") == "1",
+    )
@@ -0,0 +1,60 @@
+"""Optional local cross-encoder reranking for retrieved context."""
+
+from __future__ import annotations
+
+import logging
+import os
+from functools import lru_cache
+from typing import List, Optional
+
+from langchain_core.documents import Document
+
+try:
+    from sentence_transformers import CrossEncoder
+except Exception:  # pragma: no cover - optional dependency
+    CrossEncoder = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_reranker() -> Optional["CrossEncoder"]:
+    """
+    Return the cross-encoder named by ``RERANK_MODEL``, or None when reranking is disabled.
+
+    Small models such as ``cross-encoder/ms-marco-MiniLM-L-6-v2`` score a few dozen
+    chunks in tens of milliseconds on CPU.
+    """
+    model_name = os.getenv("RERANK_MODEL", "").strip()
+    if not model_name or model_name.lower() == "off":
+        return None
+    if CrossEncoder is None:
+        logger.warning("RERANK_MODEL=%s set but sentence-transformers is not installed; reranking disabled.", model_name)
+        return None
+    try:
+        logger.info("Loading reranker model: %s", model_name)
+        return CrossEncoder(model_name, device=os.getenv("RERANK_DEVICE", "cpu"))
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Reranker %s unavailable: %s", model_name, exc)
+        return None
+
+
+def rerank_documents(query: str, documents: List[Document], top_n: Optional[int] = None) -> List[Document]:
+    """
+    Reorder the first ``top_n`` documents by cross-encoder relevance to ``query``.
+
+    Documents beyond ``top_n`` keep their order after the reranked head; without a
+    reranker the input order is returned unchanged.
+    """
+    reranker = get_reranker()
+    if reranker is None or len(documents) < 2:
+        return documents
+    top_n = top_n or int(os.getenv("RERANK_TOP_N", "16"))
+    head, tail = documents[:top_n], documents[top_n:]
+    try:
+        scores = reranker.predict([(query, doc.page_content) for doc in head])
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Reranking failed; keeping fused order: %s", exc)
+        return documents
+    order = sorted(range(len(head)), key=lambda idx: float(scores[idx]), reverse=True)
+    return [head[idx] for idx in order] + tail
@@ -0,0 +1,52 @@
+"""Split research markdown into sized, overlapping chunks for vector indexing."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Any, Dict, Iterable, List
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+# Prefer markdown section boundaries, then paragraphs, lines and sentences
+_MARKDOWN_SEPARATORS = ["\n### ", "\n## ", "\n\n", "\n", ". ", " ", ""]
+
+
+def _splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=_MARKDOWN_SEPARATORS,
+        keep_separator="start",
+        strip_whitespace=True,
+    )
+
+
+def format_references(references: Iterable[Dict[str, Any]]) -> str:
+    """Render structured references as markdown lines for indexing."""
+    lines = []
+    for ref in references or []:
+        if not isinstance(ref, dict):
+            continue
+        parts = [ref.get("title") or "Reference", ref.get("url") or "", ref.get("snippet") or ""]
+        lines.append("- " + " - ".join(part for part in parts if part))
+    return "\n".join(lines)
+
+
+def chunk_text(text: str, chunk_size: int | None = None, chunk_overlap: int | None = None) -> List[str]:
+    """
+    Split text into overlapping chunks sized for embedding.
+
+    Defaults come from ``VECTOR_CHUNK_SIZE`` and ``VECTOR_CHUNK_OVERLAP`` (characters).
+    """
+    text = (text or "").strip()
+    if not text:
+        return []
+    size = chunk_size or int(os.getenv("VECTOR_CHUNK_SIZE", "1000"))
+    overlap = chunk_overlap if chunk_overlap is not None else int(os.getenv("VECTOR_CHUNK_OVERLAP", "150"))
+    return [chunk for chunk in _splitter(size, min(overlap, size // 2)).split_text(text) if chunk.strip()]
+
+
+def chunk_hash(text: str) -> str:
+    """Short content hash used to detect changed chunks between saves."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,33 @@
+"""Tests for committing a research turn."""
+
+from __future__ import annotations
+
+import pytest
+
+from content_marketing_agent.services import chat_service
+
+
+def test_commit_research_turn_keeps_summary_and_raises_save_error(monkeypatch):
+    updates = []
+    messages = []
+
+    def failing_save(*args):
+        raise RuntimeError("save failed")
+
+    def failing_title(summary):
+        raise ValueError("title failed")
+
+    monkeypatch.setattr(chat_service, "_save_and_index", failing_save)
+    monkeypatch.setattr(chat_service.message_repository, "add_message", lambda *args: messages.append(args))
+    monkeypatch.setattr(chat_service.chat_repository, "get_chat", lambda chat_id: {"id": chat_id, "title": ""})
+    monkeypatch.setattr(
+        chat_service.chat_repository, "update_chat_fields", lambda chat_id, fields: updates.append((chat_id, fields))
+    )
+
+    with pytest.raises(RuntimeError, match="save failed"):
+        chat_service.commit_research_turn(
+            "project", "chat", "# Research", {"summary": "Key findings."}, "Done.", failing_title
+        )
+
+    assert updates == [("chat", {"summary": "Key findings."})]
+    assert messages == [("project", "chat", "assistant", "Done.")]